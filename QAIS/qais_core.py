@@ -4,12 +4,21 @@ Extracted from qais_mcp_server.py. No MCP deps, no tool_auth.
 """
 
 import numpy as np
+import atexit
+import functools
 import hashlib
 import os
 import re
+import threading
+from qais_field_format import field_file, open_field, write_field
 
 N = 4096
 
+# Write-behind: a dirty field is saved once this many changes are pending,
+# this many seconds after the first unsaved change, or at interpreter exit.
+WRITE_BEHIND_MAX_PENDING = 64
+WRITE_BEHIND_INTERVAL = 1.0
+
 STOPWORDS = {'the', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been', 'being', 'have', 'has',
     'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may', 'might', 'must',
     'shall', 'can', 'need', 'to', 'of', 'in', 'for', 'on', 'with', 'at', 'by', 'from', 'as',
@@ -41,45 +50,129 @@ def bind(a, b):
 def resonance(query, field):
     return float(np.dot(query, field) / N)
 
+# resonate() candidates, packed (bit set = +1) and kept across calls —
+# panel callers re-test the same candidate lists.
+SEED_BITS_CACHE_ENTRIES = 8192
+
+@functools.lru_cache(maxsize=SEED_BITS_CACHE_ENTRIES)
+def seed_bits(seed):
+    return np.packbits(seed_to_vector(seed) > 0)
+
 
 class QAISField:
-    def __init__(self, field_path=None):
+    def __init__(self, field_path=None, write_behind=False):
         if field_path is None:
             bond_root = os.environ.get('BOND_ROOT',
                 os.path.join(os.path.dirname(__file__), '..'))
             data_dir = os.path.join(bond_root, 'data')
             os.makedirs(data_dir, exist_ok=True)
-            field_path = os.path.join(data_dir, 'qais_field.npz')
-        self.field_path = field_path
+            field_path = os.path.join(data_dir, 'qais_field.qfield')
+        self.field_path = field_file(field_path)
         self.identity_field = np.zeros(N, dtype=np.float32)
         self.role_fields = {}
         self.stored = set()
         self.count = 0
-        if os.path.exists(self.field_path):
-            self._load()
+        # identity -> role -> facts, mirrors self.stored for get()/stats()
+        self.identity_role_facts = {}
+        # Persisted fact -> packed vector rows (written by the MCP server / daemon).
+        # No text vectorizer here, so rows are carried through saves, not built.
+        self.fact_rows = {}
+        # Saves: every change by default; write_behind=True coalesces them
+        self.write_behind = write_behind
+        self._lock = threading.RLock()
+        self._pending = 0
+        self._timer = None
+        self._load()
+        if write_behind:
+            atexit.register(self.flush)
 
     def _load(self):
         try:
-            data = np.load(self.field_path, allow_pickle=True)
-            self.identity_field = data['identity_field']
-            self.role_fields = data['role_fields'].item()
-            self.stored = set(data['stored'].tolist())
-            self.count = int(data['count'])
+            data = open_field(self.field_path)  # migrates a legacy .npz on first open
+            if data is None:
+                return
+            self.identity_field = np.array(data['identity_field'])
+            self.role_fields = {role: np.array(vec) for role, vec in data['role_fields'].items()}
+            self.stored = set(data['stored'])
+            self.count = data['count']
+            self.fact_rows = dict(zip(data['fact_keys'], np.array(data['fact_bits'])))
+            for key in self.stored:
+                self._index_add(key)
         except: pass
 
+    def _index_add(self, key):
+        parts = key.split('|', 2)
+        if len(parts) == 3:
+            identity, role, fact = parts
+            self.identity_role_facts.setdefault(identity, {}).setdefault(role, set()).add(fact)
+
+    def _index_discard(self, key):
+        parts = key.split('|', 2)
+        if len(parts) == 3:
+            identity, role, fact = parts
+            roles = self.identity_role_facts.get(identity)
+            if roles and role in roles:
+                roles[role].discard(fact)
+                if not roles[role]:
+                    del roles[role]
+                if not roles:
+                    del self.identity_role_facts[identity]
+
     def save(self, path=None):
         path = path or self.field_path
         try:
-            np.savez(path, identity_field=self.identity_field,
-                     role_fields=self.role_fields,
-                     stored=np.array(list(self.stored)), count=self.count)
+            live = {k.split('|', 2)[2] for k in self.stored if k.count('|') >= 2}
+            facts = [f for f in self.fact_rows if f in live]
+            bits = (np.stack([self.fact_rows[f] for f in facts]) if facts
+                    else np.zeros((0, N // 8), dtype=np.uint8))
+            write_field(path, self.identity_field, self.role_fields, self.stored, self.count,
+                        facts, bits)
         except: pass
 
+    def _changed(self, n=1):
+        """Record n unsaved changes; save now unless write-behind defers it."""
+        self._pending += n
+        if not self.write_behind or self._pending >= WRITE_BEHIND_MAX_PENDING:
+            self.flush()
+        elif self._timer is None:
+            self._timer = threading.Timer(WRITE_BEHIND_INTERVAL, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self):
+        """Save pending changes now. Returns False if there was nothing to save."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._pending:
+                return False
+            self._pending = 0
+            self.save()
+            return True
+
     def store(self, identity, role, fact):
+        with self._lock:
+            result = self._store(identity, role, fact)
+            if result["status"] == "stored":
+                self._changed()
+            return result
+
+    def store_many(self, bindings):
+        """Store (identity, role, fact) triples with a single save."""
+        with self._lock:
+            results = [self._store(identity, role, fact) for identity, role, fact in bindings]
+            stored = sum(1 for r in results if r["status"] == "stored")
+            if stored:
+                self._changed(stored)
+            return results
+
+    def _store(self, identity, role, fact):
         key = f"{identity}|{role}|{fact}"
         if key in self.stored:
             return {"status": "exists", "key": key}
         self.stored.add(key)
+        self._index_add(key)
         id_vec = seed_to_vector(identity)
         fact_vec = seed_to_vector(fact)
         self.identity_field += id_vec
@@ -87,21 +180,27 @@ class QAISField:
             self.role_fields[role] = np.zeros(N, dtype=np.float32)
         self.role_fields[role] += bind(id_vec, fact_vec)
         self.count += 1
-        self.save()
         return {"status": "stored", "key": key, "count": self.count}
 
-    def resonate(self, identity, role, candidates):
+    def resonate(self, identity, role, candidates, top_k=None):
         if role not in self.role_fields:
+            # Every score ties at 0; the stable order keeps the first top_k
+            if top_k:
+                candidates = candidates[:top_k]
             return [{"fact": c, "score": 0.0, "confidence": "NONE"} for c in candidates]
+        if not candidates:
+            return []
         id_vec = seed_to_vector(identity)
         residual = bind(self.role_fields[role], id_vec)
-        results = []
-        for fact in candidates:
-            fact_vec = seed_to_vector(fact)
-            score = resonance(fact_vec, residual)
-            results.append({"fact": fact, "score": round(score, 4)})
-        results = sorted(results, key=lambda x: -x["score"])
-        return results
+        # One product over the candidate block (bit rows b are the +-1 rows 2b-1)
+        block = np.unpackbits(np.stack([seed_bits(c) for c in candidates]), axis=1)
+        scores = (2 * (block @ residual) - residual.sum()) / N
+        if top_k and top_k < len(candidates):
+            pick = np.argpartition(-scores, top_k - 1)[:top_k]
+            order = pick[np.lexsort((pick, -scores[pick]))]
+        else:
+            order = np.argsort(-scores, kind='stable')
+        return [{"fact": candidates[i], "score": round(float(scores[i]), 4)} for i in order]
 
     def exists(self, identity):
         vec = seed_to_vector(identity)
@@ -110,34 +209,42 @@ class QAISField:
         return {"identity": identity, "score": round(score, 4), "exists": score > 0.025}
 
     def stats(self):
-        identities = set()
-        roles = set()
-        for key in self.stored:
-            parts = key.split('|', 2)
-            if len(parts) == 3:
-                identities.add(parts[0])
-                roles.add(parts[1])
-        return {"total_bindings": self.count, "total_identities": len(identities),
+        roles = {role for by_role in self.identity_role_facts.values() for role in by_role}
+        return {"total_bindings": self.count, "total_identities": len(self.identity_role_facts),
                 "total_roles": len(roles), "roles_list": sorted(roles)}
 
     def get(self, identity, role):
-        prefix = f"{identity}|{role}|"
-        matches = [k for k in self.stored if k.startswith(prefix)]
-        facts = [k.split('|', 2)[2] for k in matches if len(k.split('|', 2)) > 2]
+        facts = list(self.identity_role_facts.get(identity, {}).get(role, ()))
         return {"identity": identity, "role": role, "facts": facts, "count": len(facts)}
 
     def remove(self, identity, role, fact):
         """Remove a binding by subtracting its vectors from the field.
         Deterministic vectors allow exact reversal of store()."""
+        with self._lock:
+            result = self._remove(identity, role, fact)
+            if result["status"] == "removed":
+                self._changed()
+            return result
+
+    def remove_many(self, bindings):
+        """Remove (identity, role, fact) triples with a single save."""
+        with self._lock:
+            results = [self._remove(identity, role, fact) for identity, role, fact in bindings]
+            removed = sum(1 for r in results if r["status"] == "removed")
+            if removed:
+                self._changed(removed)
+            return results
+
+    def _remove(self, identity, role, fact):
         key = f"{identity}|{role}|{fact}"
         if key not in self.stored:
             return {"status": "not_found", "key": key}
         self.stored.discard(key)
+        self._index_discard(key)
         id_vec = seed_to_vector(identity)
         fact_vec = seed_to_vector(fact)
         self.identity_field -= id_vec
         if role in self.role_fields:
             self.role_fields[role] -= bind(id_vec, fact_vec)
         self.count -= 1
-        self.save()
         return {"status": "removed", "key": key, "count": self.count}
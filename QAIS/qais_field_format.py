@@ -0,0 +1,204 @@
+"""
+QAIS Field Format v1 — versioned, pickle-free on-disk layout for QAISField.
+
+Replaces np.savez fields (pickled role_fields dict + object array of keys,
+loadable only with allow_pickle=True). Every section is fixed-width or
+offset-addressed, so readers can np.memmap the file and touch only what
+they need.
+
+Layout (little-endian, sections 64-byte aligned):
+  header   64 B   magic b'QFLD', version, N, count, n_roles, n_keys, n_facts,
+                  offsets of the role matrix, string table and fact bits
+  matrix   float32 (1 + n_roles) x N — row 0 is identity_field, then one
+           row per role in role-table order
+  strings  uint64 offsets (n_strings + 1), then a UTF-8 blob. Strings are
+           the role table, then the stored keys, then the fact keys
+  bits     uint8 n_facts x N/8 — packed fact vectors (may be empty)
+
+Legacy .npz fields are migrated on first open (the .npz is kept as
+.npz.migrated), or all at once:
+    python qais_field_format.py --migrate [BOND_ROOT]
+"""
+
+import os
+import struct
+import sys
+
+import numpy as np
+
+MAGIC = b'QFLD'
+VERSION = 1
+FIELD_EXT = '.qfield'
+LEGACY_EXT = '.npz'
+MIGRATED_EXT = '.npz.migrated'
+HEADER = struct.Struct('<4sIIIqIIIIQQQ')  # 64 bytes
+ALIGN = 64
+
+
+def field_file(path):
+    """Normalize a field path to .qfield (callers and env vars may still name the .npz)."""
+    base, ext = os.path.splitext(path)
+    return base + FIELD_EXT if ext == LEGACY_EXT else path
+
+
+def legacy_path(path):
+    """The .npz a .qfield path migrates from."""
+    return os.path.splitext(path)[0] + LEGACY_EXT
+
+
+def field_exists(path):
+    return os.path.exists(path) or os.path.exists(legacy_path(path))
+
+
+def _aligned(offset):
+    return (offset + ALIGN - 1) // ALIGN * ALIGN
+
+
+def write_field(path, identity_field, role_fields, stored, count, fact_keys=(), fact_bits=None):
+    """Write a field atomically (temp file + os.replace)."""
+    n = len(identity_field)
+    roles = list(role_fields)
+    keys = list(stored)
+    fact_keys = list(fact_keys)
+    if fact_bits is None or not fact_keys:
+        fact_bits = np.zeros((0, n // 8), dtype=np.uint8)
+    strings = [s.encode('utf-8') for s in roles + keys + fact_keys]
+    offsets = np.zeros(len(strings) + 1, dtype='<u8')
+    if strings:
+        offsets[1:] = np.cumsum([len(b) for b in strings])
+
+    matrix_off = _aligned(HEADER.size)
+    strings_off = _aligned(matrix_off + (1 + len(roles)) * n * 4)
+    bits_off = _aligned(strings_off + offsets.nbytes + int(offsets[-1]))
+    header = HEADER.pack(MAGIC, VERSION, n, 0, int(count), len(roles), len(keys), len(fact_keys), 0,
+                         matrix_off, strings_off, bits_off)
+
+    tmp = f"{path}.tmp"
+    with open(tmp, 'wb') as f:
+        f.write(header)
+        f.seek(matrix_off)
+        f.write(np.asarray(identity_field, dtype='<f4').tobytes())
+        for role in roles:
+            f.write(np.asarray(role_fields[role], dtype='<f4').tobytes())
+        f.seek(strings_off)
+        f.write(offsets.tobytes())
+        f.write(b''.join(strings))
+        f.seek(bits_off)
+        f.write(np.ascontiguousarray(fact_bits, dtype=np.uint8).tobytes())
+    os.replace(tmp, path)
+
+
+def read_field(path):
+    """Field sections from a .qfield file.
+
+    Arrays are read-only views onto an np.memmap of the file — copy anything
+    you mean to mutate or keep (an open mapping pins the file on Windows).
+    Returns {identity_field, role_fields, stored, count, fact_keys, fact_bits}.
+    """
+    buf = np.memmap(path, dtype=np.uint8, mode='r')
+    if len(buf) < HEADER.size:
+        raise ValueError(f"{path}: truncated header")
+    (magic, version, n, _, count, n_roles, n_keys, n_facts, _,
+     matrix_off, strings_off, bits_off) = HEADER.unpack(bytes(buf[:HEADER.size]))
+    if magic != MAGIC:
+        raise ValueError(f"{path}: not a QAIS field")
+    if version != VERSION:
+        raise ValueError(f"{path}: unsupported field version {version}")
+
+    matrix = buf[matrix_off:matrix_off + (1 + n_roles) * n * 4].view('<f4').reshape(1 + n_roles, n)
+    n_strings = n_roles + n_keys + n_facts
+    offsets = buf[strings_off:strings_off + (n_strings + 1) * 8].view('<u8')
+    blob_off = strings_off + (n_strings + 1) * 8
+    blob = bytes(buf[blob_off:blob_off + int(offsets[-1])])
+    bounds = offsets.tolist()
+    strings = [blob[bounds[i]:bounds[i + 1]].decode('utf-8') for i in range(n_strings)]
+    roles = strings[:n_roles]
+    return {
+        'identity_field': matrix[0],
+        'role_fields': {role: matrix[1 + i] for i, role in enumerate(roles)},
+        'stored': strings[n_roles:n_roles + n_keys],
+        'count': count,
+        'fact_keys': strings[n_roles + n_keys:],
+        'fact_bits': buf[bits_off:bits_off + n_facts * (n // 8)].reshape(n_facts, n // 8),
+    }
+
+
+def read_legacy(npz_path):
+    """Same dict as read_field() from an old np.savez field (needs allow_pickle)."""
+    data = np.load(npz_path, allow_pickle=True)
+    n = data['identity_field'].shape[0]
+    fact_keys, fact_bits = [], np.zeros((0, n // 8), dtype=np.uint8)
+    if 'fact_keys' in data and 'fact_bits' in data:
+        keys, bits = data['fact_keys'].tolist(), data['fact_bits']
+        if bits.shape == (len(keys), n // 8):
+            fact_keys, fact_bits = keys, bits
+    return {
+        'identity_field': data['identity_field'],
+        'role_fields': dict(data['role_fields'].item()) if 'role_fields' in data else {},
+        'stored': data['stored'].tolist() if 'stored' in data else [],
+        'count': int(data['count']) if 'count' in data else 0,
+        'fact_keys': fact_keys,
+        'fact_bits': fact_bits,
+    }
+
+
+def is_legacy_field(npz_path):
+    """True for np.savez QAIS fields (not other .npz data such as ISS projections)."""
+    try:
+        with np.load(npz_path, allow_pickle=False) as data:
+            return 'identity_field' in data.files and 'stored' in data.files
+    except Exception:
+        return False
+
+
+def migrate(npz_path):
+    """Convert a legacy .npz field to .qfield; the .npz is kept as .npz.migrated."""
+    target = os.path.splitext(npz_path)[0] + FIELD_EXT
+    data = read_legacy(npz_path)
+    write_field(target, data['identity_field'], data['role_fields'], data['stored'],
+                data['count'], data['fact_keys'], data['fact_bits'])
+    os.replace(npz_path, os.path.splitext(npz_path)[0] + MIGRATED_EXT)
+    return target
+
+
+def open_field(path, migrate_legacy=True):
+    """read_field(path), falling back to (and by default migrating) its legacy .npz.
+
+    Returns None when neither file exists.
+    """
+    if os.path.exists(path):
+        return read_field(path)
+    old = legacy_path(path)
+    if not os.path.exists(old):
+        return None
+    if migrate_legacy:
+        return read_field(migrate(old))
+    return read_legacy(old)
+
+
+def migrate_tree(bond_root):
+    """Migrate every legacy field in data/ and data/perspectives/."""
+    done = []
+    for sub in ('data', os.path.join('data', 'perspectives')):
+        folder = os.path.join(bond_root, sub)
+        if not os.path.isdir(folder):
+            continue
+        for name in sorted(os.listdir(folder)):
+            path = os.path.join(folder, name)
+            if not name.endswith(LEGACY_EXT) or not is_legacy_field(path):
+                continue
+            if os.path.exists(os.path.splitext(path)[0] + FIELD_EXT):
+                continue  # already migrated — a later write owns the field
+            done.append(migrate(path))
+    return done
+
+
+if __name__ == '__main__':
+    if '--migrate' not in sys.argv:
+        print('Usage: python qais_field_format.py --migrate [BOND_ROOT]')
+        sys.exit(1)
+    mi = sys.argv.index('--migrate')
+    root = sys.argv[mi + 1] if mi + 1 < len(sys.argv) else os.environ.get(
+        'BOND_ROOT', os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+    for target in migrate_tree(root):
+        print(f"migrated → {target}")
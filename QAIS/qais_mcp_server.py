@@ -18,19 +18,23 @@ Tools:
   - heatmap_touch/hot/chunk/clear: Session heat map
   - bond_gate: Conditional routing gate
   - crystal: Persistent crystallization
-  - perspective_store: Store seed into perspective's isolated field
+  - perspective_store: Store seed(s) into perspective's isolated field
   - perspective_check: Check text against perspective's seeds
 """
 
 import json
+import atexit
 import hashlib
 import sys
 import os
 import re
 import time
-from collections import defaultdict
+import struct
+import threading
+from collections import defaultdict, OrderedDict
 from datetime import datetime
 from BOND_gate import get_gate
+from qais_field_format import field_file, open_field, write_field
 from tool_auth import validate_tool_call, get_active_entity
 
 try:
@@ -51,6 +55,22 @@ def bind(a, b):
 def resonance(query, field):
     return float(np.dot(query, field) / N)
 
+# Packed bipolar vectors: 4096 components -> 512 bytes (bit set = +1).
+# For +-1 vectors a.b = N - 2*popcount(a XOR b).
+POPCOUNT8 = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+def pack(vec):
+    return np.packbits(vec > 0)
+
+def popcount(bits):
+    if hasattr(np, 'bitwise_count'):  # NumPy 2.0+
+        return np.bitwise_count(np.ascontiguousarray(bits).view(np.uint64)).sum(axis=-1, dtype=np.int64)
+    return POPCOUNT8[bits].sum(axis=-1, dtype=np.int64)
+
+def packed_resonance(rows, bits):
+    """resonance() of each packed row against one packed vector."""
+    return (N - 2 * popcount(np.bitwise_xor(rows, bits))) / N
+
 
 # ═════════════════════════════════════════════════════
 # Session Heat Map
@@ -200,25 +220,19 @@ class Crystal:
         momentum = f"S{session_num} {completed_str}, {state[:50]}, next: {next_task[:50]}"
         result["momentum"] = momentum
         session_id = f"Session{session_num}"
-        store_result = self.field.store(session_id, "momentum", momentum)
-        if store_result["status"] == "stored":
-            result["stored"].append(f"{session_id}|momentum")
+        bindings = [(session_id, "momentum", momentum)]
         if context:
-            store_result = self.field.store(session_id, "context", context[:200])
-            if store_result["status"] == "stored":
-                result["stored"].append(f"{session_id}|context")
+            bindings.append((session_id, "context", context[:200]))
         for key in ['insight', 'key insight', 'key']:
             if key in sections:
-                insight = sections[key][:200]
-                store_result = self.field.store(session_id, "insight", insight)
-                if store_result["status"] == "stored":
-                    result["stored"].append(f"{session_id}|insight")
+                bindings.append((session_id, "insight", sections[key][:200]))
                 break
         if concepts:
-            tags = ", ".join(concepts[:5])
-            store_result = self.field.store(session_id, "tags", tags)
+            bindings.append((session_id, "tags", ", ".join(concepts[:5])))
+        # One field write for the whole crystal
+        for (_, role, _), store_result in zip(bindings, self.field.store_many(bindings)):
             if store_result["status"] == "stored":
-                result["stored"].append(f"{session_id}|tags")
+                result["stored"].append(f"{session_id}|{role}")
         return result
 
 CRYSTAL = None
@@ -267,71 +281,300 @@ def text_to_keywords_v5(text):
         keywords.append(bigram)
     return list(set(keywords))
 
-def text_to_vector_v5(text):
+KEYWORD_CACHE_ENTRIES = 32768
+VECTOR_STORE_SLOTS = 1 << 15
+VECTOR_STORE_PROBES = 8
+VECTOR_STORE_HEADER = 16
+
+class KeywordVectorCache:
+    """Keyword -> packed vector LRU, optionally backed by a memmap store.
+
+    Same file layout as the daemon's QaisVectorCache (header, uint64 keyword
+    hashes, packbits rows; linear probing, row written before its hash), in a
+    separate file. main() attaches data/qais_vectors/mcp.bin unless
+    QAIS_VECTOR_STORE=off; until then (e.g. when imported by tooling) it is
+    memory-only. Rows are shared — never mutate.
+    """
+
+    def __init__(self, max_entries=KEYWORD_CACHE_ENTRIES):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.keys = None
+        self.rows = None
+        self.slots = 0
+        self.hits = self.disk_hits = self.misses = 0
+        self._lock = threading.Lock()  # fact backfill runs on its own thread
+
+    def attach(self, path, slots=VECTOR_STORE_SLOTS):
+        rows_at = VECTOR_STORE_HEADER + slots * 8
+        size = rows_at + slots * (N // 8)
+        header = struct.pack('<4sIII', b'QVS1', N, slots, 0)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fresh = True
+            if os.path.exists(path) and os.path.getsize(path) == size:
+                with open(path, 'rb') as f:
+                    fresh = f.read(len(header)) != header
+            if fresh:
+                with open(path, 'wb') as f:
+                    f.write(header)
+                    f.truncate(size)
+            self.keys = np.memmap(path, dtype=np.uint64, mode='r+', offset=VECTOR_STORE_HEADER, shape=(slots,))
+            self.rows = np.memmap(path, dtype=np.uint8, mode='r+', offset=rows_at, shape=(slots, N // 8))
+            self.slots = slots
+        except (OSError, ValueError):
+            self.keys = self.rows = None
+        return self.keys is not None
+
+    def _probe(self, h):
+        for i in range(VECTOR_STORE_PROBES):
+            slot = (h + i) % self.slots
+            found = int(self.keys[slot])
+            if found == 0 or found == h:
+                return slot, found == h
+        return None, False
+
+    def bits(self, keyword):
+        with self._lock:
+            bits = self.entries.get(keyword)
+            if bits is not None:
+                self.entries.move_to_end(keyword)
+                self.hits += 1
+                return bits
+            slot, found = None, False
+            if self.keys is not None:
+                h = int.from_bytes(hashlib.blake2b(keyword.encode('utf-8'), digest_size=8).digest(), 'little') or 1
+                slot, found = self._probe(h)
+            if found:
+                bits = np.array(self.rows[slot])
+                self.disk_hits += 1
+            else:
+                bits = pack(seed_to_vector(keyword))
+                self.misses += 1
+                if slot is not None:
+                    self.rows[slot] = bits
+                    self.keys[slot] = h  # row first, then key
+            self.entries[keyword] = bits
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+            return bits
+
+KEYWORD_VECTORS = KeywordVectorCache()
+
+def text_to_bits(text):
+    """text_to_vector_v5(text), packed."""
     keywords = text_to_keywords_v5(text)
     if not keywords:
-        return seed_to_vector(text)
-    bundle = np.zeros(N, dtype=np.float32)
-    for kw in keywords:
-        bundle += seed_to_vector(kw)
-    result = np.sign(bundle)
-    result[result == 0] = 1
-    return result.astype(np.float32)
+        return pack(seed_to_vector(text))
+    ones = np.unpackbits(np.stack([KEYWORD_VECTORS.bits(kw) for kw in keywords]), axis=1).sum(axis=0, dtype=np.int32)
+    return np.packbits(2 * ones >= len(keywords))  # sign of the bundle, ties -> +1
+
+def text_to_vector_v5(text):
+    return np.unpackbits(text_to_bits(text)).astype(np.float32) * 2 - 1
+
+# Write-behind (global + crystal fields): save once this many changes are
+# pending, this many seconds after the first unsaved change, or at exit.
+WRITE_BEHIND_MAX_PENDING = 64
+WRITE_BEHIND_INTERVAL = 1.0
+FACT_MATRIX_MIN_ROWS = 64  # fact matrix capacity doubles from here
 
 class QAISField:
-    def __init__(self, field_path=None):
+    def __init__(self, field_path=None, write_behind=False):
         if field_path is None:
             # Default: data/ directory relative to BOND_ROOT
             bond_root = os.environ.get('BOND_ROOT',
                 os.path.join(os.path.dirname(__file__), '..'))
             data_dir = os.path.join(bond_root, 'data')
             os.makedirs(data_dir, exist_ok=True)
-            field_path = os.path.join(data_dir, 'qais_field.npz')
-        self.field_path = field_path
+            field_path = os.path.join(data_dir, 'qais_field.qfield')
+        self.field_path = field_file(field_path)
         self.identity_field = np.zeros(N, dtype=np.float32)
         self.role_fields = {}
         self.stored = set()
         self.count = 0
-        self.fact_to_identities = {}
-        self.fact_vectors = {}
+        # Fact registry: row i of the packed fact matrix is fact_keys[i], and
+        # row_identities[i] holds the identities bound to it.
+        self.fact_keys = []
+        self.fact_row = {}
+        self.row_identities = []
+        self._fact_matrix = np.zeros((FACT_MATRIX_MIN_ROWS, N // 8), dtype=np.uint8)
+        self._unbuilt = set()  # facts the field file had no vector for (built in the background)
         self.identity_to_facts = {}
-        if os.path.exists(self.field_path):
-            self._load()
+        self.identity_role_facts = {}  # identity -> role -> facts, for get()
+        self.write_behind = write_behind
+        self._lock = threading.RLock()
+        self._pending = 0
+        self._timer = None
+        self._load()
+        if write_behind:
+            atexit.register(self.flush)
 
     def _load(self):
         try:
-            data = np.load(self.field_path, allow_pickle=True)
-            self.identity_field = data['identity_field']
-            self.role_fields = data['role_fields'].item()
-            self.stored = set(data['stored'].tolist())
-            self.count = int(data['count'])
-            self._build_fact_registry()
+            data = open_field(self.field_path)  # migrates a legacy .npz on first open
+            if data is None:
+                return
+            self.identity_field = np.array(data['identity_field'])
+            self.role_fields = {role: np.array(vec) for role, vec in data['role_fields'].items()}
+            self.stored = set(data['stored'])
+            self.count = data['count']
+            self._build_fact_registry(data['fact_keys'], data['fact_bits'])
         except: pass
+        if self._unbuilt:
+            threading.Thread(target=self._backfill, daemon=True, name='qais-fact-backfill').start()
 
-    def _build_fact_registry(self):
-        self.fact_to_identities = {}
-        self.fact_vectors = {}
+    def _build_fact_registry(self, known_keys=(), known_bits=None):
+        """Index stored facts, taking vectors from the field file's matrix.
+
+        Facts the file has no row for (older fields) are left for _backfill(),
+        so startup cost doesn't grow with the field.
+        """
+        self.fact_keys = []
+        self.fact_row = {}
+        self.row_identities = []
         self.identity_to_facts = {}
+        self.identity_role_facts = {}
+        known = {fact: i for i, fact in enumerate(known_keys)}
+        source = []
         for key in self.stored:
             parts = key.split('|', 2)
             if len(parts) == 3:
                 identity, role, fact = parts
-                if fact not in self.fact_to_identities:
-                    self.fact_to_identities[fact] = set()
-                    self.fact_vectors[fact] = text_to_vector_v5(fact)
-                self.fact_to_identities[fact].add(identity)
+                self.identity_role_facts.setdefault(identity, {}).setdefault(role, set()).add(fact)
+                row = self.fact_row.get(fact)
+                if row is None:
+                    row = self.fact_row[fact] = len(self.fact_keys)
+                    self.fact_keys.append(fact)
+                    self.row_identities.append(set())
+                    source.append(known.get(fact, -1))
+                self.row_identities[row].add(identity)
                 if identity not in self.identity_to_facts:
                     self.identity_to_facts[identity] = set()
                 self.identity_to_facts[identity].add(fact)
+        source = np.array(source, dtype=np.int64)
+        have = source >= 0
+        self._fact_matrix = np.zeros((max(len(source), FACT_MATRIX_MIN_ROWS), N // 8), dtype=np.uint8)
+        if have.any():
+            self._fact_matrix[np.flatnonzero(have)] = known_bits[source[have]]
+        self._unbuilt = {self.fact_keys[row] for row in np.flatnonzero(~have).tolist()}
+
+    def _backfill(self):
+        """Vectorize facts the field file had no rows for, then save them once."""
+        with self._lock:
+            facts = list(self._unbuilt)
+        bits = [text_to_bits(fact) for fact in facts]  # unlocked: stores and queries carry on
+        with self._lock:
+            built = 0
+            for fact, row_bits in zip(facts, bits):
+                if fact in self._unbuilt:
+                    self._fact_matrix[self.fact_row[fact]] = row_bits
+                    self._unbuilt.discard(fact)
+                    built += 1
+            if built:
+                self._changed(built)
+
+    def fact_matrix(self):
+        """Packed fact vectors (row i = fact_keys[i]) and a mask of rows built so far.
+
+        Rows stay unbuilt only while _backfill() runs after loading an older field.
+        """
+        pending = set(self._unbuilt)  # before reading rows: a built row is written before it leaves the set
+        matrix = self._fact_matrix[:len(self.fact_keys)]
+        built = np.ones(len(matrix), dtype=bool)
+        for fact in pending:
+            row = self.fact_row.get(fact)
+            if row is not None and row < len(built):
+                built[row] = False
+        return matrix, built
+
+    def fact_vectors(self, facts):
+        """Packed rows for the given stored facts, building any the backfill hasn't reached."""
+        with self._lock:
+            for fact in facts:
+                if fact in self._unbuilt:
+                    self._fact_matrix[self.fact_row[fact]] = text_to_bits(fact)
+                    self._unbuilt.discard(fact)
+            return self._fact_matrix[[self.fact_row[fact] for fact in facts]]
+
+    def _add_fact(self, identity, fact):
+        row = self.fact_row.get(fact)
+        if row is None:
+            row = self.fact_row[fact] = len(self.fact_keys)
+            if row == len(self._fact_matrix):
+                self._fact_matrix = np.concatenate([self._fact_matrix, np.zeros_like(self._fact_matrix)])
+            self._fact_matrix[row] = text_to_bits(fact)
+            self.fact_keys.append(fact)
+            self.row_identities.append(set())
+        self.row_identities[row].add(identity)
+
+    def _drop_fact(self, identity, fact):
+        row = self.fact_row.get(fact)
+        if row is None:
+            return
+        self.row_identities[row].discard(identity)
+        if self.row_identities[row]:
+            return
+        # Move the last row into the hole so rows stay dense
+        last = len(self.fact_keys) - 1
+        self._unbuilt.discard(fact)
+        if row != last:
+            moved = self.fact_keys[last]
+            self.fact_keys[row] = moved
+            self.row_identities[row] = self.row_identities[last]
+            self._fact_matrix[row] = self._fact_matrix[last]
+            self.fact_row[moved] = row
+        self.fact_keys.pop()
+        self.row_identities.pop()
+        del self.fact_row[fact]
 
     def _save(self):
         try:
-            np.savez(self.field_path, identity_field=self.identity_field,
-                     role_fields=self.role_fields,
-                     stored=np.array(list(self.stored)), count=self.count)
+            count = len(self.fact_keys)
+            keep = np.array([fact not in self._unbuilt for fact in self.fact_keys], dtype=bool)
+            facts = [fact for fact, k in zip(self.fact_keys, keep) if k]  # unbuilt: the backfill saves them
+            bits = self._fact_matrix[:count][keep]
+            write_field(self.field_path, self.identity_field, self.role_fields, self.stored,
+                        self.count, facts, bits)
         except: pass
 
+    def _changed(self, n=1):
+        self._pending += n
+        if not self.write_behind or self._pending >= WRITE_BEHIND_MAX_PENDING:
+            self.flush()
+        elif self._timer is None:
+            self._timer = threading.Timer(WRITE_BEHIND_INTERVAL, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self):
+        """Save pending changes now. Returns False if there was nothing to save."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._pending:
+                return False
+            self._pending = 0
+            self._save()
+            return True
+
     def store(self, identity, role, fact):
+        with self._lock:
+            result = self._store(identity, role, fact)
+            if result["status"] == "stored":
+                self._changed()
+            return result
+
+    def store_many(self, bindings):
+        """Store (identity, role, fact) triples with a single save."""
+        with self._lock:
+            results = [self._store(identity, role, fact) for identity, role, fact in bindings]
+            stored = sum(1 for r in results if r["status"] == "stored")
+            if stored:
+                self._changed(stored)
+            return results
+
+    def _store(self, identity, role, fact):
         key = f"{identity}|{role}|{fact}"
         if key in self.stored:
             return {"status": "exists", "key": key}
@@ -343,27 +586,34 @@ class QAISField:
             self.role_fields[role] = np.zeros(N, dtype=np.float32)
         self.role_fields[role] += bind(id_vec, fact_vec)
         self.count += 1
-        if fact not in self.fact_to_identities:
-            self.fact_to_identities[fact] = set()
-            self.fact_vectors[fact] = text_to_vector_v5(fact)
-        self.fact_to_identities[fact].add(identity)
+        self._add_fact(identity, fact)
         if identity not in self.identity_to_facts:
             self.identity_to_facts[identity] = set()
         self.identity_to_facts[identity].add(fact)
-        self._save()
+        self.identity_role_facts.setdefault(identity, {}).setdefault(role, set()).add(fact)
         return {"status": "stored", "key": key, "count": self.count}
 
-    def resonate(self, identity, role, candidates):
+    def resonate(self, identity, role, candidates, top_k=None):
         if role not in self.role_fields:
+            # Every score ties at 0; the stable order keeps the first top_k
+            if top_k:
+                candidates = candidates[:top_k]
             return [{"fact": c, "score": 0.0, "confidence": "NONE"} for c in candidates]
+        if not candidates:
+            return []
         id_vec = seed_to_vector(identity)
         residual = bind(self.role_fields[role], id_vec)
-        results = []
-        for fact in candidates:
-            fact_vec = seed_to_vector(fact)
-            score = resonance(fact_vec, residual)
-            results.append({"fact": fact, "score": round(score, 4)})
-        results = sorted(results, key=lambda x: -x["score"])
+        # Candidate block from the keyword vector cache: bit rows b give +-1 rows 2b-1,
+        # so every resonance() is one product against the residual.
+        block = np.unpackbits(np.stack([KEYWORD_VECTORS.bits(c) for c in candidates]), axis=1)
+        scores = (2 * (block @ residual) - residual.sum()) / N
+        keep = max(top_k, 2) if top_k else len(candidates)  # runner-up sets the top label
+        if keep < len(candidates):
+            pick = np.argpartition(-scores, keep - 1)[:keep]
+            order = pick[np.lexsort((pick, -scores[pick]))]
+        else:
+            order = np.argsort(-scores, kind='stable')
+        results = [{"fact": candidates[i], "score": round(float(scores[i]), 4)} for i in order]
         for i, r in enumerate(results):
             if i == 0 and len(results) > 1:
                 gap = r["score"] - results[1]["score"]
@@ -373,7 +623,7 @@ class QAISField:
                 else: r["confidence"] = "NOISE"
             else:
                 r["confidence"] = "LOW" if r["score"] > 0.2 else "NOISE"
-        return results
+        return results[:top_k] if top_k else results
 
     def exists(self, identity):
         vec = seed_to_vector(identity)
@@ -383,22 +633,35 @@ class QAISField:
 
     def stats(self):
         return {"total_bindings": self.count, "roles": list(self.role_fields.keys()),
-                "role_count": len(self.role_fields), "facts_indexed": len(self.fact_vectors),
+                "role_count": len(self.role_fields), "facts_indexed": len(self.fact_keys),
                 "identities_indexed": len(self.identity_to_facts)}
 
     def get(self, identity, role):
         """Direct retrieval for three-block architecture."""
-        for key in self.stored:
-            parts = key.split('|', 2)
-            if len(parts) == 3:
-                stored_id, stored_role, fact = parts
-                if stored_id == identity and stored_role == role:
-                    return {"identity": identity, "role": role, "fact": fact, "found": True}
+        facts = self.identity_role_facts.get(identity, {}).get(role)
+        if facts:
+            return {"identity": identity, "role": role, "fact": next(iter(facts)), "found": True}
         return {"identity": identity, "role": role, "fact": None, "found": False}
 
     def remove(self, identity, role, fact):
         """Remove a binding by subtracting its vectors from the field.
         Deterministic vectors allow exact reversal of store()."""
+        with self._lock:
+            result = self._remove(identity, role, fact)
+            if result["status"] == "removed":
+                self._changed()
+            return result
+
+    def remove_many(self, bindings):
+        """Remove (identity, role, fact) triples with a single save."""
+        with self._lock:
+            results = [self._remove(identity, role, fact) for identity, role, fact in bindings]
+            removed = sum(1 for r in results if r["status"] == "removed")
+            if removed:
+                self._changed(removed)
+            return results
+
+    def _remove(self, identity, role, fact):
         key = f"{identity}|{role}|{fact}"
         if key not in self.stored:
             return {"status": "not_found", "key": key}
@@ -410,20 +673,24 @@ class QAISField:
             self.role_fields[role] -= bind(id_vec, fact_vec)
         self.count -= 1
         # Update registries
-        if fact in self.fact_to_identities:
-            self.fact_to_identities[fact].discard(identity)
-            if not self.fact_to_identities[fact]:
-                del self.fact_to_identities[fact]
-                self.fact_vectors.pop(fact, None)
-        if identity in self.identity_to_facts:
-            self.identity_to_facts[identity].discard(fact)
-            if not self.identity_to_facts[identity]:
-                del self.identity_to_facts[identity]
-        self._save()
+        roles = self.identity_role_facts.get(identity)
+        if roles and role in roles:
+            roles[role].discard(fact)
+            if not roles[role]:
+                del roles[role]
+            if not roles:
+                del self.identity_role_facts[identity]
+        # The same identity may still hold this fact under another role
+        if not any(fact in facts for facts in self.identity_role_facts.get(identity, {}).values()):
+            self._drop_fact(identity, fact)
+            if identity in self.identity_to_facts:
+                self.identity_to_facts[identity].discard(fact)
+                if not self.identity_to_facts[identity]:
+                    del self.identity_to_facts[identity]
         return {"status": "removed", "key": key, "count": self.count}
 
     def passthrough_v5(self, text, candidates, threshold=0.08, top_k=3):
-        text_vec = text_to_vector_v5(text)
+        text_bits = text_to_bits(text)
         keywords = text_to_keywords_v5(text)
         keywords_lower = set(k.lower() for k in keywords)
         candidate_set = set(candidates)
@@ -437,20 +704,19 @@ class QAISField:
                     if syn in keywords_lower:
                         direct_matches.add(candidate)
                         break
-        fact_scores = []
-        for fact, fact_vec in self.fact_vectors.items():
-            score = resonance(text_vec, fact_vec)
-            if score > threshold:
-                fact_scores.append((fact, score, self.fact_to_identities[fact]))
-        fact_scores.sort(key=lambda x: -x[1])
+        # One popcount pass over the fact matrix; only rows above threshold reach Python
+        matrix, built = self.fact_matrix()
+        scores = packed_resonance(matrix, text_bits)
+        hits = np.flatnonzero((scores > threshold) & built)
+        hits = hits[np.argsort(-scores[hits], kind='stable')]
         identity_evidence = {}
-        for fact, score, identities in fact_scores:
-            for identity in identities:
+        for row in hits.tolist():
+            for identity in self.row_identities[row]:
                 if identity in candidate_set:
                     if identity not in identity_evidence:
                         identity_evidence[identity] = []
                     if len(identity_evidence[identity]) < top_k:
-                        identity_evidence[identity].append((fact, score))
+                        identity_evidence[identity].append((self.fact_keys[row], float(scores[row])))
         matches = []
         for candidate in candidates:
             direct = candidate in direct_matches
@@ -467,23 +733,28 @@ class QAISField:
         conf_order = {"EXACT": 0, "HIGH": 1, "MEDIUM": 2, "LOW": 3}
         matches.sort(key=lambda x: (conf_order.get(x["confidence"], 4), -x["score"]))
         should_load = [m["context"] for m in matches if m["confidence"] in ["EXACT", "HIGH"]]
-        return {"keywords": keywords, "matches": matches, "should_load": should_load,
-                "confidence": matches[0]["confidence"] if matches else "NONE",
-                "facts_checked": len(self.fact_vectors), "version": "v5"}
+        result = {"keywords": keywords, "matches": matches, "should_load": should_load,
+                  "confidence": matches[0]["confidence"] if matches else "NONE",
+                  "facts_checked": int(built.sum()), "version": "v5"}
+        if not built.all():
+            result["facts_pending"] = int(len(built) - built.sum())  # background backfill still running
+        return result
 
 FIELD = None
 def get_field():
     global FIELD
     if FIELD is None:
-        FIELD = QAISField()
+        FIELD = QAISField(write_behind=True)
     return FIELD
 
 
 # ═════════════════════════════════════════════════════
 # Perspective Isolated Fields (S98)
 # ═════════════════════════════════════════════════════
-# Each perspective gets its own tiny .npz field.
+# Each perspective gets its own tiny .qfield field.
 # Seed content resonates in isolation — no global field noise.
+# Seed fields save on every change (no write-behind): the search daemon
+# scores them straight from disk on the next sync.
 
 PERSPECTIVE_FIELDS = {}
 PERSPECTIVE_DATA_DIR = os.path.join(
@@ -495,7 +766,7 @@ os.makedirs(PERSPECTIVE_DATA_DIR, exist_ok=True)
 def get_perspective_field(perspective):
     """Get or create an isolated QAISField for a perspective's seeds."""
     if perspective not in PERSPECTIVE_FIELDS:
-        field_path = os.path.join(PERSPECTIVE_DATA_DIR, f"{perspective}.npz")
+        field_path = os.path.join(PERSPECTIVE_DATA_DIR, f"{perspective}.qfield")
         PERSPECTIVE_FIELDS[perspective] = QAISField(field_path)
     return PERSPECTIVE_FIELDS[perspective]
 
@@ -506,8 +777,8 @@ PERSPECTIVE_CRYSTAL_FIELDS = {}
 def get_perspective_crystal_field(perspective):
     """Get or create an isolated QAISField for a perspective's crystal momentum."""
     if perspective not in PERSPECTIVE_CRYSTAL_FIELDS:
-        field_path = os.path.join(PERSPECTIVE_DATA_DIR, f"{perspective}_crystal.npz")
-        PERSPECTIVE_CRYSTAL_FIELDS[perspective] = QAISField(field_path)
+        field_path = os.path.join(PERSPECTIVE_DATA_DIR, f"{perspective}_crystal.qfield")
+        PERSPECTIVE_CRYSTAL_FIELDS[perspective] = QAISField(field_path, write_behind=True)
     return PERSPECTIVE_CRYSTAL_FIELDS[perspective]
 
 
@@ -520,7 +791,8 @@ TOOLS = [
      "inputSchema": {"type": "object", "properties": {
          "identity": {"type": "string", "description": "The entity to query"},
          "role": {"type": "string", "description": "The role/attribute to query"},
-         "candidates": {"type": "array", "items": {"type": "string"}, "description": "List of possible facts to test"}
+         "candidates": {"type": "array", "items": {"type": "string"}, "description": "List of possible facts to test"},
+         "top_k": {"type": "integer", "description": "Return only the best k candidates (default: all)"}
      }, "required": ["identity", "role", "candidates"]}},
     {"name": "qais_exists", "description": "Check if an entity exists in the QAIS field.",
      "inputSchema": {"type": "object", "properties": {
@@ -569,12 +841,16 @@ TOOLS = [
          "project": {"type": "string", "description": "Project name (default: BOND)"},
          "context": {"type": "string", "description": "Optional context"}
      }, "required": ["chunk_text", "session_num"]}},
-    {"name": "perspective_store", "description": "Store a seed into a perspective's isolated QAIS field. Each perspective has its own .npz field for tight resonance.",
+    {"name": "perspective_store", "description": "Store a seed into a perspective's isolated QAIS field. Each perspective has its own field file for tight resonance. Pass seeds to bulk-seed in one write.",
      "inputSchema": {"type": "object", "properties": {
          "perspective": {"type": "string", "description": "Perspective entity name (e.g. P11-Plumber)"},
          "seed_title": {"type": "string", "description": "Seed name/title"},
-         "seed_content": {"type": "string", "description": "Seed content text"}
-     }, "required": ["perspective", "seed_title", "seed_content"]}},
+         "seed_content": {"type": "string", "description": "Seed content text"},
+         "seeds": {"type": "array", "description": "Several seeds at once, saved with a single write",
+                   "items": {"type": "object", "properties": {
+                       "title": {"type": "string"}, "content": {"type": "string"}},
+                       "required": ["title", "content"]}}
+     }, "required": ["perspective"]}},
     {"name": "perspective_check", "description": "Check conversation text against a perspective's isolated field for seed resonance. Returns scored matches. Used by Sync step 5 seed collection.",
      "inputSchema": {"type": "object", "properties": {
          "perspective": {"type": "string", "description": "Perspective entity name (e.g. P11-Plumber)"},
@@ -622,7 +898,8 @@ def handle_request(request):
                 "content": [{"type": "text", "text": json.dumps(error, indent=2)}]}}
         try:
             if tool_name == "qais_resonate":
-                result = get_field().resonate(args["identity"], args["role"], args["candidates"])
+                result = get_field().resonate(args["identity"], args["role"], args["candidates"],
+                                              args.get("top_k"))
             elif tool_name == "qais_exists":
                 result = get_field().exists(args["identity"])
             elif tool_name == "qais_store":
@@ -645,7 +922,7 @@ def handle_request(request):
                 result = get_gate().evaluate(args["trigger"], args.get("context", ""), args.get("message", ""))
             elif tool_name == "crystal":
                 # Two-field architecture (S116): perspective/project active → local crystal field
-                # Seeds in {entity}.npz, crystal momentum in {entity}_crystal.npz
+                # Seeds in {entity}.qfield, crystal momentum in {entity}_crystal.qfield
                 entity, entity_class = get_active_entity()
                 if entity and entity_class in ('perspective', 'project'):
                     pcf = get_perspective_crystal_field(entity)
@@ -658,6 +935,13 @@ def handle_request(request):
                     result = get_crystal().crystallize(args["chunk_text"], args["session_num"],
                         args.get("project", "BOND"), args.get("context"))
                     result["field"] = "global"
+            elif tool_name == "perspective_store" and "seeds" in args:
+                pf = get_perspective_field(args["perspective"])
+                results = pf.store_many([(seed["title"], "seed", seed["content"]) for seed in args["seeds"]])
+                result = {"perspective": args["perspective"],
+                         "stored": sum(1 for r in results if r["status"] == "stored"),
+                         "exists": sum(1 for r in results if r["status"] == "exists"),
+                         "field_count": pf.count}
             elif tool_name == "perspective_store":
                 pf = get_perspective_field(args["perspective"])
                 store_result = pf.store(args["seed_title"], "seed", args["seed_content"])
@@ -676,8 +960,7 @@ def handle_request(request):
                     result = {"perspective": args["perspective"], "matches": [],
                              "note": "Field empty — no seeds stored yet. Use perspective_store to bootstrap."}
                 else:
-                    text_vec = text_to_vector_v5(args["text"])
-                    matches = []
+                    seeds = []
                     seen = set()
                     for key in pf.stored:
                         parts = key.split('|', 2)
@@ -686,9 +969,12 @@ def handle_request(request):
                             if title in seen:
                                 continue
                             seen.add(title)
-                            seed_vec = text_to_vector_v5(content)
-                            score = float(np.dot(text_vec, seed_vec) / N)
-                            matches.append({"seed": title, "content_preview": content[:80], "score": round(score, 4)})
+                            seeds.append((title, content))
+                    # Seed vectors come from the field's fact registry (persisted matrix)
+                    seed_bits = pf.fact_vectors([content for _, content in seeds])
+                    scores = packed_resonance(seed_bits, text_to_bits(args["text"]))
+                    matches = [{"seed": title, "content_preview": content[:80], "score": round(float(score), 4)}
+                               for (title, content), score in zip(seeds, scores)]
                     matches.sort(key=lambda x: -x["score"])
                     result = {"perspective": args["perspective"], "matches": matches, "field_count": pf.count}
             elif tool_name == "perspective_crystal_restore":
@@ -697,15 +983,9 @@ def handle_request(request):
                     result = {"perspective": args["perspective"], "sessions": [],
                              "note": "Crystal field empty — no session momentum stored yet."}
                 else:
-                    sessions = {}
-                    for key in pcf.stored:
-                        parts = key.split('|', 2)
-                        if len(parts) == 3:
-                            session_id, role, content = parts
-                            if session_id not in sessions:
-                                sessions[session_id] = {}
-                            sessions[session_id][role] = content
-                    session_list = [{"session": sid, **data} for sid, data in sorted(sessions.items())]
+                    # Crystal bindings are Session{N}|role|content — read them off the index
+                    session_list = [{"session": sid, **{role: next(iter(facts)) for role, facts in roles.items()}}
+                                    for sid, roles in sorted(pcf.identity_role_facts.items())]
                     result = {"perspective": args["perspective"], "sessions": session_list,
                              "field_count": pcf.count}
             elif tool_name == "daemon_fetch":
@@ -746,6 +1026,10 @@ def main():
     # which garbles multi-byte UTF-8 from MCP client (em dash → â€" etc.)
     sys.stdin.reconfigure(encoding='utf-8')
     sys.stdout.reconfigure(encoding='utf-8')
+    if os.environ.get('QAIS_VECTOR_STORE', 'on').lower() != 'off':
+        KEYWORD_VECTORS.attach(os.path.join(
+            os.environ.get('BOND_ROOT', os.path.join(os.path.dirname(__file__), '..')),
+            'data', 'qais_vectors', 'mcp.bin'))
     get_field()
     for line in sys.stdin:
         line = line.strip()
@@ -11,7 +11,7 @@ import numpy as np
 
 # Paths resolve from BOND_ROOT environment variable
 BOND_ROOT = os.environ.get('BOND_ROOT', os.path.join(os.path.dirname(__file__), '..'))
-QAIS_FIELD_PATH = os.environ.get('QAIS_FIELD_PATH', os.path.join(BOND_ROOT, 'data', 'qais_field.npz'))
+QAIS_FIELD_PATH = os.environ.get('QAIS_FIELD_PATH', os.path.join(BOND_ROOT, 'data', 'qais_field.qfield'))
 ISS_PATH = os.environ.get('ISS_PATH', os.path.join(BOND_ROOT, 'ISS'))
 QAIS_PATH = os.environ.get('QAIS_PATH', os.path.join(BOND_ROOT, 'QAIS'))
 
@@ -39,7 +39,8 @@ def qais_exists(input_str):
         q = _get_qais()
         identity = input_str.strip()
         result = q.exists(identity)
-        bindings = [k for k in q.stored if k.startswith(f"{identity}|")]
+        bindings = [f"{identity}|{role}|{fact}"
+                    for role, facts in q.identity_role_facts.get(identity, {}).items() for fact in facts]
         result["binding_count"] = len(bindings)
         result["bindings"] = bindings[:20]
         return result
@@ -170,7 +171,7 @@ def _get_perspective_field(perspective):
     """Load isolated QAISField for a perspective entity."""
     perspectives_dir = os.path.join(BOND_ROOT, 'data', 'perspectives')
     os.makedirs(perspectives_dir, exist_ok=True)
-    field_path = os.path.join(perspectives_dir, f"{perspective}.npz")
+    field_path = os.path.join(perspectives_dir, f"{perspective}.qfield")
     sys.path.insert(0, QAIS_PATH)
     from qais_core import QAISField
     return QAISField(field_path=field_path)
@@ -208,23 +209,17 @@ def perspective_crystal_restore(input_str):
     try:
         perspective = input_str.strip()
         crystal_dir = os.path.join(BOND_ROOT, 'data', 'perspectives')
-        field_path = os.path.join(crystal_dir, f"{perspective}_crystal.npz")
-        if not os.path.exists(field_path):
-            return {"perspective": perspective, "sessions": [], "field_count": 0}
+        field_path = os.path.join(crystal_dir, f"{perspective}_crystal.qfield")
         sys.path.insert(0, QAIS_PATH)
         from qais_core import QAISField
+        from qais_field_format import field_exists
+        if not field_exists(field_path):
+            return {"perspective": perspective, "sessions": [], "field_count": 0}
         q = QAISField(field_path=field_path)
         sessions = []
         # Crystal stores as Session{N}|momentum|<text>, Session{N}|context|<text>, etc.
-        seen = set()
-        for key in sorted(q.stored):
-            parts = key.split('|', 2)
-            if len(parts) < 2:
-                continue
-            session_id = parts[0]
-            if session_id in seen:
-                continue
-            seen.add(session_id)
+        # Sessions come in the order sorting the stored keys would give.
+        for session_id in sorted(q.identity_role_facts, key=lambda s: s + '|'):
             entry = {"session": session_id}
             for role in ['momentum', 'context', 'tags', 'insight']:
                 result = q.get(session_id, role)
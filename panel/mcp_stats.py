@@ -9,18 +9,24 @@ import os
 
 # Paths resolve from BOND_ROOT environment variable
 BOND_ROOT = os.environ.get('BOND_ROOT', os.path.join(os.path.dirname(__file__), '..'))
+QAIS_PATH = os.environ.get('QAIS_PATH', os.path.join(BOND_ROOT, 'QAIS'))
+
+def _read_field(field_path):
+    """QAIS field sections (legacy .npz read in place, not migrated), or None."""
+    sys.path.insert(0, QAIS_PATH)
+    from qais_field_format import field_file, open_field
+    return open_field(field_file(field_path), migrate_legacy=False)
 
 def qais_stats():
     """Read QAIS field file and return stats."""
-    field_path = os.environ.get('QAIS_FIELD_PATH', os.path.join(BOND_ROOT, 'data', 'qais_field.npz'))
+    field_path = os.environ.get('QAIS_FIELD_PATH', os.path.join(BOND_ROOT, 'data', 'qais_field.qfield'))
     try:
-        import numpy as np
-        if not os.path.exists(field_path):
+        data = _read_field(field_path)
+        if data is None:
             return {"status": "offline", "error": "No field file"}
-        data = np.load(field_path, allow_pickle=True)
-        stored = set(data['stored'].tolist())
-        count = int(data['count'])
-        role_fields = data['role_fields'].item()
+        stored = set(data['stored'])
+        count = data['count']
+        role_fields = data['role_fields']
         
         # Count unique identities and facts
         identities = set()
@@ -69,13 +75,12 @@ def gate_stats():
 
 def perspective_crystal_stats(perspective_name):
     """Read crystal count from perspective's local crystal field."""
-    field_path = os.path.join(BOND_ROOT, 'data', 'perspectives', f"{perspective_name}_crystal.npz")
+    field_path = os.path.join(BOND_ROOT, 'data', 'perspectives', f"{perspective_name}_crystal.qfield")
     try:
-        import numpy as np
-        if not os.path.exists(field_path):
+        data = _read_field(field_path)
+        if data is None:
             return {"status": "empty", "count": 0, "perspective": perspective_name}
-        data = np.load(field_path, allow_pickle=True)
-        count = int(data['count'])
+        count = data['count']
         return {"status": "active", "count": count, "perspective": perspective_name}
     except Exception as e:
         return {"status": "error", "count": 0, "error": str(e)}
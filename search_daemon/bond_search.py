@@ -3,7 +3,7 @@ BOND Search Daemon — Local Paragraph-Level Search Engine
 Phase 1: TF-IDF + Contrastive Anchors (ported from warm_restore SectionCorpus)
 
 Standalone process that:
-  - Watches doctrine/ and state/ for changes
+  - Watches doctrine/ and state/ for changes (inotify on Linux, polling elsewhere)
   - Derives scope from active_entity.json + link graph
   - Indexes entity .md files at paragraph level
   - Serves search queries via HTTP on port 3003
@@ -14,6 +14,9 @@ Usage:
     python bond_search.py --port 3004              # custom port
     python bond_search.py --root C:/Projects/BOND  # custom BOND_ROOT
     python bond_search.py --once "query"            # one-shot query, no server
+    python bond_search.py --poll                   # stat polling instead of inotify
+    python bond_search.py --debounce 0.3 --max-delay 2  # reindex coalescing window (seconds)
+    python bond_search.py --no-vector-store        # QAIS keyword vectors in memory only
 
 Search Endpoints (Hot Water — SLA pipeline):
     GET /search?q=backflow+prevention          # query the index (auto mode)
@@ -21,7 +24,12 @@ Search Endpoints (Hot Water — SLA pipeline):
     GET /search?q=the+lord+is+my+shepherd&mode=retrieve  # force SLA v2 retrieval
     GET /search?q=pressure&scope=all           # search all entities
     GET /search?q=pressure&entity=P11-Plumber  # local valve: single entity
-    GET /load?path=C:/texts/psalms.md          # load external corpus (auto-retrieve)
+    GET /search?q=pressure&type=root           # doc type filter: root, seed, pruned, core (comma list ok)
+    GET /suggest?prefix=pres                   # stem completions by document frequency
+    GET /search-federated?q=pressure           # doctrine + external + SLA in parallel, merged ranking
+    GET /search-federated?q=x&sources=doctrine,sla&budget_ms=100  # per-corpus latency budget
+    GET /load?path=C:/texts/psalms.md          # load external corpus (auto-retrieve) → job_id
+    GET /load?path=...&wait=true               # block until loaded (pre-job behaviour)
     GET /load?path=C:/texts/bible/&name=Bible  # load directory with custom name
     GET /unload                                # return to doctrine index
     GET /duplicates                            # find similar paragraphs
@@ -39,7 +47,11 @@ Search Endpoints (Hot Water — SLA pipeline):
     GET /gnoise-all                            # D25: sweep all entities
     GET /gnoise-all?threshold=0.15             # custom threshold
     GET /status                                # index stats, scope, health
-    GET /reindex                               # force rebuild
+    GET /metrics                               # response bytes before/after compression
+    GET /reindex                               # force rebuild (background job → job_id)
+    GET /reindex?wait=true                     # force rebuild, block until swapped in
+    GET /build-status?job_id=ab12cd34          # rebuild/load progress (omit job_id: all jobs)
+    GET /build-cancel?job_id=ab12cd34          # cancel; the current index keeps serving
 
 File Ops Endpoints (Cold Water — verbatim, no processing):
     GET  /manifest                             # all files with entity, class, size
@@ -58,6 +70,8 @@ Composite Payloads (Data Assembly Layer — one call replaces many):
     GET  /sync-complete                        # {Sync} steps 1-5 (no vine scores)
     POST /sync-complete {"text": "...", "session": "S124"}  # steps 1-5 + vine scores + tracker writes
     # D11: sync-complete includes state/handoff.md content
+    GET  /sync-complete?since=<cursor>         # delta: only what changed + tombstones
+    POST /sync-complete {"text": "...", "since": "<cursor>"}  # delta with vine scores
     # D12: linked entities return entity.json identity only (tier 1)
     GET  /enter-payload?entity=BOND_MASTER     # {Enter} in one call: entity files + linked files
     GET  /vine-data?perspective=P11-Plumber    # vine lifecycle: tracker, roots, seeds, pruned
@@ -73,11 +87,18 @@ QAIS Resonance (Daemon-local vine scoring):
     GET /resonance-test?perspective=P11-Plumber&text=...  # single perspective
     GET /resonance-multi?text=...                         # all armed perspectives
 
+Response Encoding:
+    Accept-Encoding: gzip | deflate            # compressed bodies (>= 1KB)
+    ?pretty=true                               # indented JSON (default for browsers only)
+    If-None-Match: <etag>                      # 304 when unchanged on disk (GET /sync-complete,
+                                               #   /enter-payload, /vine-data, /manifest, /obligations)
+
 """
 
-import sys, os, re, json, math, time, threading, shutil, fnmatch
+import sys, os, re, json, math, time, threading, shutil, fnmatch, zlib, hashlib, uuid, struct, mmap, tempfile
+import atexit, bisect, heapq
 from pathlib import Path
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 from http.server import HTTPServer, BaseHTTPRequestHandler
 from socketserver import ThreadingMixIn
 from urllib.parse import urlparse, parse_qs, unquote
@@ -95,6 +116,8 @@ DOCTRINE_PATH = os.path.join(BOND_ROOT, 'doctrine')
 STATE_PATH = os.path.join(BOND_ROOT, 'state')
 DEFAULT_PORT = 3003
 WATCH_INTERVAL = 2.0  # seconds between file change checks
+REINDEX_QUIET_SECONDS = 0.3  # debounce: build once changes are quiet this long
+REINDEX_MAX_DELAY = 2.0  # ...but never hold a pending change longer than this
 MIN_PARAGRAPH_LENGTH = 20  # characters — skip tiny fragments
 
 # ─── Text Processing (from warm_restore.py) ────────────────
@@ -157,24 +180,14 @@ def get_active_scope():
             scope['active_class'] = state.get('class', 'unknown')
             scope['mode'] = 'active'
             scope['entities'].append(state['entity'])
-            try:
-                config_path = Path(DOCTRINE_PATH) / state['entity'] / 'entity.json'
-                config = json.loads(config_path.read_text(encoding='utf-8'))
-                for link in config.get('links', []):
-                    if link not in scope['entities']:
-                        scope['entities'].append(link)
-            except Exception:
-                pass
+            for link in entity_registry.links(state['entity']):
+                if link not in scope['entities']:
+                    scope['entities'].append(link)
     except Exception:
         pass
     if not scope['entities']:
         scope['mode'] = 'all'
-        try:
-            for entry in Path(DOCTRINE_PATH).iterdir():
-                if entry.is_dir():
-                    scope['entities'].append(entry.name)
-        except Exception:
-            pass
+        scope['entities'] = entity_registry.names()
     return scope
 
 
@@ -242,10 +255,71 @@ def extract_external_paragraphs(filepath, corpus_name=None):
     return _parse_paragraphs(text, corpus_name, fp.name)
 
 
-def load_external_corpus(path, corpus_name=None):
+class SpooledText:
+    """Append-only UTF-8 blob in an anonymous temp file, read back through mmap.
+
+    External corpora park paragraph text here so resident memory holds
+    (offset, length) pairs instead of the raw corpus. The file is removed
+    by the OS when the last paragraph referencing this store is collected.
+    """
+
+    def __init__(self):
+        self._fh = tempfile.TemporaryFile()
+        self._mm = None
+        self._lock = threading.Lock()
+        self.size = 0
+
+    def append(self, text):
+        data = text.encode('utf-8')
+        offset = self.size
+        self._fh.write(data)
+        self.size += len(data)
+        return offset, len(data)
+
+    def seal(self):
+        """Finish writing and map the blob read-only."""
+        with self._lock:
+            if self._mm is None and self.size:
+                self._fh.flush()
+                self._mm = mmap.mmap(self._fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def read(self, offset, length):
+        if self._mm is None:
+            self.seal()
+        return self._mm[offset:offset + length].decode('utf-8') if length else ''
+
+
+class SpooledParagraph(dict):
+    """Paragraph record whose 'text' lives in a SpooledText.
+
+    Behaves like the plain paragraph dicts everywhere p['text'] is read;
+    the text is materialized on access and never cached on the record.
+    """
+
+    __slots__ = ('_store', '_span')
+
+    def __init__(self, store, span, **fields):
+        super().__init__(**fields)
+        self._store = store
+        self._span = span
+
+    def __missing__(self, key):
+        if key == 'text':
+            return self._store.read(*self._span)
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        if key == 'text':
+            return self['text']
+        return super().get(key, default)
+
+
+def load_external_corpus(path, corpus_name=None, progress=None, spool=None):
     """Load paragraphs from a file or directory of files.
 
-    Returns (paragraphs, corpus_name, file_count).
+    Returns (paragraphs, corpus_name, file_count). `progress` (BuildProgress)
+    is updated per file and checked for cancellation. With `spool`
+    (SpooledText), text goes to the spool and records are SpooledParagraphs.
     """
     p = Path(path)
     if not p.exists():
@@ -253,22 +327,71 @@ def load_external_corpus(path, corpus_name=None):
     if not corpus_name:
         corpus_name = p.stem if p.is_file() else p.name
     all_paragraphs = []
-    file_count = 0
     if p.is_file():
-        all_paragraphs = extract_external_paragraphs(p, corpus_name)
-        file_count = 1
+        files = [p]
     elif p.is_dir():
-        for f in sorted(p.iterdir()):
-            if f.suffix.lower() in ('.md', '.txt'):
-                all_paragraphs.extend(extract_external_paragraphs(f, corpus_name))
-                file_count += 1
-    return all_paragraphs, corpus_name, file_count
+        files = [f for f in sorted(p.iterdir()) if f.suffix.lower() in ('.md', '.txt')]
+    else:
+        files = []
+    if progress:
+        progress.phase = 'parsing'
+        progress.files_total += len(files)
+    for f in files:
+        if progress:
+            progress.check()
+        paragraphs = extract_external_paragraphs(f, corpus_name)
+        if spool is not None:
+            file_name = sys.intern(f.name)
+            paragraphs = [SpooledParagraph(spool, spool.append(p['text']), entity=corpus_name,
+                                           file=file_name, heading=p['heading'])
+                          for p in paragraphs]
+        all_paragraphs.extend(paragraphs)
+        if progress:
+            progress.files_parsed += 1
+            progress.paragraphs += len(paragraphs)
+    if spool is not None:
+        spool.seal()
+    return all_paragraphs, corpus_name, len(files)
 
 
 # ─── Search Index ──────────────────────────────────────────
 
+DOC_TYPES = ('root', 'seed', 'pruned', 'core')
+SUGGEST_CACHE_ENTRIES = 512  # distinct (prefix, limit) completions kept per index generation
+VOCAB_PATCH_MAX = 64  # vocab changes patched into the sorted stem list; more → full re-sort
+EXPLORE_TYPE_WEIGHT = {'root': 1.5, 'pruned': 0.5}  # explore-mode score multipliers
+
+
+def doc_type_of(fname):
+    """Classify a file by naming convention: root, pruned, core or seed."""
+    if fname.startswith('ROOT-') or fname.startswith('ROOT_'):
+        return 'root'
+    if fname.startswith('G-pruned-') or fname.startswith('_pruned_'):
+        return 'pruned'
+    if fname.startswith('CORE') or fname == 'entity.json':
+        return 'core'
+    return 'seed'
+
+
+def mask_indices(mask):
+    """Set bit positions of an int bitmap, ascending. O(n) via the binary string."""
+    bits = bin(mask)[:1:-1]  # least significant bit first
+    out = []
+    i = bits.find('1')
+    while i != -1:
+        out.append(i)
+        i = bits.find('1', i + 1)
+    return out
+
 class SearchIndex:
-    """TF-IDF + Contrastive Anchor index over paragraphs."""
+    """TF-IDF + Contrastive Anchor index over paragraphs.
+
+    Doctrine builds keep one shard per entity (per-file paragraphs, tokens
+    and a shard-local df), refreshed only for files whose stat moved. The
+    searchable view is the concatenation of the shards in scope with df
+    summed across them, so a scope change re-selects shards instead of
+    re-reading files. Anchors are computed lazily, per paragraph, on first use.
+    """
 
     def __init__(self, anchor_k=5, confuser_k=3):
         self.anchor_k = anchor_k
@@ -278,18 +401,32 @@ class SearchIndex:
         self.vocab = set()
         self.df = defaultdict(int)
         self.idf = {}
-        self.anchors = []
         self.n = 0
         self.scope = {}
         self.built_at = None
         self.build_time_ms = 0
+        self.generation = 0  # bumps on every build and write-through update
+        self.updates = 0
+        self._shards = {}  # entity → {'files': {name: (sig, paragraphs, tokens)}, 'df': {...}}
+        # Filter columns, rebuilt with every view: per-paragraph codes plus
+        # int bitmaps (bit i = paragraph i) per entity and per doc type
+        self.doc_type_col = bytearray()  # index into DOC_TYPES
+        self.entity_col = []  # entity id per paragraph
+        self.entity_ids = {}
+        self.entity_masks = {}
+        self.type_masks = {}
+        # /suggest: sorted stems for bisect range lookup, plus completions cached per generation
+        self._sorted_vocab = []
+        self._suggest_cache = OrderedDict()  # (prefix, limit) → (suggestions, matches)
+        self._anchor_cache = {}
         self._lock = threading.Lock()
 
-    def build(self, scope=None, force_scope=None, corpus_origin='doctrine'):
+    def build(self, scope=None, force_scope=None, corpus_origin='doctrine', progress=None):
         """Build index from doctrine entity files. Thread-safe.
 
         corpus_origin: 'doctrine' (default) or 'external'
         Set at ingest time — determines auto mode routing.
+        The previous view keeps serving until the new one is swapped in.
         """
         start = time.time()
         if force_scope:
@@ -302,25 +439,106 @@ class SearchIndex:
             scope_info = scope or get_active_scope()
             scope_info['corpus_origin'] = 'doctrine'
 
-        all_paragraphs = []
+        with self._lock:
+            shards = dict(self._shards)
+        reloaded = 0
+        if progress:
+            progress.phase = 'parsing'
         for entity_name in scope_info['entities']:
-            entity_dir = Path(DOCTRINE_PATH) / entity_name
-            if not entity_dir.is_dir():
+            shard, changed = self._load_shard(entity_name, shards.get(entity_name), progress)
+            if shard is None:
+                shards.pop(entity_name, None)
                 continue
-            for md_file in entity_dir.glob('*.md'):
-                all_paragraphs.extend(extract_paragraphs(md_file))
+            shards[entity_name] = shard
+            reloaded += changed
 
-        stats = self._index_paragraphs(all_paragraphs, scope_info, start)
+        stats = self._assemble(shards, scope_info, start, progress)
+        stats['shards_reloaded'] = reloaded
         return stats
 
-    def build_external(self, path, corpus_name=None):
+    def with_scope(self, entities):
+        """Throwaway index over `entities` that reuses this index's shards."""
+        temp = SearchIndex(anchor_k=self.anchor_k, confuser_k=self.confuser_k)
+        with self._lock:
+            temp._shards = dict(self._shards)
+        temp.build(force_scope=list(entities))
+        with self._lock:
+            # Keep shards first loaded by the temp view for the next caller
+            for name, shard in temp._shards.items():
+                self._shards.setdefault(name, shard)
+        return temp
+
+    def _load_shard(self, entity_name, shard, progress=None):
+        """Bring one entity shard up to date with disk.
+
+        Returns (shard, changed); shard is None when the entity dir is gone.
+        Shards are never mutated in place — a changed shard is a new dict —
+        so views and with_scope() copies can share them safely.
+        """
+        entity_dir = Path(DOCTRINE_PATH) / entity_name
+        if not entity_dir.is_dir():
+            return None, shard is not None
+        old_files = shard['files'] if shard else {}
+        files = {}
+        changed = shard is None
+        md_files = sorted(entity_dir.glob('*.md'))
+        if progress:
+            progress.files_total += len(md_files)
+        for md_file in md_files:
+            if progress:
+                progress.check()
+            sig = _stat_sig(md_file)
+            prev = old_files.get(md_file.name)
+            if prev is not None and sig is not None and prev[0] == sig:
+                files[md_file.name] = prev
+                if progress:
+                    progress.files_reused += 1
+                continue
+            paragraphs = extract_paragraphs(md_file)
+            tokens = [token_cache.stems(self._searchable_text(p)) for p in paragraphs]
+            files[md_file.name] = (sig, paragraphs, tokens)
+            changed = True
+            if progress:
+                progress.files_parsed += 1
+                progress.paragraphs += len(paragraphs)
+                progress.tokenized += len(paragraphs)
+        if files.keys() != old_files.keys():
+            changed = True
+        if not changed:
+            return shard, False
+        df = defaultdict(int)
+        for _, _, tokens in files.values():
+            for pt in tokens:
+                for w in set(pt):
+                    df[w] += 1
+        return {'files': files, 'df': dict(df)}, True
+
+    def _assemble(self, shards, scope_info, start, progress=None):
+        """Concatenate in-scope shards into the searchable view; df is summed."""
+        all_paragraphs = []
+        tokens_list = []
+        df = defaultdict(int)
+        for entity_name in scope_info['entities']:
+            shard = shards.get(entity_name)
+            if not shard:
+                continue
+            for _, paragraphs, tokens in shard['files'].values():
+                all_paragraphs.extend(paragraphs)
+                tokens_list.extend(tokens)
+            for w, c in shard['df'].items():
+                df[w] += c
+        return self._index_paragraphs(all_paragraphs, scope_info, start, tokens_list=tokens_list,
+                                      df=df, shards=shards, progress=progress)
+
+    def build_external(self, path, corpus_name=None, progress=None):
         """Build index from an external file or directory. Sets corpus_origin='external'.
 
         This is the ingest path for alien corpora (Psalms, etc).
         Auto mode will resolve to 'retrieve' for all searches.
         """
         start = time.time()
-        paragraphs, name, file_count = load_external_corpus(path, corpus_name)
+        spool = SpooledText()
+        paragraphs, name, file_count = load_external_corpus(path, corpus_name, progress, spool=spool)
         if not paragraphs:
             return {'error': f'No paragraphs found at {path}', 'paragraphs': 0, 'files': 0}
 
@@ -330,68 +548,255 @@ class SearchIndex:
             'corpus_origin': 'external', 'source_path': str(path),
         }
 
-        stats = self._index_paragraphs(paragraphs, scope_info, start)
+        stats = self._index_paragraphs(paragraphs, scope_info, start, progress=progress)
         stats['corpus_name'] = name
         stats['files'] = file_count
+        stats['text_spool_bytes'] = spool.size
         return stats
 
-    def _index_paragraphs(self, all_paragraphs, scope_info, start):
-        """Shared indexing logic for both doctrine and external builds."""
-        def searchable_text(p):
-            parts = []
-            if p.get('heading'):
-                parts.append(p['heading'])
-            parts.append(p['file'].replace('.md', '').replace('.txt', '').replace('-', ' '))
-            parts.append(p['text'])
-            return ' '.join(parts)
-
-        tokens_list = [content_stems(searchable_text(p)) for p in all_paragraphs]
-        vocab = set(s for pt in tokens_list for s in pt)
+    @staticmethod
+    def _searchable_text(p):
+        parts = []
+        if p.get('heading'):
+            parts.append(p['heading'])
+        parts.append(p['file'].replace('.md', '').replace('.txt', '').replace('-', ' '))
+        parts.append(p['text'])
+        return ' '.join(parts)
+
+    def _index_paragraphs(self, all_paragraphs, scope_info, start, tokens_list=None, df=None,
+                          shards=None, progress=None):
+        """Shared indexing logic for both doctrine and external builds.
+
+        Shard assembly passes precomputed tokens and df; external corpora
+        tokenize here. `shards` replaces the shard cache when given.
+        """
+        if tokens_list is None:
+            if progress:
+                progress.phase = 'tokenizing'
+            tokens_list = []
+            for i, p in enumerate(all_paragraphs):
+                if progress and i % 256 == 0:
+                    progress.check()
+                    progress.tokenized = i
+                # Interned by the cache: token lists are pointers into the vocabulary
+                tokens_list.append(token_cache.stems(self._searchable_text(p)))
+            if progress:
+                progress.tokenized = len(tokens_list)
         n = len(all_paragraphs)
+        if progress:
+            progress.phase = 'weighting'
 
-        df = defaultdict(int)
-        for pt in tokens_list:
-            for w in set(pt):
-                df[w] += 1
+        if df is None:
+            df = defaultdict(int)
+            for pt in tokens_list:
+                for w in set(pt):
+                    df[w] += 1
+        vocab = set(df)
 
         idf = {}
         for w in vocab:
             if df[w] > 0:
                 idf[w] = math.log(n / df[w]) if n > 0 else 0.0
 
-        anchors = []
-        if n <= 500:
-            anchors = self._build_anchors(n, tokens_list, idf)
-        else:
-            for i in range(n):
-                scores = {w: idf.get(w, 0) for w in set(tokens_list[i])}
-                ranked = sorted(scores.items(), key=lambda x: -x[1])[:self.anchor_k]
-                anchors.append({w: s for w, s in ranked})
+        columns = self._build_columns(all_paragraphs)
 
         elapsed = (time.time() - start) * 1000
+        if progress:
+            progress.check()  # last chance — after this the new view is live
+            progress.phase = 'swapping'
 
         with self._lock:
+            self._sorted_vocab = self._resort_vocab(self.vocab, vocab, self._sorted_vocab)
+            self._suggest_cache.clear()
             self.paragraphs = all_paragraphs
             self.tokens = tokens_list
             self.vocab = vocab
             self.df = df
             self.idf = idf
-            self.anchors = anchors
             self.n = n
             self.scope = scope_info
+            (self.doc_type_col, self.entity_col, self.entity_ids,
+             self.entity_masks, self.type_masks) = columns
+            self._anchor_cache = {}
+            if shards is not None:
+                self._shards = shards
             self.built_at = time.strftime('%Y-%m-%dT%H:%M:%S')
             self.build_time_ms = round(elapsed)
+            self.generation += 1
+            generation = self.generation
 
         return {
             'paragraphs': n, 'entities': len(scope_info['entities']),
             'vocab': len(vocab), 'build_time_ms': round(elapsed),
-            'scope_mode': scope_info['mode'],
+            'scope_mode': scope_info['mode'], 'generation': generation,
         }
 
-    def _build_anchors(self, n, tokens_list, idf):
-        """Contrastive anchors — words that distinguish each paragraph from its neighbors."""
+    def update_file(self, filepath):
+        """Write-through: refresh one doctrine .md file in its shard. Thread-safe.
+
+        Only the changed file is re-extracted; the view is then re-assembled
+        from shards. Returns the new generation, or None when the file is
+        outside the indexed doctrine scope.
+        """
+        start = time.time()
+        fp = Path(filepath)
+        if fp.suffix != '.md':
+            return None
+        try:
+            if fp.parent.parent.resolve() != Path(DOCTRINE_PATH).resolve():
+                return None
+        except OSError:
+            return None
+        entity = fp.parent.name
+        with self._lock:
+            scope_info = self.scope
+            if scope_info.get('corpus_origin', 'doctrine') != 'doctrine':
+                return None
+            if entity not in scope_info.get('entities', []):
+                return None
+            shards = dict(self._shards)
+        shard, _ = self._load_shard(entity, shards.get(entity))
+        if shard is None:
+            shards.pop(entity, None)
+        else:
+            shards[entity] = shard
+        stats = self._assemble(shards, scope_info, start)
+        with self._lock:
+            self.updates += 1
+        return stats['generation']
+
+    @staticmethod
+    def _build_columns(paragraphs):
+        """Doc-type and entity columns plus per-value bitmaps, one pass."""
+        type_code = {t: c for c, t in enumerate(DOC_TYPES)}
+        file_types = {}
+        doc_type_col = bytearray(len(paragraphs))
+        entity_col = []
+        entity_ids = {}
+        entity_bits = defaultdict(list)
+        type_bits = defaultdict(list)
+        for i, p in enumerate(paragraphs):
+            fname = p['file']
+            dt = file_types.get(fname)
+            if dt is None:
+                dt = file_types[fname] = doc_type_of(fname)
+            doc_type_col[i] = type_code[dt]
+            type_bits[dt].append(i)
+            eid = entity_ids.setdefault(p['entity'], len(entity_ids))
+            entity_col.append(eid)
+            entity_bits[p['entity']].append(i)
+
+        # Paragraphs of one entity/file are contiguous, so build from runs
+        def runs_mask(indices):
+            mask = 0
+            start = prev = None
+            for i in indices:
+                if start is None:
+                    start = prev = i
+                elif i == prev + 1:
+                    prev = i
+                else:
+                    mask |= ((1 << (prev - start + 1)) - 1) << start
+                    start = prev = i
+            if start is not None:
+                mask |= ((1 << (prev - start + 1)) - 1) << start
+            return mask
+
+        entity_masks = {e: runs_mask(ix) for e, ix in entity_bits.items()}
+        type_masks = {t: runs_mask(type_bits.get(t, [])) for t in DOC_TYPES}
+        return doc_type_col, entity_col, entity_ids, entity_masks, type_masks
+
+    def select(self, entity=None, doc_types=None):
+        """Paragraph indices matching entity and any of doc_types. Caller holds _lock.
+
+        None for both means everything (returns a range, not a list).
+        """
+        if entity is None and not doc_types:
+            return range(self.n)
+        mask = (1 << self.n) - 1
+        if entity is not None:
+            mask &= self.entity_masks.get(entity, 0)
+        if doc_types:
+            type_mask = 0
+            for t in doc_types:
+                type_mask |= self.type_masks.get(t, 0)
+            mask &= type_mask
+        return mask_indices(mask)
+
+    @staticmethod
+    def _resort_vocab(old_vocab, new_vocab, old_sorted):
+        """Sorted stem list for new_vocab, patched from old_sorted when the diff is small.
+
+        Each patch is an O(n) list shift, so past a few dozen changes one
+        sorted() is cheaper (60k stems: 64 inserts ~1 ms, a full sort ~23 ms).
+        """
+        added = new_vocab - old_vocab
+        removed = old_vocab - new_vocab
+        if len(added) + len(removed) > VOCAB_PATCH_MAX:
+            return sorted(new_vocab)
+        out = list(old_sorted)
+        for w in removed:
+            i = bisect.bisect_left(out, w)
+            if i < len(out) and out[i] == w:
+                del out[i]
+        for w in added:
+            bisect.insort(out, w)
+        return out
+
+    def suggest(self, prefix, limit=10):
+        """Stems starting with prefix, most frequent (df) first. Thread-safe."""
+        prefix = prefix.lower()
+        key = (prefix, limit)
+        with self._lock:
+            cached = self._suggest_cache.get(key)
+            if cached is not None:
+                self._suggest_cache.move_to_end(key)
+                suggestions, matches = cached
+                return {'prefix': prefix, 'suggestions': suggestions, 'cached': True,
+                        'matches': matches, 'generation': self.generation}
+            lo = bisect.bisect_left(self._sorted_vocab, prefix)
+            hi = bisect.bisect_left(self._sorted_vocab, prefix + '\uffff', lo)
+            matches = self._sorted_vocab[lo:hi]
+            df = self.df
+            top = heapq.nsmallest(limit, matches, key=lambda w: (-df.get(w, 0), w))
+            suggestions = [{'term': w, 'df': df.get(w, 0)} for w in top]
+            self._suggest_cache[key] = (suggestions, hi - lo)
+            while len(self._suggest_cache) > SUGGEST_CACHE_ENTRIES:
+                self._suggest_cache.popitem(last=False)
+            return {'prefix': prefix, 'suggestions': suggestions, 'cached': False,
+                    'matches': hi - lo, 'generation': self.generation}
+
+    def _anchor(self, idx):
+        """Anchor words for one paragraph, computed on first use. Caller holds _lock."""
+        anchor = self._anchor_cache.get(idx)
+        if anchor is None:
+            anchor = self._build_anchors(self.n, self.tokens, self.idf, indices=[idx])[0]
+            self._anchor_cache[idx] = anchor
+        return anchor
+
+    def shard_status(self):
+        with self._lock:
+            return {name: {'files': len(shard['files']),
+                           'paragraphs': sum(len(f[1]) for f in shard['files'].values()),
+                           'in_scope': name in self.entity_masks}
+                    for name, shard in sorted(self._shards.items())}
+
+    def _build_anchors(self, n, tokens_list, idf, indices=None):
+        """Anchor words per paragraph (all, or just `indices`).
+
+        Up to 500 paragraphs: contrastive — words that distinguish each
+        paragraph from its nearest neighbors. Above that: top-idf words.
+        """
+        indices = range(n) if indices is None else indices
+        if n > 500:
+            anchors = []
+            for i in indices:
+                scores = {w: idf.get(w, 0) for w in set(tokens_list[i])}
+                ranked = sorted(scores.items(), key=lambda x: -x[1])[:self.anchor_k]
+                anchors.append({w: s for w, s in ranked})
+            return anchors
         anchors = []
-        for i in range(n):
+        for i in indices:
             sims = []
             for j in range(n):
                 if j == i:
@@ -481,12 +886,13 @@ class SearchIndex:
         return 'explore'
 
     def search(self, query_text, top_n=10, anchor_weight=15, nbr_weight=10,
-               entity_boost=1.3, entity_filter=None, mode='auto'):
+               entity_boost=1.3, entity_filter=None, mode='auto', doc_types=None):
         """Search the index.
 
         mode='auto'     — daemon decides from context (default)
         mode='explore'  — editorial weights in score (doctrine browsing)
         mode='retrieve' — pure BM25 ranking, adjustments to margin only (SLA v2)
+        doc_types       — restrict to these DOC_TYPES (e.g. ['root'])
         """
         with self._lock:
             if self.n == 0:
@@ -510,10 +916,12 @@ class SearchIndex:
 
             qs = max(len(q_unique), 1)
             scores = []
-            for i, pt in enumerate(self.tokens):
-                p = self.paragraphs[i]
-                if entity_filter and p['entity'] != entity_filter:
-                    continue
+            # Filters resolve to bitmap intersections — only matching paragraphs are scored
+            candidates = self.select(entity_filter, doc_types)
+            type_weight = [EXPLORE_TYPE_WEIGHT.get(t, 1.0) for t in DOC_TYPES]
+            boost_ids = {self.entity_ids[e] for e in boosted_entities if e in self.entity_ids}
+            for i in candidates:
+                pt = self.tokens[i]
                 overlap = q_unique & set(pt)
                 if not overlap:
                     scores.append((i, 0.0, overlap))
@@ -530,12 +938,8 @@ class SearchIndex:
                 score *= (1.0 + proximity * 0.5)
                 # Mode-dependent scoring
                 if mode == 'explore':
-                    fname = p['file']
-                    if fname.startswith('ROOT-') or fname.startswith('ROOT_'):
-                        score *= 1.5
-                    elif fname.startswith('G-pruned-') or fname.startswith('_pruned_'):
-                        score *= 0.5
-                    if boosted_entities and p['entity'] in boosted_entities:
+                    score *= type_weight[self.doc_type_col[i]]
+                    if self.entity_col[i] in boost_ids:
                         score *= entity_boost
                 scores.append((i, score, overlap))
 
@@ -552,9 +956,7 @@ class SearchIndex:
                 if group_key in seen_groups:
                     seen_groups[group_key][2] += 1
                     continue
-                anchor_hits = []
-                if idx < len(self.anchors):
-                    anchor_hits = [w for w in self.anchors[idx] if w in q_unique]
+                anchor_hits = [w for w in self._anchor(idx) if w in q_unique]
                 result = {
                     'entity': p['entity'], 'file': p['file'], 'heading': p['heading'],
                     'text': p['text'], 'score': round(sc, 4),
@@ -587,12 +989,12 @@ class SearchIndex:
                         nbr_diff = 0.0
                     nbr_adj = nbr_weight * nbr_diff
                     type_adj = 0.0
-                    for ri, r in enumerate(results[:2]):
-                        fname = r['file']
+                    for ri, idx in enumerate(result_indices[:2]):
                         sign = 1.0 if ri == 0 else -1.0
-                        if fname.startswith('ROOT-') or fname.startswith('ROOT_'):
+                        doc_type = DOC_TYPES[self.doc_type_col[idx]]
+                        if doc_type == 'root':
                             type_adj += sign * 5.0
-                        elif fname.startswith('G-pruned-') or fname.startswith('_pruned_'):
+                        elif doc_type == 'pruned':
                             type_adj -= sign * 5.0
                     margin = min(max(raw + anchor_adj + nbr_adj + type_adj, 0.1), 100.0)
                 else:
@@ -673,15 +1075,7 @@ class SearchIndex:
                         max_cosine = sim
                 p = self.paragraphs[i]
                 if max_cosine <= max_sim:
-                    fname = p['file']
-                    if fname.startswith('ROOT-') or fname.startswith('ROOT_'):
-                        doc_type = 'root'
-                    elif fname.startswith('G-pruned-') or fname.startswith('_pruned_'):
-                        doc_type = 'pruned'
-                    elif fname.startswith('CORE') or fname == 'entity.json':
-                        doc_type = 'core'
-                    else:
-                        doc_type = 'seed'
+                    doc_type = DOC_TYPES[self.doc_type_col[i]]
                     isolation_scores.append({
                         'max_similarity': round(max_cosine, 4), 'entity': p['entity'],
                         'file': p['file'], 'heading': p['heading'],
@@ -695,16 +1089,8 @@ class SearchIndex:
         with self._lock:
             if self.n == 0:
                 return {'error': 'Index empty'}
-            root_indices = []
-            seed_indices = []
-            for i, p in enumerate(self.paragraphs):
-                if p['entity'] != entity_name:
-                    continue
-                fname = p['file']
-                if fname.startswith('ROOT-') or fname.startswith('ROOT_'):
-                    root_indices.append(i)
-                elif not fname.startswith('G-pruned-') and not fname.startswith('_pruned_'):
-                    seed_indices.append(i)
+            root_indices = self.select(entity_name, ['root'])
+            seed_indices = self.select(entity_name, ['seed', 'core'])
             if not root_indices:
                 return {'entity': entity_name, 'error': 'No ROOTs found', 'roots': 0, 'seeds': 0}
             if not seed_indices:
@@ -758,22 +1144,542 @@ class SearchIndex:
                 'source_path': self.scope.get('source_path'),
                 'active_entity': self.scope.get('active_entity'),
                 'built_at': self.built_at, 'build_time_ms': self.build_time_ms,
-                'anchors': len(self.anchors),
+                'anchors': len(self._anchor_cache), 'shards': len(self._shards),
+                'generation': self.generation,
+                'write_through_updates': self.updates,
             }
 
 
+# ─── Background Builds ────────────────────────────────────
+# /reindex and /load run as jobs (D18 job-tank pattern): the request returns
+# a job_id at once, the build runs on its own thread, and the old index keeps
+# serving queries until the finished view is swapped in. Cancelling a job
+# raises BuildCancelled at the next checkpoint; nothing is swapped.
+
+class BuildCancelled(Exception):
+    """Raised at a progress checkpoint when the build's job was cancelled."""
+
+
+class BuildProgress:
+    """Counters a build updates as it goes; read by /build-status."""
+
+    def __init__(self):
+        self.phase = 'queued'
+        self.files_total = 0
+        self.files_parsed = 0
+        self.files_reused = 0  # shard files whose stat hadn't moved
+        self.paragraphs = 0
+        self.tokenized = 0
+        self.cancelled = False
+
+    def check(self):
+        if self.cancelled:
+            raise BuildCancelled()
+
+    def snapshot(self):
+        return {
+            'phase': self.phase, 'files_total': self.files_total,
+            'files_parsed': self.files_parsed, 'files_reused': self.files_reused,
+            'paragraphs': self.paragraphs, 'paragraphs_tokenized': self.tokenized,
+        }
+
+
+class BuildJobs:
+    """Background index build jobs: job_id → status, progress, result."""
+
+    def __init__(self, job_ttl=300):
+        self.jobs = {}
+        self.job_ttl = job_ttl  # seconds — finished jobs expire after 5 minutes
+        self._lock = threading.Lock()  # handler threads submit, poll and expire concurrently
+
+    def submit(self, kind, fn, **meta):
+        """Start fn(progress) on a daemon thread; returns the job_id."""
+        self._cleanup_jobs()
+        job_id = str(uuid.uuid4())[:8]
+        job = {
+            'job_id': job_id, 'kind': kind, 'status': 'running',
+            'started': time.time(), 'finished': None,
+            'progress': BuildProgress(), 'result': None, **meta,
+        }
+        with self._lock:
+            self.jobs[job_id] = job
+        threading.Thread(target=self._run, args=(job, fn), daemon=True).start()
+        return job_id
+
+    def _run(self, job, fn):
+        try:
+            result = fn(job['progress'])
+            job['result'] = result
+            job['status'] = 'error' if 'error' in result else 'done'
+        except BuildCancelled:
+            job['status'] = 'cancelled'
+        except Exception as e:
+            job['status'] = 'error'
+            job['result'] = {'error': str(e)}
+        finally:
+            job['finished'] = time.time()
+            job['progress'].phase = job['status']
+
+    def cancel(self, job_id):
+        with self._lock:
+            job = self.jobs.get(job_id)
+        if not job:
+            return {'error': f'Job not found: {job_id}', 'status': 'unknown'}
+        if job['status'] == 'running':
+            job['progress'].cancelled = True
+            return {'job_id': job_id, 'status': 'cancelling'}
+        return {'job_id': job_id, 'status': job['status']}
+
+    def job_status(self, job_id):
+        self._cleanup_jobs()
+        with self._lock:
+            job = self.jobs.get(job_id)
+        if not job:
+            return {'error': f'Job not found: {job_id}', 'status': 'unknown'}
+        end = job['finished'] or time.time()
+        out = {k: v for k, v in job.items() if k not in ('progress', 'started', 'finished')}
+        out['elapsed_ms'] = round((end - job['started']) * 1000)
+        out['progress'] = job['progress'].snapshot()
+        return out
+
+    def list(self):
+        self._cleanup_jobs()
+        with self._lock:
+            job_ids = list(self.jobs)
+        statuses = [self.job_status(jid) for jid in job_ids]
+        return [st for st in statuses if st.get('status') != 'unknown']  # expired meanwhile
+
+    def _cleanup_jobs(self):
+        """Remove expired jobs."""
+        now = time.time()
+        with self._lock:
+            expired = [jid for jid, job in self.jobs.items()
+                       if job['status'] != 'running' and now - job['started'] > self.job_ttl]
+            for jid in expired:
+                del self.jobs[jid]
+
+
+build_jobs = BuildJobs()
+
+
+def reindex_job(progress):
+    """Doctrine rebuild through the scheduler (serialized with watcher builds)."""
+    stats = watcher.scheduler.run_now({'<manual>'}, progress=progress)
+    if 'error' in stats:
+        return stats
+    return {'reindexed': True, **stats}
+
+
+def load_corpus_job(file_path, corpus_name, progress):
+    """External corpus build; the doctrine watcher pauses only once it is live."""
+    watcher.scheduler.loading_external = True  # file writes stop waiting on build_lock
+    try:
+        with watcher.scheduler.build_lock:  # wait out any in-flight doctrine build
+            stats = index.build_external(file_path, corpus_name, progress=progress)
+            if 'error' in stats:
+                return stats
+            watcher.pause()  # drops doctrine builds queued behind this one
+    finally:
+        watcher.scheduler.loading_external = False
+    ts = time.strftime('%H:%M:%S')
+    print(f"  [{ts}] External corpus loaded: {stats['paragraphs']} paragraphs from {stats.get('files', '?')} files ({stats['build_time_ms']}ms)")
+    return {'loaded': True, 'watcher': 'paused', **stats}
+
+
+# ─── Federated Search ─────────────────────────────────────
+# One query across doctrine, a loaded external corpus and the SLA code
+# index. Each request searches every corpus on its own thread, and each
+# corpus's latency budget runs from when its search starts — a slow corpus
+# or a concurrent request can't use up another source's budget. Raw scores
+# are divided by that corpus's top score so rankings merge on a common 0-1
+# scale.
+
+FEDERATED_SOURCES = ('doctrine', 'external', 'sla')
+FEDERATED_BUDGET_MS = 250
+
+
+def _federated_indexes(wanted):
+    """source name → SearchIndex for every requested source that has content."""
+    out = {}
+    main = index
+    if main is not None and main.n:
+        if main.scope.get('corpus_origin') == 'external':
+            out['external'] = main
+        else:
+            out['doctrine'] = main
+    if 'doctrine' in wanted and 'doctrine' not in out and main is not None:
+        # External corpus is live — doctrine shards are still cached on the index
+        out['doctrine'] = lambda: main.with_scope(get_active_scope()['entities'])
+    if sla_index is not None and sla_index.n:
+        out['sla'] = sla_index
+    return {name: ix for name, ix in out.items() if name in wanted}
+
+
+def federated_search(query, sources=FEDERATED_SOURCES, top_n=10, budget_ms=FEDERATED_BUDGET_MS, mode='auto'):
+    """Fan out to each source, drop any that miss the budget, merge by normalized score."""
+    indexes = _federated_indexes(set(sources))
+
+    def run(ix, run_state):
+        run_state['started'] = t0 = time.time()
+        try:
+            if callable(ix):
+                ix = ix()
+            result = ix.search(query, top_n=top_n, mode=mode)
+            result['latency_ms'] = round((time.time() - t0) * 1000, 1)
+            run_state['result'] = result
+        except Exception as e:
+            run_state['error'] = e
+        finally:
+            run_state['done'].set()
+
+    runs = {}
+    for name, ix in indexes.items():
+        runs[name] = {'done': threading.Event()}
+        threading.Thread(target=run, args=(ix, runs[name]), daemon=True,
+                         name=f'federated-{name}').start()
+
+    budget = budget_ms / 1000.0
+    for run_state in runs.values():
+        while not run_state['done'].is_set():
+            started = run_state.get('started')
+            remaining = budget if started is None else started + budget - time.time()
+            if remaining <= 0:
+                break
+            run_state['done'].wait(remaining)
+
+    merged = []
+    report = {}
+    for name in sources:
+        run_state = runs.get(name)
+        if run_state is None:
+            report[name] = {'status': 'unavailable'}
+            continue
+        if not run_state['done'].is_set():
+            report[name] = {'status': 'timeout', 'budget_ms': budget_ms}
+            continue
+        if 'error' in run_state:
+            report[name] = {'status': 'error', 'error': str(run_state['error'])}
+            continue
+        result = run_state['result']
+        results = result.get('results', [])
+        top_score = results[0]['score'] if results else 0.0
+        report[name] = {
+            'status': 'ok' if results else 'empty', 'indexed': result.get('indexed', 0),
+            'mode': result.get('mode'), 'margin': result.get('margin'),
+            'top_score': top_score, 'latency_ms': result['latency_ms'],
+        }
+        for r in results:
+            r['source'] = name
+            r['raw_score'] = r['score']
+            r['score'] = round(r['score'] / top_score, 4) if top_score else 0.0
+            merged.append(r)
+
+    merged.sort(key=lambda r: (-r['score'], -r['raw_score']))
+    return {'query': query, 'results': merged[:top_n], 'sources': report, 'budget_ms': budget_ms}
+
+
 # ─── File Watcher ──────────────────────────────────────────
+# Linux: inotify via ctypes (no third-party dependency) — the kernel tells us
+# exactly which file moved, so idle cost is zero and edits land immediately.
+# Everywhere else, or if inotify setup fails: stat polling every WATCH_INTERVAL.
+
+IN_MODIFY      = 0x00000002
+IN_ATTRIB      = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM  = 0x00000040
+IN_MOVED_TO    = 0x00000080
+IN_CREATE      = 0x00000100
+IN_DELETE      = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF   = 0x00000800
+IN_Q_OVERFLOW  = 0x00004000
+IN_IGNORED     = 0x00008000
+IN_ONLYDIR     = 0x01000000
+IN_ISDIR       = 0x40000000
+IN_NONBLOCK    = 0o4000
+IN_CLOEXEC     = 0o2000000
+
+INOTIFY_MASK = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+                | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF)
+
+
+class Inotify:
+    """Minimal recursive inotify wrapper over libc via ctypes.
+
+    add_tree() watches a directory and every subdirectory; directories
+    created later are picked up from their IN_CREATE|IN_ISDIR event.
+    read_events(timeout) yields (path, mask) with absolute paths.
+    Raises OSError from __init__ if inotify is unavailable.
+    """
+
+    _EVENT = struct.Struct('iIII')
+
+    def __init__(self):
+        if not sys.platform.startswith('linux'):
+            raise OSError('inotify requires Linux')
+        import ctypes, ctypes.util
+        self._ctypes = ctypes
+        self._libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self._libc.inotify_init1.argtypes = [ctypes.c_int]
+        self._libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self._libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+        fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, f'inotify_init1: {os.strerror(err)}')
+        self.fd = fd
+        self._wd_paths = {}  # wd → directory path
+        self._path_wds = {}  # directory path → wd
+        self._recursive = set()  # wds whose new subdirs get watched too
+
+    def add_watch(self, dir_path, recursive=False):
+        dir_path = os.path.abspath(dir_path)
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(dir_path), INOTIFY_MASK | IN_ONLYDIR)
+        if wd < 0:
+            err = self._ctypes.get_errno()
+            raise OSError(err, f'inotify_add_watch {dir_path}: {os.strerror(err)}')
+        self._wd_paths[wd] = dir_path
+        self._path_wds[dir_path] = wd
+        if recursive:
+            self._recursive.add(wd)
+        return wd
+
+    def add_tree(self, root):
+        """Watch root and all directories below it."""
+        for dirpath, dirnames, _ in os.walk(root):
+            self.add_watch(dirpath, recursive=True)
+
+    def read_events(self, timeout):
+        """Block up to timeout seconds; return [(path, mask), ...]."""
+        import select
+        try:
+            ready, _, _ = select.select([self.fd], [], [], timeout)
+        except (OSError, ValueError):
+            return []
+        if not ready:
+            return []
+        try:
+            buf = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+        events = []
+        offset = 0
+        while offset + self._EVENT.size <= len(buf):
+            wd, mask, _cookie, name_len = self._EVENT.unpack_from(buf, offset)
+            offset += self._EVENT.size
+            name = buf[offset:offset + name_len].rstrip(b'\0').decode('utf-8', 'replace')
+            offset += name_len
+            if mask & IN_Q_OVERFLOW:
+                events.append((None, mask))
+                continue
+            dir_path = self._wd_paths.get(wd)
+            if mask & IN_IGNORED:
+                # Kernel dropped the watch (dir deleted/moved away)
+                if dir_path is not None:
+                    self._wd_paths.pop(wd, None)
+                    self._path_wds.pop(dir_path, None)
+                    self._recursive.discard(wd)
+                continue
+            if dir_path is None:
+                continue
+            path = os.path.join(dir_path, name) if name else dir_path
+            if (mask & IN_ISDIR) and (mask & (IN_CREATE | IN_MOVED_TO)) and wd in self._recursive:
+                try:
+                    self.add_tree(path)
+                except OSError:
+                    pass
+            events.append((path, mask))
+        return events
+
+    def watch_count(self):
+        return len(self._wd_paths)
+
+    def close(self):
+        try:
+            os.close(self.fd)
+        except OSError:
+            pass
+
+
+class ReindexScheduler:
+    """Coalesces change notifications into as few index builds as possible.
+
+    A build fires once changes have been quiet for `quiet` seconds, or
+    `max_delay` seconds after the first pending change, whichever comes
+    first. Builds are serialized on build_lock (also taken by /load and
+    /reindex); changes arriving mid-build become the next build's set.
+    While paused (external corpus loaded) notifications are dropped.
+    """
+
+    def __init__(self, build_fn, quiet=REINDEX_QUIET_SECONDS, max_delay=REINDEX_MAX_DELAY):
+        self.build_fn = build_fn  # callable(changes: set, progress=None) → stats dict
+        self.quiet = quiet
+        self.max_delay = max_delay
+        self.build_lock = threading.Lock()
+        self._cond = threading.Condition()
+        self._pending = set()
+        self._first = None
+        self._last = None
+        self._paused = False
+        self._running = False
+        self._thread = None
+        self.loading_external = False  # set by load_corpus_job for the whole build
+        self.stats = {
+            'builds': 0, 'manual_builds': 0, 'notifications': 0, 'coalesced': 0,
+            'dropped_paused': 0, 'max_batch': 0, 'errors': 0,
+            'last_build_ms': None, 'last_wait_ms': None, 'last_batch': 0, 'last_built_at': None,
+        }
+
+    def notify(self, changes):
+        """Queue changed paths (or labels like '<resume>') for the next build."""
+        changes = set(changes)
+        if not changes:
+            return
+        with self._cond:
+            self.stats['notifications'] += len(changes)
+            if self._paused:
+                self.stats['dropped_paused'] += len(changes)
+                return
+            now = time.monotonic()
+            if not self._pending:
+                self._first = now
+            self._pending |= changes
+            self._last = now
+            self._cond.notify()
+
+    def _take(self):
+        """Wait until a batch is due; return (changes, waited_seconds) or None on stop."""
+        with self._cond:
+            while self._running:
+                if not self._pending or self._paused:
+                    self._cond.wait()
+                    continue
+                now = time.monotonic()
+                deadline = min(self._last + self.quiet, self._first + self.max_delay)
+                if now < deadline:
+                    self._cond.wait(deadline - now)
+                    continue
+                changes, self._pending = self._pending, set()
+                waited = now - self._first
+                self._first = self._last = None
+                return changes, waited
+        return None
+
+    def _loop(self):
+        while self._running:
+            batch = self._take()
+            if batch is None:
+                return
+            changes, waited = batch
+            with self.build_lock:
+                if self._paused:
+                    self.stats['dropped_paused'] += len(changes)
+                    continue
+                self._build(changes, waited)
+
+    def _build(self, changes, waited=0.0, manual=False, progress=None):
+        """Run one build. Caller holds build_lock."""
+        start = time.time()
+        try:
+            result = self.build_fn(changes, progress=progress)
+        except BuildCancelled:
+            raise
+        except Exception as e:
+            self.stats['errors'] += 1
+            print(f"  Reindex error: {e}", file=sys.stderr)
+            return {'error': str(e)}
+        st = self.stats
+        st['manual_builds' if manual else 'builds'] += 1
+        st['coalesced'] += max(len(changes) - 1, 0)
+        st['max_batch'] = max(st['max_batch'], len(changes))
+        st['last_batch'] = len(changes)
+        st['last_wait_ms'] = round(waited * 1000, 1)
+        st['last_build_ms'] = round((time.time() - start) * 1000, 1)
+        st['last_built_at'] = time.strftime('%Y-%m-%dT%H:%M:%S')
+        return result
+
+    def run_now(self, changes=(), progress=None):
+        """Build on the calling thread (GET /reindex job). Absorbs anything pending."""
+        with self.build_lock:
+            with self._cond:
+                absorbed, self._pending = self._pending, set()
+                self._first = self._last = None
+            try:
+                result = self._build(set(changes) | absorbed, manual=True, progress=progress)
+            except BaseException:
+                self._requeue(absorbed)
+                raise
+            if 'error' in result:
+                self._requeue(absorbed)
+            return result
+
+    def _requeue(self, changes):
+        """Put changes a failed or cancelled run_now absorbed back in the queue."""
+        if not changes:
+            return
+        with self._cond:
+            if self._paused:
+                self.stats['dropped_paused'] += len(changes)
+                return
+            now = time.monotonic()
+            if not self._pending:
+                self._first = now
+            self._pending |= changes
+            self._last = now
+            self._cond.notify()
+
+    def start(self):
+        self._running = True
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+
+    def pause(self):
+        with self._cond:
+            self._paused = True
+            self.stats['dropped_paused'] += len(self._pending)
+            self._pending = set()
+            self._first = self._last = None
+
+    def resume(self):
+        with self._cond:
+            self._paused = False
+            self._cond.notify()
+
+    def status(self):
+        with self._cond:
+            pending = len(self._pending)
+        return {'quiet_s': self.quiet, 'max_delay_s': self.max_delay,
+                'pending': pending, 'building': self.build_lock.locked(), **self.stats}
+
 
 class FileWatcher:
-    """Polls for file changes and triggers reindex."""
+    """Watches doctrine/ + active_entity.json and triggers reindex.
 
-    def __init__(self, index, interval=WATCH_INTERVAL):
+    Backend is inotify where available (precise per-file events),
+    stat polling otherwise or when forced with --poll. Either way changes
+    go to a ReindexScheduler rather than building inline.
+    """
+
+    def __init__(self, index, interval=WATCH_INTERVAL, backend='auto',
+                 quiet=REINDEX_QUIET_SECONDS, max_delay=REINDEX_MAX_DELAY):
         self.index = index
         self.interval = interval
+        self.requested_backend = backend
+        self.backend = None
+        self._inotify = None
         self._signatures = {}
+        self._scope = None
+        self.scheduler = ReindexScheduler(self._rebuild, quiet=quiet, max_delay=max_delay)
         self._running = False
         self._paused = False
         self._thread = None
+        self.events_seen = 0
+        self.events_relevant = 0
 
     def _snapshot(self):
         sigs = {}
@@ -794,41 +1700,554 @@ class FileWatcher:
                     pass
         return sigs, scope
 
+    def _rebuild(self, changes=(), progress=None):
+        """Scheduler build callback — scope is re-derived at build time."""
+        scope = get_active_scope()
+        stats = self.index.build(scope=scope, progress=progress)
+        self._scope = scope
+        ts = time.strftime('%H:%M:%S')
+        batch = f", {len(changes)} changes" if len(changes) > 1 else ''
+        print(f"  [{ts}] Reindexed: {stats['paragraphs']} paragraphs from {stats['entities']} entities ({stats['build_time_ms']}ms{batch})")
+        token_cache.save()
+        return stats
+
+    # ── polling backend ──
+
     def _watch_loop(self):
         while self._running:
             try:
+                entity_registry.refresh()
                 if not self._paused:
                     new_sigs, scope = self._snapshot()
                     if new_sigs != self._signatures:
+                        changed = {k for k in new_sigs.keys() | self._signatures.keys()
+                                   if new_sigs.get(k) != self._signatures.get(k)}
                         self._signatures = new_sigs
-                        stats = self.index.build(scope=scope)
-                        ts = time.strftime('%H:%M:%S')
-                        print(f"  [{ts}] Reindexed: {stats['paragraphs']} paragraphs from {stats['entities']} entities ({stats['build_time_ms']}ms)")
+                        self.scheduler.notify(changed)
             except Exception as e:
                 print(f"  Watch error: {e}", file=sys.stderr)
             time.sleep(self.interval)
 
+    # ── inotify backend ──
+
+    def _open_inotify(self):
+        ino = Inotify()
+        try:
+            if os.path.isdir(DOCTRINE_PATH):
+                ino.add_tree(DOCTRINE_PATH)
+            # Watch the state dir, not the file — editors and json dumps replace it
+            os.makedirs(STATE_PATH, exist_ok=True)
+            ino.add_watch(STATE_PATH)
+        except OSError:
+            ino.close()
+            raise
+        return ino
+
+    def _classify(self, path, mask):
+        """Map one event to (registry_dirty, index_dirty)."""
+        if path is None:  # queue overflow — assume everything moved
+            return True, True
+        doctrine = os.path.abspath(DOCTRINE_PATH)
+        state = os.path.abspath(STATE_PATH)
+        parent, name = os.path.split(path)
+        if parent == state:
+            return False, name == 'active_entity.json'
+        rel = os.path.relpath(path, doctrine)
+        if rel.startswith('..'):
+            return False, False
+        parts = rel.split(os.sep)
+        scope_entities = (self._scope or {}).get('entities', [])
+        if len(parts) == 1:
+            # Entity dir itself created/deleted/renamed
+            if not (mask & IN_ISDIR):
+                return False, False
+            return True, (self._scope or {}).get('mode') == 'all' or parts[0] in scope_entities
+        entity = parts[0]
+        in_scope = entity in scope_entities
+        if len(parts) == 2:
+            if name == 'entity.json':
+                # Links or class may have moved — scope follows the link graph
+                return True, in_scope or entity == (self._scope or {}).get('active_entity')
+            if name.endswith('.md'):
+                # Added/removed .md changes identity files; edits don't
+                structural = bool(mask & (IN_CREATE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO))
+                return structural, in_scope and not (mask & IN_ATTRIB)
+        return False, False
+
+    def _inotify_loop(self):
+        ino = self._inotify
+        while self._running:
+            try:
+                events = ino.read_events(self.interval)
+                registry_dirty = False
+                changed = set()
+                for path, mask in events:
+                    self.events_seen += 1
+                    reg, idx = self._classify(path, mask)
+                    if reg or idx:
+                        self.events_relevant += 1
+                    registry_dirty |= reg
+                    if idx:
+                        changed.add(path or '<overflow>')
+                if registry_dirty:
+                    entity_registry.invalidate()
+                if changed and not self._paused:
+                    self.scheduler.notify(changed)
+            except Exception as e:
+                print(f"  Watch error: {e}", file=sys.stderr)
+                time.sleep(self.interval)
+        ino.close()
+
     def start(self):
         self._running = True
+        if self.requested_backend != 'poll':
+            try:
+                self._inotify = self._open_inotify()
+                self.backend = 'inotify'
+            except (OSError, AttributeError) as e:
+                print(f"  inotify unavailable ({e}) — falling back to polling", file=sys.stderr)
+                self._inotify = None
+        if self._inotify is None:
+            self.backend = 'poll'
         sigs, scope = self._snapshot()
         self._signatures = sigs
-        stats = self.index.build(scope=scope)
+        self._scope = scope
+        with self.scheduler.build_lock:
+            stats = self.index.build(scope=scope)
+        token_cache.save()
         print(f"  Initial index: {stats['paragraphs']} paragraphs, {stats['vocab']} vocab, {stats['entities']} entities ({stats['build_time_ms']}ms)")
-        self._thread = threading.Thread(target=self._watch_loop, daemon=True)
+        self.scheduler.start()
+        loop = self._inotify_loop if self._inotify else self._watch_loop
+        self._thread = threading.Thread(target=loop, daemon=True)
         self._thread.start()
 
     def stop(self):
         self._running = False
+        self.scheduler.stop()
 
     def pause(self):
         """Pause watching — used when external corpus is loaded."""
         self._paused = True
+        self.scheduler.pause()
 
     def resume(self):
         """Resume watching and rebuild doctrine index."""
         self._paused = False
-        # Force immediate rebuild on resume
-        self._signatures = {}
+        self.scheduler.resume()
+        # Rebuild on resume (coalesced with anything the poll loop notices)
+        self.scheduler.notify({'<resume>'})
+
+    def status(self):
+        return {
+            'backend': self.backend,
+            'paused': self._paused,
+            'watches': self._inotify.watch_count() if self._inotify else None,
+            'interval': self.interval if self.backend == 'poll' else None,
+            'events_seen': self.events_seen,
+            'events_relevant': self.events_relevant,
+            'reindex': self.scheduler.status(),
+        }
+
+
+# ─── Stat Signatures (ETags) ──────────────────────────────
+# Composite payloads are pure functions of a handful of files on disk.
+# Their ETag is a hash of (path, mtime_ns, size) for those files — stat only,
+# never content — so an unchanged repeat sync costs a few stat calls.
+
+def _stat_sig(path):
+    """(mtime_ns, size) for a path, or None if missing."""
+    try:
+        st = os.stat(path)
+        return st.st_mtime_ns, st.st_size
+    except OSError:
+        return None
+
+
+def _dir_sigs(dir_path, depth=1):
+    """Stat signatures for a directory and its entries, `depth` levels deep.
+
+    The directory's own mtime moves when entries are added or removed,
+    so creations and deletions change the signature too.
+    """
+    sigs = [(str(dir_path), _stat_sig(dir_path))]
+    try:
+        with os.scandir(dir_path) as it:
+            entries = sorted(it, key=lambda e: e.name)
+    except OSError:
+        return sigs
+    for entry in entries:
+        try:
+            if entry.is_dir():
+                if depth > 1:
+                    sigs.extend(_dir_sigs(entry.path, depth - 1))
+            else:
+                st = entry.stat()
+                sigs.append((entry.path, (st.st_mtime_ns, st.st_size)))
+        except OSError:
+            continue
+    return sigs
+
+
+def stat_etag(kind, paths=(), sigs=(), extra=()):
+    """Weak ETag over stat signatures. Never reads file contents.
+
+    kind: payload name (different payloads over the same files differ)
+    paths: files whose (mtime_ns, size) feed the tag
+    sigs: pre-computed (path, sig) pairs, e.g. from _dir_sigs
+    extra: other values the payload depends on (params, derived flags)
+    """
+    h = hashlib.sha1(kind.encode('utf-8'))
+    for item in extra:
+        h.update(b'\0' + repr(item).encode('utf-8'))
+    for p in paths:
+        h.update(b'\0' + f"{p}={_stat_sig(p)}".encode('utf-8'))
+    for p, sig in sigs:
+        h.update(b'\0' + f"{p}={sig}".encode('utf-8'))
+    return f'W/"{h.hexdigest()[:20]}"'
+
+
+# ─── File Content Cache ───────────────────────────────────
+# One process-wide cache for the files composite payloads, FileOps.read and
+# GNOISE keep re-reading (entity.json, CORE.md, trackers, holding cells).
+# Validated by (mtime_ns, size) on every hit, so edits made outside the
+# daemon are always seen. Byte-budget LRU keeps big corpora from pinning RAM.
+
+FILE_CACHE_BYTES = 32 * 1024 * 1024
+FILE_CACHE_RACY_SECONDS = 2.0  # files touched this recently aren't trusted by stat alone
+
+
+class FileCache:
+    """Stat-validated LRU of decoded file text, keyed by absolute path."""
+
+    def __init__(self, max_bytes=FILE_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # path → (sig, text)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.evictions = 0
+
+    def read_text(self, path):
+        """Return file text (utf-8). Raises OSError/UnicodeDecodeError like read_text()."""
+        key = os.path.abspath(str(path))
+        st = os.stat(key)
+        sig = (st.st_mtime_ns, st.st_size)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] == sig:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[1]
+                self.stale += 1
+                self._drop(key)
+            self.misses += 1
+        text = Path(key).read_text(encoding='utf-8')
+        # Racy-clean guard: a write within the same mtime tick could leave
+        # size and mtime unchanged. Only cache once the file has settled.
+        if time.time() - st.st_mtime_ns / 1e9 > FILE_CACHE_RACY_SECONDS and st.st_size <= self.max_bytes:
+            with self._lock:
+                self._drop(key)
+                self._entries[key] = (sig, text)
+                self._bytes += st.st_size
+                while self._bytes > self.max_bytes and self._entries:
+                    self._drop(next(iter(self._entries)))
+                    self.evictions += 1
+        return text
+
+    def read_json(self, path):
+        """Parsed JSON from cached text. Always a fresh object — callers may mutate it."""
+        return json.loads(self.read_text(path))
+
+    def invalidate(self, path):
+        with self._lock:
+            self._drop(os.path.abspath(str(path)))
+
+    def _drop(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[0][1]
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'stale': self.stale,
+                'evictions': self.evictions,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else None,
+            }
+
+
+file_cache = FileCache()
+
+
+# ─── Tokenization Cache ───────────────────────────────────
+# Paragraph searchable-text hash → stem list. Rebuilds and write-through
+# updates only tokenize paragraphs whose text is new; everything else is a
+# dict hit. Persisted to state/ so a daemon restart starts warm — at most
+# once per TOKEN_CACHE_SAVE_INTERVAL after a rebuild, and again at exit.
+
+TOKEN_CACHE_ENTRIES = 100_000
+TOKEN_CACHE_FILE = 'search_token_cache.json'
+TOKEN_CACHE_SAVE_INTERVAL = 300  # seconds
+
+
+class TokenCache:
+    """LRU of content hash → content_stems() result. Lists are shared — never mutate."""
+
+    def __init__(self, max_entries=TOKEN_CACHE_ENTRIES):
+        self.max_entries = max_entries
+        self.path = None
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._saved_at = None  # time.monotonic() of the last write
+        self.hits = 0
+        self.misses = 0
+        self.loaded = 0
+        self.saves = 0
+
+    @staticmethod
+    def _key(text):
+        return hashlib.blake2b(text.encode('utf-8'), digest_size=12).hexdigest()
+
+    def stems(self, text):
+        key = self._key(text)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return cached
+            self.misses += 1
+        stems = [sys.intern(t) for t in content_stems(text)]
+        with self._lock:
+            self._entries[key] = stems
+            self._dirty = True
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return stems
+
+    def load(self, path):
+        """Attach to a cache file and read it if present. A bad file is ignored."""
+        self.path = path
+        try:
+            with open(path, encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return 0
+        if data.get('version') != 1:
+            return 0
+        entries = data.get('entries', {})
+        with self._lock:
+            for key, joined in entries.items():
+                if key not in self._entries:
+                    self._entries[key] = [sys.intern(t) for t in joined.split()]
+            self.loaded = len(entries)
+        return self.loaded
+
+    def save(self, force=False):
+        """Write the cache (atomically) if anything was added since the last save.
+
+        Unforced saves are throttled to one per TOKEN_CACHE_SAVE_INTERVAL;
+        the atexit hook forces the final one.
+        """
+        if not self.path or not self._dirty:
+            return False
+        now = time.monotonic()
+        if (not force and self._saved_at is not None
+                and now - self._saved_at < TOKEN_CACHE_SAVE_INTERVAL):
+            return False
+        with self._lock:
+            # Stems never contain whitespace (tokenize splits on it)
+            entries = {key: ' '.join(stems) for key, stems in self._entries.items()}
+            self._dirty = False
+        tmp = self.path + '.tmp'
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump({'version': 1, 'entries': entries}, f, separators=(',', ':'))
+            os.replace(tmp, self.path)
+        except OSError as e:
+            self._dirty = True
+            print(f"  Token cache save failed: {e}", file=sys.stderr)
+            return False
+        self._saved_at = now
+        self.saves += 1
+        return True
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries), 'max_entries': self.max_entries,
+                'loaded': self.loaded, 'saves': self.saves, 'dirty': self._dirty,
+                'hits': self.hits, 'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else None,
+            }
+
+
+token_cache = TokenCache()
+
+
+# ─── Entity Registry ──────────────────────────────────────
+# Every entity.json parsed once, plus the link graph and a class index.
+# Replaces the per-call doctrine/ scans in scope derivation, armed-seeder
+# lookup, obligations, vine-pass-all, GNOISE sweeps and the manifest.
+# Freshness: the watcher re-checks stat signatures every tick, and daemon
+# writes under doctrine/ mark it dirty so the next lookup re-checks at once.
+
+class EntityRegistry:
+    """In-memory view of doctrine/*/entity.json. Lookups are dict reads."""
+
+    # Identity file patterns by class (GNOISE centroid, D17)
+    IDENTITY_PATTERNS = {
+        'perspective': lambda files: [f for f in files if f.startswith('ROOT-') or f.startswith('ROOT_')],
+        'project': lambda files: [f for f in files if f in ('CORE.md',)],
+        'doctrine': None,  # resolved dynamically: entity_name + '.md'
+        'library': lambda files: [],  # no identity files — skip
+    }
+
+    def __init__(self, doctrine_path):
+        self.doctrine_path = Path(doctrine_path)
+        self._records = {}
+        self._by_class = {}
+        self._linked_from = {}
+        self._sigs = None
+        self._dirty = True
+        self._lock = threading.Lock()
+        self.generation = 0
+
+    def _signature(self):
+        """doctrine/ + each entity dir + each entity.json — stat only.
+
+        Entity dir mtime moves when files are added or removed, which is
+        what identity_files (ROOT-*.md globs) depend on.
+        """
+        sigs = [_stat_sig(self.doctrine_path)]
+        try:
+            entries = sorted(e for e in self.doctrine_path.iterdir() if e.is_dir())
+        except OSError:
+            entries = []
+        for entry in entries:
+            sigs.append((entry.name, _stat_sig(entry), _stat_sig(entry / 'entity.json')))
+        return sigs
+
+    def _identity_files(self, name, entity_class, config, md_files):
+        # entity.json override — explicit identity files take priority
+        if config and 'identity_files' in config:
+            return config['identity_files']
+        if entity_class == 'doctrine':
+            # Primary .md = entity_name + '.md'
+            candidate = name + '.md'
+            return [candidate] if candidate in md_files else []
+        pattern_fn = self.IDENTITY_PATTERNS.get(entity_class)
+        if pattern_fn is None:
+            return []
+        return pattern_fn(md_files)
+
+    def refresh(self):
+        """Rebuild if any signature moved. Returns True when rebuilt."""
+        sigs = self._signature()
+        with self._lock:
+            self._dirty = False
+            if sigs == self._sigs:
+                return False
+        records = {}
+        for name in [sig[0] for sig in sigs[1:]]:
+            entity_dir = self.doctrine_path / name
+            try:
+                config = file_cache.read_json(entity_dir / 'entity.json')
+                if not isinstance(config, dict):
+                    config = None
+            except Exception:
+                config = None
+            try:
+                md_files = sorted(f.name for f in entity_dir.iterdir() if f.is_file() and f.suffix == '.md')
+            except OSError:
+                md_files = []
+            entity_class = (config or {}).get('class', 'unknown')
+            records[name] = {
+                'name': name,
+                'class': entity_class,
+                'config': config,
+                'links': list((config or {}).get('links', [])),
+                'seeding': bool((config or {}).get('seeding', False)),
+                'seed_threshold': (config or {}).get('seed_threshold', 0.04),
+                'prune_window': (config or {}).get('prune_window', 10),
+                'md_files': md_files,
+                'identity_files': self._identity_files(name, entity_class, config, md_files),
+            }
+        by_class = defaultdict(list)
+        linked_from = defaultdict(list)
+        for name, record in records.items():
+            by_class[record['class']].append(name)
+            for link in record['links']:
+                linked_from[link].append(name)
+        with self._lock:
+            self._records = records
+            self._by_class = dict(by_class)
+            self._linked_from = dict(linked_from)
+            self._sigs = sigs
+            self.generation += 1
+        return True
+
+    def invalidate(self):
+        """Mark dirty — the next lookup re-checks signatures."""
+        self._dirty = True
+
+    def _current(self):
+        if self._dirty:
+            self.refresh()
+        return self._records
+
+    def get(self, name):
+        """Record for one entity, or None. Treat as read-only."""
+        return self._current().get(name)
+
+    def config(self, name):
+        """entity.json contents, or None if missing/unreadable."""
+        record = self.get(name)
+        return record['config'] if record else None
+
+    def names(self):
+        return sorted(self._current())
+
+    def by_class(self, entity_class):
+        self._current()
+        return list(self._by_class.get(entity_class, []))
+
+    def links(self, name):
+        record = self.get(name)
+        return list(record['links']) if record else []
+
+    def linked_from(self, name):
+        self._current()
+        return list(self._linked_from.get(name, []))
+
+    def armed(self):
+        """Perspective entities with seeding: true, in name order."""
+        records = self._current()
+        return [records[n] for n in self.by_class('perspective') if records[n]['seeding']]
+
+    def status(self):
+        records = self._current()
+        return {
+            'entities': len(records),
+            'generation': self.generation,
+            'classes': {c: len(n) for c, n in sorted(self._by_class.items())},
+            'armed': [r['name'] for r in self.armed()],
+        }
+
+
+entity_registry = None  # initialized in __main__
 
 
 # ─── File Operations (Cold Water) ──────────────────────────
@@ -864,6 +2283,48 @@ class FileOps:
         except Exception:
             pass
 
+    def _changed(self, resolved):
+        """Post-mutation bookkeeping for one path.
+
+        Drops cached content; under doctrine/ also dirties the entity
+        registry and pushes the file into the live index (write-through),
+        so a search right after a write sees it. Returns the index
+        generation when the index was updated, else None.
+        """
+        file_cache.invalidate(resolved)
+        try:
+            Path(resolved).resolve().relative_to(self.doctrine_path.resolve())
+        except (ValueError, OSError):
+            return None
+        entity_registry.invalidate()
+        if index is None or watcher is None:
+            return None
+        # Serialized with scheduled builds so an in-flight build can't swap stale data over it.
+        # Doctrine builds are short and worth waiting for; an external corpus build is not —
+        # the scheduler gets the file instead (dropped if the corpus goes live).
+        scheduler = watcher.scheduler
+        while not scheduler.build_lock.acquire(timeout=0.05):
+            if scheduler.loading_external:
+                scheduler.notify({resolved})
+                return None
+        try:
+            return index.update_file(resolved)
+        finally:
+            scheduler.build_lock.release()
+
+    def manifest_etag(self, entity_filter=None):
+        """ETag for manifest(): every entity dir plus one level of subdirs."""
+        sigs = [(str(self.doctrine_path), _stat_sig(self.doctrine_path))]
+        try:
+            entity_dirs = sorted(e for e in self.doctrine_path.iterdir() if e.is_dir())
+        except OSError:
+            entity_dirs = []
+        for entity_dir in entity_dirs:
+            if entity_filter and entity_dir.name != entity_filter:
+                continue
+            sigs.extend(_dir_sigs(entity_dir, depth=2))
+        return stat_etag('manifest', sigs=sigs, extra=(entity_filter,))
+
     def manifest(self, entity_filter=None):
         """List all files with metadata. Computed on call, never cached."""
         files = []
@@ -879,13 +2340,8 @@ class FileOps:
                 continue
             entities_found.add(entity_name)
 
-            # Read class from entity.json
-            entity_class = 'unknown'
-            try:
-                ej = json.loads((entity_dir / 'entity.json').read_text(encoding='utf-8'))
-                entity_class = ej.get('class', 'unknown')
-            except Exception:
-                pass
+            record = entity_registry.get(entity_name)
+            entity_class = record['class'] if record else 'unknown'
 
             for f in sorted(entity_dir.iterdir()):
                 if f.is_dir():
@@ -923,7 +2379,7 @@ class FileOps:
         if not resolved.is_file():
             return {'error': f'Not a file: {rel_path}'}
         try:
-            content = resolved.read_text(encoding='utf-8')
+            content = file_cache.read_text(resolved)
             return {
                 'path': rel_path,
                 'content': content,
@@ -980,6 +2436,7 @@ class FileOps:
                     }
 
             resolved.write_text(content, encoding='utf-8')
+            generation = self._changed(resolved)
             op = 'OVERWRITE' if existed else 'CREATE'
             detail = f"{len(content)} bytes"
             if existed:
@@ -992,6 +2449,7 @@ class FileOps:
                 'lines': content.count('\n') + 1,
                 'previous_size': existing_size if existed else None,
                 'backup': existed,
+                'index_generation': generation,
             }
         except Exception as e:
             return {'error': f'Write failed: {e}'}
@@ -1033,6 +2491,7 @@ class FileOps:
                     new_content = existing + content
 
             resolved.write_text(new_content, encoding='utf-8')
+            generation = self._changed(resolved)
             lines_added = content.count('\n') + (0 if content.endswith('\n') else 1)
             self._log('APPEND', rel_path, f"+{len(content)} bytes, position={position}")
             return {
@@ -1042,6 +2501,7 @@ class FileOps:
                 'new_size': len(new_content),
                 'added_bytes': len(content),
                 'lines_added': lines_added,
+                'index_generation': generation,
             }
         except Exception as e:
             return {'error': f'Append failed: {e}'}
@@ -1066,6 +2526,7 @@ class FileOps:
 
             new_content = existing.replace(old_text, new_text, 1)
             resolved.write_text(new_content, encoding='utf-8')
+            generation = self._changed(resolved)
             self._log('REPLACE', rel_path, f"{len(old_text)}\u2192{len(new_text)} bytes")
             return {
                 'path': rel_path,
@@ -1073,6 +2534,7 @@ class FileOps:
                 'old_size': len(existing),
                 'new_size': len(new_content),
                 'replacements': 1,
+                'index_generation': generation,
             }
         except Exception as e:
             return {'error': f'Replace failed: {e}'}
@@ -1092,6 +2554,7 @@ class FileOps:
             os.makedirs(to_resolved.parent, exist_ok=True)
             existed = to_resolved.is_file()
             to_resolved.write_text(content, encoding='utf-8')
+            generation = self._changed(to_resolved)
             op = 'COPY_OVER' if existed else 'COPY_NEW'
             self._log(op, f"{from_rel} -> {to_rel}", f"{len(content)} bytes")
             return {
@@ -1099,6 +2562,7 @@ class FileOps:
                 'to': to_rel,
                 'operation': op.lower(),
                 'size': len(content),
+                'index_generation': generation,
             }
         except Exception as e:
             return {'error': f'Copy failed: {e}'}
@@ -1125,13 +2589,8 @@ class FileOps:
             if entity_filter and entity_name != entity_filter:
                 continue
 
-            # Read class
-            entity_class = 'unknown'
-            try:
-                ej = json.loads((entity_dir / 'entity.json').read_text(encoding='utf-8'))
-                entity_class = ej.get('class', 'unknown')
-            except Exception:
-                pass
+            record = entity_registry.get(entity_name)
+            entity_class = record['class'] if record else 'unknown'
 
             entities_exported.add(entity_name)
             lines.append(f"---")
@@ -1176,7 +2635,7 @@ file_ops = None  # initialized in __main__ (after --root parse)
 
 
 # ─── QAIS Resonance (Perspective Vine Scoring) ────────
-# Phase 2 of daemon consolidation: daemon reads perspective .npz fields
+# Phase 2 of daemon consolidation: daemon reads perspective field files
 # and computes resonance scores locally. No MCP round-trip needed.
 # Math extracted from qais_mcp_server.py text_to_vector_v5.
 # P11: daemon reads only, MCP writes only. No concurrent write risk.
@@ -1226,6 +2685,31 @@ def qais_seed_to_vector(seed):
     return rng.choice([-1, 1], size=QAIS_N).astype(np.float32)
 
 
+# Packed form: 4096 bipolar components → 512 bytes, bit set = +1 (32× smaller
+# than float32). For ±1 vectors a·b = N − 2·popcount(a XOR b), so bulk scoring
+# is XOR + popcount over uint64 views instead of float dot products.
+
+QAIS_BYTES = QAIS_N // 8
+_QAIS_POPCOUNT8 = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8) if HAS_NUMPY else None
+
+
+def qais_pack(vec):
+    """Bipolar vector → packed 512-byte row."""
+    return np.packbits(vec > 0)
+
+
+def qais_popcount(bits):
+    """Set bits along the last axis of packed rows."""
+    if hasattr(np, 'bitwise_count'):  # NumPy 2.0+
+        return np.bitwise_count(np.ascontiguousarray(bits).view(np.uint64)).sum(axis=-1, dtype=np.int64)
+    return _QAIS_POPCOUNT8[bits].sum(axis=-1, dtype=np.int64)
+
+
+def qais_packed_dot(rows, bits):
+    """Bipolar dot product of each packed row with one packed vector (exact integers)."""
+    return QAIS_N - 2 * qais_popcount(np.bitwise_xor(rows, bits))
+
+
 def qais_normalize_number_units(text):
     result = text
     for abbrev, full in QAIS_UNIT_EXPANSIONS.items():
@@ -1256,132 +2740,446 @@ def qais_text_to_keywords_v5(text):
     return list(set(keywords))
 
 
-def qais_text_to_vector_v5(text):
-    """Text → bundled bipolar vector via keyword extraction + synonym expansion + bigrams."""
+# Keyword vectors: the same few thousand keywords and bigrams recur in every
+# sync, and each qais_seed_to_vector() is a SHA-512 plus a fresh RandomState
+# drawing 4096 samples. Keep them in an LRU, backed by a memmap store so a
+# restarted daemon doesn't redraw them either.
+
+QAIS_KEYWORD_CACHE_ENTRIES = 32768  # packed rows → ~16 MB resident
+QAIS_VECTOR_STORE_SLOTS = 1 << 15  # packed 512-byte rows → ~16 MB on disk
+QAIS_VECTOR_STORE_PROBES = 8
+QAIS_VECTOR_STORE_MAGIC = b'QVS1'
+QAIS_VECTOR_STORE_HEADER = 16
+
+
+class QaisVectorCache:
+    """LRU of keyword → packed vector (qais_pack) over an optional memmap store.
+
+    The store is one file: a header (magic, N, slots), `slots` uint64 keyword
+    hashes (0 = empty), then `slots` rows of np.packbits(vector > 0). Linear
+    probing, no deletes. A row is written before its hash, so a slot is never
+    trusted half-written. A full probe run just skips the disk — the keyword
+    is still served from the LRU. Rows are shared — never mutate.
+    """
+
+    def __init__(self, max_entries=QAIS_KEYWORD_CACHE_ENTRIES):
+        self.max_entries = max_entries
+        self.path = None
+        self.slots = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._keys = None
+        self._rows = None
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.disk_full = 0
+
+    @staticmethod
+    def _header(slots):
+        return struct.pack('<4sIII', QAIS_VECTOR_STORE_MAGIC, QAIS_N, slots, 0)
+
+    def attach(self, path, slots=QAIS_VECTOR_STORE_SLOTS):
+        """Map (creating or resetting if incompatible) the on-disk store."""
+        keys_at = QAIS_VECTOR_STORE_HEADER
+        rows_at = keys_at + slots * 8
+        size = rows_at + slots * (QAIS_N // 8)
+        header = self._header(slots)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fresh = True
+            if os.path.exists(path) and os.path.getsize(path) == size:
+                with open(path, 'rb') as f:
+                    fresh = f.read(len(header)) != header
+            if fresh:
+                with open(path, 'wb') as f:
+                    f.write(header)
+                    f.truncate(size)
+            keys = np.memmap(path, dtype=np.uint64, mode='r+', offset=keys_at, shape=(slots,))
+            rows = np.memmap(path, dtype=np.uint8, mode='r+', offset=rows_at,
+                             shape=(slots, QAIS_N // 8))
+        except (OSError, ValueError) as e:
+            print(f"  QAIS vector store unavailable: {e}", file=sys.stderr)
+            return False
+        with self._lock:
+            self.path, self.slots = path, slots
+            self._keys, self._rows = keys, rows
+        return True
+
+    @staticmethod
+    def _hash(keyword):
+        h = int.from_bytes(hashlib.blake2b(keyword.encode('utf-8'), digest_size=8).digest(), 'little')
+        return h or 1  # 0 marks an empty slot
+
+    def _disk_get(self, h):
+        for i in range(QAIS_VECTOR_STORE_PROBES):
+            slot = (h + i) % self.slots
+            found = int(self._keys[slot])
+            if found == h:
+                return np.array(self._rows[slot])
+            if found == 0:
+                return None
+        return None
+
+    def _disk_put(self, h, bits):
+        for i in range(QAIS_VECTOR_STORE_PROBES):
+            slot = (h + i) % self.slots
+            found = int(self._keys[slot])
+            if found == 0 or found == h:
+                self._rows[slot] = bits
+                self._keys[slot] = h
+                return True
+        self.disk_full += 1
+        return False
+
+    def bits(self, keyword):
+        """Packed qais_seed_to_vector(keyword)."""
+        with self._lock:
+            bits = self._entries.get(keyword)
+            if bits is not None:
+                self._entries.move_to_end(keyword)
+                self.hits += 1
+                return bits
+            h = self._hash(keyword) if self._keys is not None else 0
+            bits = self._disk_get(h) if h else None
+            if bits is not None:
+                self.disk_hits += 1
+            else:
+                self.misses += 1
+        fresh = bits is None
+        if fresh:
+            bits = qais_pack(qais_seed_to_vector(keyword))
+        with self._lock:
+            if fresh and h and self._keys is not None:
+                self._disk_put(h, bits)
+            self._entries[keyword] = bits
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return bits
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            used = int(np.count_nonzero(self._keys)) if self._keys is not None else 0
+            return {
+                'entries': len(self._entries), 'max_entries': self.max_entries,
+                'hits': self.hits, 'disk_hits': self.disk_hits, 'misses': self.misses,
+                'hit_rate': round((self.hits + self.disk_hits) / lookups, 4) if lookups else None,
+                'store': {'path': self.path, 'slots': self.slots, 'used': used,
+                          'full_probes': self.disk_full} if self.path else None,
+            }
+
+
+qais_vector_cache = QaisVectorCache()
+
+
+def qais_text_to_bits(text):
+    """qais_text_to_vector_v5(text), packed."""
     keywords = qais_text_to_keywords_v5(text)
     if not keywords:
-        return qais_seed_to_vector(text)
-    bundle = np.zeros(QAIS_N, dtype=np.float32)
-    for kw in keywords:
-        bundle += qais_seed_to_vector(kw)
-    result = np.sign(bundle)
-    result[result == 0] = 1
-    return result.astype(np.float32)
+        return qais_pack(qais_seed_to_vector(text))
+    rows = np.stack([qais_vector_cache.bits(kw) for kw in keywords])
+    ones = np.unpackbits(rows, axis=1).sum(axis=0, dtype=np.int32)
+    # bundle = 2·ones − K; sign(), with ties going to +1
+    return np.packbits(2 * ones >= len(keywords))
+
+
+def qais_text_to_vector_v5(text):
+    """Text → bundled bipolar vector via keyword extraction + synonym expansion + bigrams."""
+    return np.unpackbits(qais_text_to_bits(text)).astype(np.float32) * 2 - 1
+
+
+# Field files: same layout as QAIS/qais_field_format.py (v1) — header, float32
+# role matrix (row 0 = identity field), string table (roles, stored keys, fact
+# keys) and packed fact bits. Pickle-free and memmap-able. Legacy np.savez
+# fields are still read; the daemon's store() migrates the one it rewrites.
+
+QAIS_FIELD_EXT = '.qfield'
+QAIS_FIELD_MAGIC = b'QFLD'
+QAIS_FIELD_VERSION = 1
+QAIS_FIELD_HEADER = struct.Struct('<4sIIIqIIIIQQQ')  # 64 bytes
+QAIS_FIELD_ALIGN = 64
+
+
+def _qais_aligned(offset):
+    return (offset + QAIS_FIELD_ALIGN - 1) // QAIS_FIELD_ALIGN * QAIS_FIELD_ALIGN
+
+
+def qais_read_field(path):
+    """Field sections {identity_field, role_fields, stored, count, fact_keys, fact_bits}.
+
+    .qfield arrays are views onto an np.memmap — copy what you keep, so the
+    mapping is released (it pins the file against MCP replaces on Windows).
+    A .npz path is read as a legacy np.savez field.
+    """
+    if path.endswith('.npz'):
+        data = np.load(path, allow_pickle=True)
+        fact_keys, fact_bits = [], np.zeros((0, QAIS_BYTES), dtype=np.uint8)
+        if 'fact_keys' in data and 'fact_bits' in data:
+            keys, bits = data['fact_keys'].tolist(), data['fact_bits']
+            if bits.shape == (len(keys), QAIS_BYTES):
+                fact_keys, fact_bits = keys, bits
+        return {
+            'identity_field': data['identity_field'] if 'identity_field' in data else np.zeros(QAIS_N, dtype=np.float32),
+            'role_fields': dict(data['role_fields'].item()) if 'role_fields' in data else {},
+            'stored': data['stored'].tolist() if 'stored' in data else [],
+            'count': int(data['count']) if 'count' in data else 0,
+            'fact_keys': fact_keys,
+            'fact_bits': fact_bits,
+        }
+
+    buf = np.memmap(path, dtype=np.uint8, mode='r')
+    if len(buf) < QAIS_FIELD_HEADER.size:
+        raise ValueError('truncated header')
+    (magic, version, n, _, count, n_roles, n_keys, n_facts, _,
+     matrix_off, strings_off, bits_off) = QAIS_FIELD_HEADER.unpack(bytes(buf[:QAIS_FIELD_HEADER.size]))
+    if magic != QAIS_FIELD_MAGIC or version != QAIS_FIELD_VERSION or n != QAIS_N:
+        raise ValueError(f'unsupported field file (magic {magic!r}, version {version}, N {n})')
+    matrix = buf[matrix_off:matrix_off + (1 + n_roles) * n * 4].view('<f4').reshape(1 + n_roles, n)
+    n_strings = n_roles + n_keys + n_facts
+    bounds = buf[strings_off:strings_off + (n_strings + 1) * 8].view('<u8').tolist()
+    blob_off = strings_off + (n_strings + 1) * 8
+    blob = bytes(buf[blob_off:blob_off + bounds[-1]])
+    strings = [blob[bounds[i]:bounds[i + 1]].decode('utf-8') for i in range(n_strings)]
+    return {
+        'identity_field': matrix[0],
+        'role_fields': {role: matrix[1 + i] for i, role in enumerate(strings[:n_roles])},
+        'stored': strings[n_roles:n_roles + n_keys],
+        'count': count,
+        'fact_keys': strings[n_roles + n_keys:],
+        'fact_bits': buf[bits_off:bits_off + n_facts * QAIS_BYTES].reshape(n_facts, QAIS_BYTES),
+    }
+
+
+def qais_write_field(path, identity_field, role_fields, stored, count, fact_keys, fact_bits):
+    """Write a .qfield atomically (temp file + os.replace)."""
+    roles = list(role_fields)
+    keys = list(stored)
+    strings = [t.encode('utf-8') for t in roles + keys + list(fact_keys)]
+    offsets = np.zeros(len(strings) + 1, dtype='<u8')
+    if strings:
+        offsets[1:] = np.cumsum([len(b) for b in strings])
+    matrix_off = _qais_aligned(QAIS_FIELD_HEADER.size)
+    strings_off = _qais_aligned(matrix_off + (1 + len(roles)) * QAIS_N * 4)
+    bits_off = _qais_aligned(strings_off + offsets.nbytes + int(offsets[-1]))
+    header = QAIS_FIELD_HEADER.pack(QAIS_FIELD_MAGIC, QAIS_FIELD_VERSION, QAIS_N, 0, int(count),
+                                    len(roles), len(keys), len(fact_keys), 0,
+                                    matrix_off, strings_off, bits_off)
+    tmp = f"{path}.tmp"
+    with open(tmp, 'wb') as f:
+        f.write(header)
+        f.seek(matrix_off)
+        f.write(np.asarray(identity_field, dtype='<f4').tobytes())
+        for role in roles:
+            f.write(np.asarray(role_fields[role], dtype='<f4').tobytes())
+        f.seek(strings_off)
+        f.write(offsets.tobytes())
+        f.write(b''.join(strings))
+        f.seek(bits_off)
+        f.write(np.ascontiguousarray(fact_bits, dtype=np.uint8).tobytes())
+    os.replace(tmp, path)
+
+
+def qais_fact_bits(facts, rows, bits):
+    """Packed matrix with one row per fact: persisted rows where present, vectorized otherwise."""
+    out = np.empty((len(facts), QAIS_BYTES), dtype=np.uint8)
+    for i, fact in enumerate(facts):
+        r = rows.get(fact)
+        out[i] = bits[r] if r is not None else qais_text_to_bits(fact)
+    return out
 
 
 class PerspectiveReader:
-    """Read-only access to perspective .npz fields for vine resonance scoring.
+    """Read-only access to perspective fields for vine resonance scoring.
     
     Daemon reads, MCP writes. No concurrent write risk.
-    Loads field fresh each call (no caching) to always see latest MCP writes.
+    Parsed fields (seed list + seed matrix) are cached per perspective and
+    revalidated by (mtime_ns, size) on every call, so MCP and panel writes
+    are still seen on the next check — unchanged files are never re-read.
     """
 
     def __init__(self, bond_root):
         self.perspectives_dir = os.path.join(bond_root, 'data', 'perspectives')
+        self._fields = {}  # perspective → (sig, field_data)
+        self._stack = None  # (field_data tuple, stacked seed bits, offsets)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.loads = 0
 
     def available(self):
         """Check if numpy is available and perspectives dir exists."""
         return HAS_NUMPY and os.path.isdir(self.perspectives_dir)
 
+    def _field_path(self, perspective):
+        """The perspective's .qfield, or its legacy .npz until the MCP migrates it."""
+        field_path = os.path.join(self.perspectives_dir, f"{perspective}{QAIS_FIELD_EXT}")
+        if os.path.exists(field_path):
+            return field_path
+        legacy = os.path.join(self.perspectives_dir, f"{perspective}.npz")
+        return legacy if os.path.exists(legacy) else field_path
+
     def _load_field(self, perspective):
-        """Load perspective .npz and return stored keys. Fresh read each time."""
-        field_path = os.path.join(self.perspectives_dir, f"{perspective}.npz")
-        if not os.path.exists(field_path):
+        """Parsed perspective field: count, seeds [(title, content)], seed_bits.
+
+        Served from cache while the file's stat signature is unchanged.
+        """
+        field_path = self._field_path(perspective)
+        sig = _stat_sig(field_path)
+        if sig is None:
+            with self._lock:
+                self._fields.pop(perspective, None)
             return None, f"No field file for {perspective}"
+        sig = (field_path, sig)
+        with self._lock:
+            cached = self._fields.get(perspective)
+            if cached is not None and cached[0] == sig:
+                self.hits += 1
+                return cached[1], None
         try:
-            data = np.load(field_path, allow_pickle=True)
-            stored = set(data['stored'].tolist())
-            count = int(data['count'])
-            return {'stored': stored, 'count': count}, None
+            data = qais_read_field(field_path)
+            keys = data['stored']
+            count = data['count']
+            rows = {fact: i for i, fact in enumerate(data['fact_keys'])}
+            bits = data['fact_bits']
         except Exception as e:
-            return None, f"Failed to load {perspective}.npz: {e}"
-
-    def check(self, perspective, text):
-        """Score text against perspective's seed field.
-        
-        Replicates perspective_check from qais_mcp_server.py exactly.
-        Returns same format: {perspective, matches, field_count}
-        """
-        if not HAS_NUMPY:
-            return {'error': 'numpy not available'}
+            return None, f"Failed to load {os.path.basename(field_path)}: {e}"
 
-        field_data, err = self._load_field(perspective)
-        if err:
-            return {'error': err}
-
-        if field_data['count'] == 0:
-            return {
-                'perspective': perspective,
-                'matches': [],
-                'field_count': 0,
-                'note': 'Field empty — no seeds stored yet.',
-            }
-
-        text_vec = qais_text_to_vector_v5(text)
-        matches = []
+        seeds = []
         seen = set()
-
-        for key in field_data['stored']:
+        for key in keys:
             parts = key.split('|', 2)
             if len(parts) == 3:
                 title, role, content = parts
                 if title in seen:
                     continue
                 seen.add(title)
-                seed_vec = qais_text_to_vector_v5(content)
-                score = float(np.dot(text_vec, seed_vec) / QAIS_N)
-                matches.append({
-                    'seed': title,
-                    'content_preview': content[:80],
-                    'score': round(score, 4),
-                })
-
-        matches.sort(key=lambda x: -x['score'])
-        return {
-            'perspective': perspective,
-            'matches': matches,
-            'field_count': field_data['count'],
-            'source': 'daemon',
+                seeds.append((title, content))
+        field_data = {
+            'count': count,
+            'seeds': seeds,
+            'seed_bits': qais_fact_bits([content for _, content in seeds], rows, bits),
         }
+        with self._lock:
+            self.loads += 1
+            # Racy-clean guard (see FileCache): a write in the same mtime tick
+            # could keep the signature, so only cache once the file has settled.
+            if time.time() - sig[1][0] / 1e9 > FILE_CACHE_RACY_SECONDS:
+                self._fields[perspective] = (sig, field_data)
+            else:
+                self._fields.pop(perspective, None)
+        return field_data, None
+
+    def stats(self):
+        with self._lock:
+            return {'cached': len(self._fields), 'hits': self.hits, 'loads': self.loads}
+
+    def check(self, perspective, text):
+        """Score text against perspective's seed field.
+        
+        Replicates perspective_check from qais_mcp_server.py exactly.
+        Returns same format: {perspective, matches, field_count}
+        """
+        return self.check_multi([perspective], text)[perspective]
 
     def check_multi(self, perspectives, text):
         """Score text against multiple perspectives in one call.
 
+        The text is vectorized once, and every field's packed seed rows are
+        scored in one XOR/popcount pass over a stacked matrix; row offsets split the
+        scores back per perspective. Cost grows with total seeds, not calls.
         Returns dict of perspective_name → check result.
-        Used by /sync-complete for all armed seeders at once.
+        Used by /sync-complete and /vine-pass-all for all armed seeders at once.
         """
+        if not HAS_NUMPY:
+            return {p: {'error': 'numpy not available'} for p in perspectives}
+
         results = {}
-        for p in perspectives:
-            results[p] = self.check(p, text)
-        return results
+        fields = []
+        for p in dict.fromkeys(perspectives):
+            field_data, err = self._load_field(p)
+            if err:
+                results[p] = {'error': err}
+            elif field_data['count'] == 0:
+                results[p] = {
+                    'perspective': p,
+                    'matches': [],
+                    'field_count': 0,
+                    'note': 'Field empty — no seeds stored yet.',
+                }
+            else:
+                fields.append((p, field_data))
+
+        if fields:
+            matrix, offsets = self._stacked([field_data for _, field_data in fields])
+            scores = qais_packed_dot(matrix, qais_text_to_bits(text)) / QAIS_N
+            for (p, field_data), start, end in zip(fields, offsets, offsets[1:]):
+                matches = [{
+                    'seed': title,
+                    'content_preview': content[:80],
+                    'score': round(float(score), 4),
+                } for (title, content), score in zip(field_data['seeds'], scores[start:end])]
+                matches.sort(key=lambda x: -x['score'])
+                results[p] = {
+                    'perspective': p,
+                    'matches': matches,
+                    'field_count': field_data['count'],
+                    'source': 'daemon',
+                }
+        return {p: results[p] for p in perspectives}
+
+    def _stacked(self, parts):
+        """Packed seed matrices stacked into one array, plus row offsets (len(parts) + 1).
+
+        The last stack is kept while the same cached field objects come back,
+        i.e. until an armed perspective is reloaded or the armed set changes.
+        """
+        if len(parts) == 1:
+            return parts[0]['seed_bits'], [0, len(parts[0]['seeds'])]
+        with self._lock:
+            last = self._stack
+        if last is not None and len(last[0]) == len(parts) and all(a is b for a, b in zip(last[0], parts)):
+            return last[1], last[2]
+        offsets = [0]
+        for field_data in parts:
+            offsets.append(offsets[-1] + len(field_data['seeds']))
+        matrix = np.concatenate([field_data['seed_bits'] for field_data in parts])
+        with self._lock:
+            self._stack = (tuple(parts), matrix, offsets)
+        return matrix, offsets
 
     def store(self, perspective, seed_title, seed_content):
-        """Store a seed into a perspective's .npz field.
+        """Store a seed into a perspective's field file.
 
         Replicates QAISField.store() from qais_core.py:
           identity=seed_title, role='seed', fact=seed_content
-        Creates the field file if it doesn't exist.
+        Creates the field file if it doesn't exist; a legacy .npz field is
+        rewritten as .qfield and kept as .npz.migrated.
         Returns {stored: bool, field_count: int, status: str}.
         """
         if not HAS_NUMPY:
             return {'error': 'numpy not available'}
 
         os.makedirs(self.perspectives_dir, exist_ok=True)
-        field_path = os.path.join(self.perspectives_dir, f"{perspective}.npz")
+        source_path = self._field_path(perspective)
+        field_path = os.path.join(self.perspectives_dir, f"{perspective}{QAIS_FIELD_EXT}")
 
         # Load existing field or create empty
         identity_field = np.zeros(QAIS_N, dtype=np.float32)
         role_fields = {}
         stored = set()
         count = 0
+        fact_rows, fact_bits = {}, None
 
-        if os.path.exists(field_path):
+        if os.path.exists(source_path):
             try:
-                data = np.load(field_path, allow_pickle=True)
-                stored = set(data['stored'].tolist()) if 'stored' in data else set()
-                count = int(data['count']) if 'count' in data else 0
-                identity_field = data['identity_field'] if 'identity_field' in data else np.zeros(QAIS_N, dtype=np.float32)
-                role_fields = dict(data['role_fields'].item()) if 'role_fields' in data else {}
+                data = qais_read_field(source_path)
+                stored = set(data['stored'])
+                count = data['count']
+                identity_field = np.array(data['identity_field'], dtype=np.float32)
+                role_fields = {role: np.array(vec) for role, vec in data['role_fields'].items()}
+                fact_rows = {fact: i for i, fact in enumerate(data['fact_keys'])}
+                fact_bits = np.array(data['fact_bits'])
+                del data  # release the mapping before replacing the file
             except Exception:
                 pass  # start fresh on corrupt file
 
@@ -1399,15 +3197,20 @@ class PerspectiveReader:
         stored.add(key)
         count += 1
 
+        # Seed-vector matrix: reuse persisted rows, vectorize new (or legacy) facts
+        facts = sorted({k.split('|', 2)[2] for k in stored if k.count('|') >= 2})
+
         # Save — same format as QAISField.save()
         try:
-            np.savez(field_path,
-                     identity_field=identity_field,
-                     role_fields=role_fields,
-                     stored=np.array(list(stored), dtype=object),
-                     count=np.array(count))
+            qais_write_field(field_path, identity_field, role_fields, stored, count,
+                             facts, qais_fact_bits(facts, fact_rows, fact_bits))
+            if source_path != field_path:
+                os.replace(source_path, source_path + '.migrated')
         except Exception as e:
             return {'error': f'Failed to save field: {e}'}
+        finally:
+            with self._lock:
+                self._fields.pop(perspective, None)
 
         return {'stored': True, 'field_count': count, 'status': 'stored'}
 
@@ -1532,6 +3335,7 @@ class VineProcessor:
                 json.dumps(tracker, indent=2, ensure_ascii=False),
                 encoding='utf-8'
             )
+            file_cache.invalidate(tracker_path)
             written = True
         except Exception as e:
             changes.append({'error': f'Tracker write failed: {e}'})
@@ -1560,12 +3364,14 @@ class DaemonHeatMap:
     - Persists to state/heatmap.json (survives daemon restart)
     - No class matrix — works for any active entity
     - Snapshot included in /sync-complete
+    - Locked: handler threads touch and read it concurrently
     """
 
     def __init__(self, state_path):
         self.state_file = os.path.join(state_path, 'heatmap.json')
         self.concepts = {}
         self.session_start = time.time()
+        self._lock = threading.RLock()
         self._load()
 
     def _load(self):
@@ -1588,26 +3394,35 @@ class DaemonHeatMap:
     def touch(self, concepts, context=''):
         now = time.time()
         results = []
-        for concept in concepts:
-            concept = concept.lower()
-            if concept not in self.concepts:
-                self.concepts[concept] = {
-                    'count': 0, 'first': now, 'last': 0, 'contexts': [],
-                }
-            entry = self.concepts[concept]
-            entry['count'] += 1
-            entry['last'] = now
-            if context:
-                entry['contexts'].append(context)
-                entry['contexts'] = entry['contexts'][-5:]  # cap at 5
-            results.append({'concept': concept, 'count': entry['count']})
-        self._save()
+        with self._lock:
+            for concept in concepts:
+                concept = concept.lower()
+                if concept not in self.concepts:
+                    self.concepts[concept] = {
+                        'count': 0, 'first': now, 'last': 0, 'contexts': [],
+                    }
+                entry = self.concepts[concept]
+                entry['count'] += 1
+                entry['last'] = now
+                if context:
+                    entry['contexts'].append(context)
+                    entry['contexts'] = entry['contexts'][-5:]  # cap at 5
+                results.append({'concept': concept, 'count': entry['count']})
+            self._save()
         return {'touched': len(results), 'concepts': results}
 
+    def snapshot(self):
+        """concept → (count, last touch, last 3 contexts), copied under the lock."""
+        with self._lock:
+            return {c: (e['count'], e['last'], e.get('contexts', [])[-3:])
+                    for c, e in self.concepts.items()}
+
     def hot(self, top_k=10):
         now = time.time()
         scored = []
-        for concept, entry in self.concepts.items():
+        with self._lock:
+            concepts = list(self.concepts.items())
+        for concept, entry in concepts:
             age_minutes = (now - entry['last']) / 60
             if age_minutes < 5:
                 recency = 2.0
@@ -1631,22 +3446,25 @@ class DaemonHeatMap:
         hot = self.hot(10)
         now = time.time()
         session_mins = (now - self.session_start) / 60
-        cold = [c for c, e in self.concepts.items() if (now - e['last']) / 60 > 15]
+        with self._lock:
+            concepts = list(self.concepts.items())
+        cold = [c for c, e in concepts if (now - e['last']) / 60 > 15]
         hot_names = [h['concept'] for h in hot[:5]]
         return {
             'session_minutes': round(session_mins, 1),
-            'total_concepts': len(self.concepts),
-            'total_touches': sum(e['count'] for e in self.concepts.values()),
+            'total_concepts': len(concepts),
+            'total_touches': sum(e['count'] for _, e in concepts),
             'hot': [{'concept': h['concept'], 'count': h['count'], 'why': h['contexts']} for h in hot],
             'cold': cold[:5],
-            'summary': f"{len(self.concepts)} concepts, hot: {', '.join(hot_names)}",
+            'summary': f"{len(concepts)} concepts, hot: {', '.join(hot_names)}",
         }
 
     def clear(self):
-        count = len(self.concepts)
-        self.concepts.clear()
-        self.session_start = time.time()
-        self._save()
+        with self._lock:
+            count = len(self.concepts)
+            self.concepts.clear()
+            self.session_start = time.time()
+            self._save()
         return {'cleared': count, 'status': 'reset'}
 
 
@@ -1673,14 +3491,6 @@ class GnoiseAuditor:
     3. Recency exemption — recent content scores low naturally (growth, not noise)
     """
 
-    # Identity file patterns by class
-    IDENTITY_PATTERNS = {
-        'perspective': lambda files: [f for f in files if f.startswith('ROOT-') or f.startswith('ROOT_')],
-        'project': lambda files: [f for f in files if f in ('CORE.md',)],
-        'doctrine': None,  # resolved dynamically: entity_name + '.md'
-        'library': lambda files: [],  # no identity files — skip
-    }
-
     def __init__(self, bond_root, state_path, doctrine_path):
         self.bond_root = Path(bond_root)
         self.state_path = Path(state_path)
@@ -1691,7 +3501,7 @@ class GnoiseAuditor:
         """Route findings: entity-local if N valve on, else global."""
         entity_dir = self.doctrine_path / entity_name
         try:
-            config = json.loads((entity_dir / 'entity.json').read_text(encoding='utf-8'))
+            config = file_cache.read_json(entity_dir / 'entity.json')
             gnoise_cfg = config.get('gnoise', {})
             if gnoise_cfg.get('enabled', False) and gnoise_cfg.get('authority') == 'self':
                 local_dir = entity_dir / 'state' / 'gnoise'
@@ -1704,7 +3514,7 @@ class GnoiseAuditor:
     def _load_cell(self, cell_path):
         """Load existing findings. Returns list."""
         try:
-            return json.loads(Path(cell_path).read_text(encoding='utf-8'))
+            return file_cache.read_json(cell_path)
         except Exception:
             return []
 
@@ -1715,25 +3525,12 @@ class GnoiseAuditor:
             json.dumps(findings, indent=2, ensure_ascii=False),
             encoding='utf-8'
         )
+        file_cache.invalidate(cell_path)
 
-    def _identity_files(self, entity_name, entity_class, config=None):
-        """Resolve which files define this entity's identity."""
-        # entity.json override — explicit identity files take priority
-        if config and 'identity_files' in config:
-            return config['identity_files']
-
-        entity_dir = self.doctrine_path / entity_name
-        all_files = [f.name for f in entity_dir.iterdir() if f.is_file() and f.suffix == '.md']
-
-        if entity_class == 'doctrine':
-            # Primary .md = entity_name + '.md'
-            candidate = entity_name + '.md'
-            return [candidate] if candidate in all_files else []
-
-        pattern_fn = self.IDENTITY_PATTERNS.get(entity_class)
-        if pattern_fn is None:
-            return []
-        return pattern_fn(all_files)
+    def _identity_files(self, entity_name):
+        """Resolve which files define this entity's identity (registry, by class)."""
+        record = entity_registry.get(entity_name)
+        return list(record['identity_files']) if record else []
 
     def _recency_exempt(self, filepath, exempt_days=14):
         """Check if file was modified recently enough to be exempt.
@@ -1762,9 +3559,8 @@ class GnoiseAuditor:
         entity_dir = self.doctrine_path / entity_name
 
         # Read entity config
-        try:
-            config = json.loads((entity_dir / 'entity.json').read_text(encoding='utf-8'))
-        except Exception:
+        config = entity_registry.config(entity_name)
+        if not config:
             return {'error': f'Cannot read entity.json for {entity_name}'}
 
         entity_class = config.get('class', 'unknown')
@@ -1772,7 +3568,7 @@ class GnoiseAuditor:
             return {'entity': entity_name, 'skipped': True, 'reason': 'Library class — no identity to audit against'}
 
         # Resolve identity files
-        id_files = self._identity_files(entity_name, entity_class, config=config)
+        id_files = self._identity_files(entity_name)
         if not id_files:
             return {'error': f'No identity files found for {entity_name} ({entity_class}-class)'}
 
@@ -1781,7 +3577,10 @@ class GnoiseAuditor:
         for fname in id_files:
             fpath = entity_dir / fname
             if fpath.is_file():
-                paragraphs = extract_paragraphs(str(fpath))
+                try:
+                    paragraphs = _parse_paragraphs(file_cache.read_text(fpath), entity_name, fname)
+                except Exception:
+                    paragraphs = []
                 for p in paragraphs:
                     identity_tokens.extend(content_stems(p['text']))
 
@@ -1795,9 +3594,8 @@ class GnoiseAuditor:
         skipped_recent = 0
 
         with search_index._lock:
-            for i, p in enumerate(search_index.paragraphs):
-                if p['entity'] != entity_name:
-                    continue
+            for i in search_index.select(entity_name):
+                p = search_index.paragraphs[i]
 
                 # Skip identity files themselves
                 if p['file'] in id_files:
@@ -1931,8 +3729,8 @@ class GnoiseAuditor:
     def scan_all(self, search_index, threshold=0.10, exempt_days=14):
         """Sweep all entities in doctrine directory. Returns consolidated report.
 
-        Iterates every subdirectory in doctrine/, reads entity.json,
-        runs scan() on each. Skips entities that error or are library class.
+        Iterates every entity in the registry (every subdirectory of
+        doctrine/), runs scan() on each. Skips entities that error or are library class.
 
         Returns: {entities: [...results], summary: {total, scanned, findings, skipped}}
         """
@@ -1950,13 +3748,10 @@ class GnoiseAuditor:
         if not self.doctrine_path.is_dir():
             return {'error': 'Doctrine path not found', 'results': []}
 
-        for entry in sorted(self.doctrine_path.iterdir()):
-            if not entry.is_dir():
-                continue
-            if entry.name.startswith('_'):
+        for entity_name in entity_registry.names():
+            if entity_name.startswith('_'):
                 continue
 
-            entity_name = entry.name
             summary['total_entities'] += 1
 
             result = self.scan(entity_name, search_index,
@@ -2299,6 +4094,35 @@ class _RepoSyncRemoved:
 # CM layered narrowing: each call narrows scope, no layer overrides higher.
 # P11 build-for-access: capability manifest tells Claude what's available.
 
+class SyncCursors:
+    """Server-side snapshots behind /sync-complete delta cursors.
+
+    A cursor names what the caller was last sent: stat signatures of entity
+    files and trackers, content hashes of small sections, heatmap (count, last)
+    per concept. Bounded LRU — an evicted cursor just means one full payload.
+    """
+
+    def __init__(self, max_cursors=64):
+        self.max_cursors = max_cursors
+        self._snapshots = OrderedDict()
+        self._lock = threading.Lock()
+
+    def put(self, snapshot):
+        token = uuid.uuid4().hex[:16]
+        with self._lock:
+            self._snapshots[token] = snapshot
+            while len(self._snapshots) > self.max_cursors:
+                self._snapshots.popitem(last=False)
+        return token
+
+    def get(self, token):
+        with self._lock:
+            snapshot = self._snapshots.get(token)
+            if snapshot is not None:
+                self._snapshots.move_to_end(token)
+            return snapshot
+
+
 class PayloadAssembler:
     """Pre-assembled composite payloads for Claude.
     
@@ -2321,16 +4145,17 @@ class PayloadAssembler:
         self.bond_root = Path(bond_root)
         self.state_path = Path(state_path)
         self.doctrine_path = Path(doctrine_path)
+        self.cursors = SyncCursors()
 
     def _read_json(self, path):
         try:
-            return json.loads(Path(path).read_text(encoding='utf-8'))
+            return file_cache.read_json(path)
         except Exception:
             return None
 
     def _read_file(self, path):
         try:
-            return Path(path).read_text(encoding='utf-8')
+            return file_cache.read_text(path)
         except Exception:
             return None
 
@@ -2460,23 +4285,35 @@ class PayloadAssembler:
         return []
 
     def _armed_seeders(self):
-        """Scan for perspective entities with seeding: true."""
-        armed = []
-        if not self.doctrine_path.is_dir():
-            return armed
-        for entity_dir in sorted(self.doctrine_path.iterdir()):
-            if not entity_dir.is_dir():
-                continue
-            config = self._read_json(entity_dir / 'entity.json')
-            if config and config.get('class') == 'perspective' and config.get('seeding'):
-                armed.append({
-                    'entity': entity_dir.name,
-                    'seed_threshold': config.get('seed_threshold', 0.04),
-                    'prune_window': config.get('prune_window', 10),
-                })
-        return armed
-
-    def sync_complete(self, conversation_text=None, session_label='', compact=True):
+        """Perspective entities with seeding: true (registry lookup)."""
+        return [{
+            'entity': record['name'],
+            'seed_threshold': record['seed_threshold'],
+            'prune_window': record['prune_window'],
+        } for record in entity_registry.armed()]
+
+    def _file_sigs(self, entity_path, filenames):
+        """Stat signatures for the files _load_files() would read. No content reads."""
+        entity_path = Path(entity_path)
+        if not entity_path.is_dir():
+            return {}
+        if filenames is None:
+            names = [f.name for f in entity_path.iterdir() if f.is_file()]
+        else:
+            names = set(filenames) | {'entity.json'}
+        sigs = {}
+        for name in sorted(names):
+            sig = _stat_sig(entity_path / name)
+            if sig is not None:
+                sigs[name] = sig
+        return sigs
+
+    @staticmethod
+    def _section_hash(value):
+        return hashlib.sha1(json.dumps(value, sort_keys=True, ensure_ascii=False,
+                                       default=str).encode('utf-8')).hexdigest()
+
+    def sync_complete(self, conversation_text=None, session_label='', compact=True, since=None):
         """One call replaces {Sync} steps 1-5.
         
         Returns everything Claude needs:
@@ -2493,15 +4330,28 @@ class PayloadAssembler:
         
         If conversation_text provided, scores against all armed perspectives.
         If not, returns armed list without scores (Claude can score later).
+
+        Delta sync: every response carries a 'cursor'. Pass it back as
+        since=<cursor> and only what changed is returned — entity files and
+        trackers whose (mtime_ns, size) moved, heatmap concepts touched since,
+        and other sections whose content differs. Deletions come back as
+        tombstones in 'removed'. Unchanged entity files and trackers are not
+        read from disk at all. An unknown/expired cursor, an entity switch or a
+        compact-mode change falls back to the full payload ('delta': False).
         """
         # Steps 1-4: entity state
         active = self._read_json(self.state_path / 'active_entity.json')
         entity_name = active.get('entity') if active else None
         entity_class = active.get('class') if active else None
 
+        base = self.cursors.get(since) if since else None
+        if base and (base['entity'] != entity_name or base['compact'] != compact):
+            base = None
+
         config = self._read_json(self.state_path / 'config.json') or {}
 
         entity_files = {}
+        file_sigs = {}
         deferred = []
         linked_identities = {}  # D12: tiered loading — identity only
         links = []
@@ -2510,7 +4360,16 @@ class PayloadAssembler:
             entity_path = self.doctrine_path / entity_name
             entity_json = self._read_json(entity_path / 'entity.json')
             mandatory_filenames = self._resolve_mandatory(entity_path, entity_json)
-            entity_files = self._load_files(entity_path, mandatory_filenames)
+            file_sigs = self._file_sigs(entity_path, mandatory_filenames)
+            if base:
+                for name, sig in file_sigs.items():
+                    if base['files'].get(name) == sig:
+                        continue  # caller already has this version
+                    content = self._read_file(entity_path / name)
+                    if content is not None:
+                        entity_files[name] = content
+            else:
+                entity_files = self._load_files(entity_path, mandatory_filenames)
             deferred = self._deferred_manifest(entity_path, mandatory_filenames)
             links = self._linked_entities(entity_name)
             # D12: linked entities get entity.json only (tier 1: identity)
@@ -2524,17 +4383,21 @@ class PayloadAssembler:
         armed = self._armed_seeders()
 
         vine = {}
+        tracker_sigs = {}
+        resonance = {}
+        if conversation_text and perspective_reader.available():
+            resonance = perspective_reader.check_multi(
+                [seeder['entity'] for seeder in armed], conversation_text)
         for seeder in armed:
             p_name = seeder['entity']
-            v = {
-                'config': seeder,
-                'tracker': self._read_json(
-                    self.doctrine_path / p_name / 'seed_tracker.json') or {},
-            }
+            tracker_path = self.doctrine_path / p_name / 'seed_tracker.json'
+            tracker_sigs[p_name] = _stat_sig(tracker_path)
+            v = {'config': seeder}
             # Resonance scores + tracker updates (daemon-local, no MCP)
             # Phase 2-3: daemon scores. Phase 4: daemon writes tracker.
-            if conversation_text and perspective_reader.available():
-                v['resonance'] = perspective_reader.check(p_name, conversation_text)
+            if p_name in resonance:
+                v['tracker'] = self._read_json(tracker_path) or {}
+                v['resonance'] = resonance[p_name]
                 # Phase 4: daemon processes tracker bookkeeping
                 vine_result = vine_processor.process(
                     p_name, v['resonance'], v['tracker'], seeder, session_label)
@@ -2544,7 +4407,10 @@ class PayloadAssembler:
                     'thresholds': vine_result['thresholds'],
                     'written': vine_result['written'],
                 }
+                tracker_sigs[p_name] = _stat_sig(tracker_path)  # just rewritten
             else:
+                if not base or base['trackers'].get(p_name) != tracker_sigs[p_name]:
+                    v['tracker'] = self._read_json(tracker_path) or {}
                 v['resonance'] = None
             vine[p_name] = v
 
@@ -2610,6 +4476,20 @@ class PayloadAssembler:
         else:
             _handoff_warning = None
 
+        # Small sections are compared by content hash, big ones by stat above
+        section_hashes = {k: self._section_hash(v) for k, v in (
+            ('config', config), ('deferred_manifest', deferred), ('links', links),
+            ('linked_identities', linked_identities), ('armed_seeders', armed),
+            ('handoff', handoff), ('handoff_warning', _handoff_warning))}
+        # One snapshot for both passes — /heatmap-touch may add concepts meanwhile
+        concepts = daemon_heatmap.snapshot()
+        heat = {c: (count, last) for c, (count, last, _) in concepts.items()}
+
+        cursor = self.cursors.put({
+            'entity': entity_name, 'compact': compact, 'files': file_sigs,
+            'trackers': tracker_sigs, 'sections': section_hashes, 'heatmap': heat,
+        })
+
         _result = {
             'active_entity': entity_name,
             'active_class': entity_class,
@@ -2621,13 +4501,38 @@ class PayloadAssembler:
             'armed_seeders': armed,
             'vine': vine,
             'handoff': handoff,
-            'heatmap': daemon_heatmap.for_chunk(),
+            'heatmap': None if base else daemon_heatmap.for_chunk(),  # deltas send heatmap_changes
             # A3/T1-F1: capabilities removed — dead weight (~300 tokens/sync). Available via /status.
             'daemon_version': '3.5.0',
             'compact': compact,  # D27: signal which mode was used
+            'cursor': cursor,
+            'delta': bool(base),
         }
         if _handoff_warning:
             _result['handoff_warning'] = _handoff_warning
+
+        if base:
+            _result['since'] = since
+            unchanged = [k for k in section_hashes if base['sections'].get(k) == section_hashes[k]]
+            for key in unchanged:
+                _result.pop(key, None)
+            _result.pop('heatmap')
+            if 'handoff_warning' not in unchanged:
+                _result['handoff_warning'] = _handoff_warning  # None = warning cleared
+            now = time.time()
+            _result['heatmap_changes'] = {
+                c: {'count': count, 'last_touch_mins': round((now - last) / 60, 1), 'contexts': contexts}
+                for c, (count, last, contexts) in concepts.items()
+                if base['heatmap'].get(c) != heat[c]
+            }
+            _result['unchanged'] = unchanged
+            _result['removed'] = {
+                'entity_files': sorted(set(base['files']) - set(file_sigs)),
+                'trackers': sorted(set(base['trackers']) - set(tracker_sigs)),
+                'heatmap': sorted(set(base['heatmap']) - set(heat)),
+            }
+        elif since:
+            _result['cursor_reset'] = True  # unknown cursor, or entity/mode changed
         return _result
 
     def sync_payload(self):
@@ -2780,12 +4685,8 @@ class PayloadAssembler:
             })
 
         # 3. Empty CORE check (project entities)
-        for entity_dir in sorted(self.doctrine_path.iterdir()):
-            if not entity_dir.is_dir():
-                continue
-            config = self._read_json(entity_dir / 'entity.json')
-            if not config or config.get('class') != 'project':
-                continue
+        for project_name in entity_registry.by_class('project'):
+            entity_dir = self.doctrine_path / project_name
             core_path = entity_dir / 'CORE.md'
             if not core_path.is_file():
                 warnings.append({
@@ -2829,6 +4730,68 @@ class PayloadAssembler:
             'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
         }
 
+    # ── Conditional GET (ETags) ──
+    # Each payload's ETag covers exactly the files it is assembled from.
+    # Stat only — if nothing on disk moved, the caller's copy is current.
+
+    def _entity_dirs(self):
+        try:
+            return sorted(e for e in self.doctrine_path.iterdir() if e.is_dir())
+        except OSError:
+            return []
+
+    def _registry_sigs(self, also=()):
+        """doctrine/ listing + every entity.json (+ named per-entity files)."""
+        sigs = [(str(self.doctrine_path), _stat_sig(self.doctrine_path))]
+        for entity_dir in self._entity_dirs():
+            for name in ('entity.json',) + tuple(also):
+                p = entity_dir / name
+                sigs.append((str(p), _stat_sig(p)))
+        return sigs
+
+    def etag(self, payload, name=None):
+        """Stat-only ETag for a composite payload. None if payload is unknown."""
+        if payload == 'sync-complete':
+            active = self._read_json(self.state_path / 'active_entity.json')
+            entity_name = active.get('entity') if active else None
+            paths = [self.state_path / f for f in
+                     ('active_entity.json', 'config.json', 'handoff.md', 'heatmap.json')]
+            sigs = self._registry_sigs(also=('seed_tracker.json',))
+            if entity_name:
+                entity_path = self.doctrine_path / entity_name
+                sigs.extend(_dir_sigs(entity_path))
+                paths.append(entity_path / 'state' / 'handoff.md')
+            # Heat labels and minutes are time-derived; revalidate at least once a minute
+            minute = int(time.time() // 60)
+            return stat_etag(payload, paths=paths, sigs=sigs, extra=(entity_name, name, minute))
+
+        if payload == 'enter-payload':
+            entity_path = self.doctrine_path / name
+            sigs = _dir_sigs(entity_path)
+            config = self._read_json(entity_path / 'entity.json') or {}
+            for linked_name in config.get('links', []):
+                sigs.extend(_dir_sigs(self.doctrine_path / linked_name))
+            return stat_etag(payload, sigs=sigs, extra=(name,))
+
+        if payload == 'vine-data':
+            return stat_etag(payload, sigs=_dir_sigs(self.doctrine_path / name), extra=(name,))
+
+        if payload == 'obligations':
+            handoff_path = self.state_path / 'handoff.md'
+            handoff_sig = _stat_sig(handoff_path)
+            # Time-derived fields: a stale handoff reports its age to 0.1h and the
+            # payload carries a timestamp; revalidate at least once a minute
+            age = None
+            if handoff_sig:
+                age_hours = (time.time() - handoff_sig[0] / 1e9) / 3600
+                age = round(age_hours, 1) if age_hours > 48 else None
+            minute = int(time.time() // 60)
+            paths = [self.state_path / 'active_entity.json', self.state_path / 'config.json', handoff_path]
+            return stat_etag(payload, paths=paths, sigs=self._registry_sigs(also=('CORE.md',)),
+                             extra=(age, minute))
+
+        return None
+
 
 payloads = None  # initialized in __main__
 
@@ -2838,6 +4801,62 @@ payloads = None  # initialized in __main__
 index = None  # initialized in __main__
 watcher = None  # initialized in __main__
 
+# Response encoding — composite payloads carry whole files, so bodies get big.
+# Pretty JSON only for browsers (or ?pretty=true); everyone else gets compact.
+COMPRESS_MIN_BYTES = 1024  # below this, gzip overhead outweighs the savings
+STREAM_CHUNK_BYTES = 64 * 1024  # once this much output is pending, stream it
+ENCODINGS = ('gzip', 'deflate')
+
+
+class TransferMetrics:
+    """Byte counts before and after compression, per encoding and per endpoint.
+
+    Thread-safe — every handler thread records into the same instance.
+    Served by GET /metrics.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started_at = time.strftime('%Y-%m-%dT%H:%M:%S')
+        self.responses = 0
+        self.streamed = 0
+        self.raw_bytes = 0
+        self.sent_bytes = 0
+        self.by_encoding = defaultdict(lambda: {'responses': 0, 'raw_bytes': 0, 'sent_bytes': 0})
+        self.by_path = defaultdict(lambda: {'responses': 0, 'raw_bytes': 0, 'sent_bytes': 0})
+
+    def record(self, path, encoding, raw_bytes, sent_bytes, streamed=False):
+        with self._lock:
+            self.responses += 1
+            self.raw_bytes += raw_bytes
+            self.sent_bytes += sent_bytes
+            if streamed:
+                self.streamed += 1
+            for bucket in (self.by_encoding[encoding], self.by_path[path or '/']):
+                bucket['responses'] += 1
+                bucket['raw_bytes'] += raw_bytes
+                bucket['sent_bytes'] += sent_bytes
+
+    def snapshot(self):
+        def ratio(raw, sent):
+            return round(sent / raw, 4) if raw else None
+        with self._lock:
+            return {
+                'since': self.started_at,
+                'responses': self.responses,
+                'streamed': self.streamed,
+                'raw_bytes': self.raw_bytes,
+                'sent_bytes': self.sent_bytes,
+                'ratio': ratio(self.raw_bytes, self.sent_bytes),
+                'by_encoding': {k: {**v, 'ratio': ratio(v['raw_bytes'], v['sent_bytes'])}
+                                for k, v in self.by_encoding.items()},
+                'by_path': {k: {**v, 'ratio': ratio(v['raw_bytes'], v['sent_bytes'])}
+                            for k, v in sorted(self.by_path.items(), key=lambda x: -x[1]['raw_bytes'])},
+            }
+
+
+transfer_metrics = TransferMetrics()
+
 
 class SearchHandler(BaseHTTPRequestHandler):
 
@@ -2857,19 +4876,16 @@ class SearchHandler(BaseHTTPRequestHandler):
             mode = params.get('mode', ['auto'])[0]
             if mode not in ('auto', 'explore', 'retrieve'):
                 mode = 'auto'
+            doc_types = [t for t in params.get('type', [''])[0].split(',') if t] or None
+            if doc_types and any(t not in DOC_TYPES for t in doc_types):
+                self._json(400, {'error': f"Unknown type. Options: {', '.join(DOC_TYPES)}"})
+                return
             if scope_override == 'all':
-                all_entities = []
-                try:
-                    for entry in Path(DOCTRINE_PATH).iterdir():
-                        if entry.is_dir():
-                            all_entities.append(entry.name)
-                except Exception:
-                    pass
-                temp = SearchIndex()
-                temp.build(force_scope=all_entities)
-                result = temp.search(query, top_n=top_n, entity_filter=entity_filter, mode=mode)
+                all_entities = entity_registry.names()
+                temp = index.with_scope(all_entities)
+                result = temp.search(query, top_n=top_n, entity_filter=entity_filter, mode=mode, doc_types=doc_types)
             else:
-                result = index.search(query, top_n=top_n, entity_filter=entity_filter, mode=mode)
+                result = index.search(query, top_n=top_n, entity_filter=entity_filter, mode=mode, doc_types=doc_types)
             self._json(200, result)
 
         elif path == '/load':
@@ -2880,15 +4896,14 @@ class SearchHandler(BaseHTTPRequestHandler):
                 return
             file_path = unquote(file_path)
             corpus_name = params.get('name', [None])[0]
-            watcher.pause()
-            stats = index.build_external(file_path, corpus_name)
-            if 'error' in stats:
-                watcher.resume()
-                self._json(400, stats)
-            else:
-                ts = time.strftime('%H:%M:%S')
-                print(f"  [{ts}] External corpus loaded: {stats['paragraphs']} paragraphs from {stats.get('files', '?')} files ({stats['build_time_ms']}ms)")
-                self._json(200, {'loaded': True, 'watcher': 'paused', **stats})
+            if params.get('wait', ['false'])[0].lower() == 'true':
+                result = load_corpus_job(file_path, corpus_name, BuildProgress())
+                self._json(400 if 'error' in result else 200, result)
+                return
+            job_id = build_jobs.submit('load', lambda progress: load_corpus_job(file_path, corpus_name, progress),
+                                       path=file_path)
+            self._json(202, {'accepted': True, 'job_id': job_id, 'status': 'running',
+                             'poll': f'/build-status?job_id={job_id}'})
 
         elif path == '/unload':
             # Return to doctrine index — resumes watcher
@@ -2898,10 +4913,60 @@ class SearchHandler(BaseHTTPRequestHandler):
             self._json(200, {'unloaded': True, 'watcher': 'resumed'})
 
         elif path == '/status':
-            self._json(200, index.status())
+            self._json(200, {**index.status(), 'file_cache': file_cache.stats(),
+                             'token_cache': token_cache.stats(),
+                             'qais_vectors': qais_vector_cache.stats() if HAS_NUMPY else None,
+                             'perspective_fields': perspective_reader.stats() if perspective_reader else None,
+                             'registry': entity_registry.status(), 'watcher': watcher.status()})
+        elif path == '/metrics':
+            self._json(200, {'transfer': transfer_metrics.snapshot()})
+        elif path == '/search-federated':
+            query = params.get('q', [''])[0]
+            if not query:
+                self._json(400, {'error': 'Missing ?q= parameter'})
+                return
+            top_n = int(params.get('top', ['10'])[0])
+            sources = [x for x in params.get('sources', [','.join(FEDERATED_SOURCES)])[0].split(',') if x]
+            unknown = [x for x in sources if x not in FEDERATED_SOURCES]
+            if unknown:
+                self._json(400, {'error': f"Unknown sources: {', '.join(unknown)}. Options: {', '.join(FEDERATED_SOURCES)}"})
+                return
+            budget_ms = float(params.get('budget_ms', [str(FEDERATED_BUDGET_MS)])[0])
+            mode = params.get('mode', ['auto'])[0]
+            if mode not in ('auto', 'explore', 'retrieve'):
+                mode = 'auto'
+            self._json(200, federated_search(query, sources, top_n=top_n, budget_ms=budget_ms, mode=mode))
+        elif path == '/suggest':
+            prefix = params.get('prefix', [''])[0].strip()
+            if not prefix:
+                self._json(400, {'error': 'Missing ?prefix= parameter'})
+                return
+            limit = int(params.get('limit', ['10'])[0])
+            # Complete the word being typed — earlier words are the user's business
+            prefix = prefix.split()[-1]
+            self._json(200, index.suggest(prefix, limit=limit))
         elif path == '/reindex':
-            stats = index.build()
-            self._json(200, {'reindexed': True, **stats})
+            if params.get('wait', ['false'])[0].lower() == 'true':
+                result = reindex_job(BuildProgress())
+                self._json(500 if 'error' in result else 200, result)
+                return
+            job_id = build_jobs.submit('reindex', reindex_job)
+            self._json(202, {'accepted': True, 'job_id': job_id, 'status': 'running',
+                             'poll': f'/build-status?job_id={job_id}'})
+        elif path == '/build-status':
+            job_id = params.get('job_id', [''])[0]
+            if not job_id:
+                self._json(200, {'jobs': build_jobs.list()})
+                return
+            result = build_jobs.job_status(job_id)
+            self._json(404 if 'error' in result else 200, result)
+        elif path == '/build-cancel':
+            job_id = params.get('job_id', [''])[0]
+            if not job_id:
+                self._json(400, {'error': 'Missing ?job_id= parameter'})
+                return
+            result = build_jobs.cancel(job_id)
+            self._json(404 if 'error' in result else 200, result)
         elif path == '/duplicates':
             threshold = float(params.get('threshold', ['0.75'])[0])
             top_n = int(params.get('top', ['20'])[0])
@@ -2986,8 +5051,11 @@ class SearchHandler(BaseHTTPRequestHandler):
         # ── File Operations (Cold Water) ──
         elif path == '/manifest':
             entity = params.get('entity', [None])[0]
+            etag = file_ops.manifest_etag(entity_filter=entity)
+            if self._not_modified(etag):
+                return
             result = file_ops.manifest(entity_filter=entity)
-            self._json(200, result)
+            self._json(200, result, etag=etag)
 
         elif path == '/read':
             file_path = params.get('path', [''])[0]
@@ -3030,8 +5098,13 @@ class SearchHandler(BaseHTTPRequestHandler):
         elif path == '/sync-complete':
             # GET: entity state + armed seeders + trackers (no vine scores)
             # POST with {"text": "..."}: adds vine resonance scores
-            result = payloads.sync_complete(conversation_text=None, compact=True)  # D27
-            self._json(200, result)
+            # ?since=<cursor>: delta against what that cursor was sent
+            since = params.get('since', [None])[0]
+            etag = payloads.etag('sync-complete', since)
+            if self._not_modified(etag):
+                return
+            result = payloads.sync_complete(conversation_text=None, compact=True, since=since)  # D27
+            self._json(200, result, etag=etag)
 
         elif path == '/sync-payload':
             result = payloads.sync_payload()
@@ -3042,26 +5115,35 @@ class SearchHandler(BaseHTTPRequestHandler):
             if not entity:
                 self._json(400, {'error': 'Missing ?entity= parameter'})
                 return
+            etag = payloads.etag('enter-payload', entity)
+            if self._not_modified(etag):
+                return
             result = payloads.enter_payload(entity)
             if 'error' in result:
                 self._json(400, result)
             else:
-                self._json(200, result)
+                self._json(200, result, etag=etag)
 
         elif path == '/vine-data':
             perspective = params.get('perspective', [None])[0]
             if not perspective:
                 self._json(400, {'error': 'Missing ?perspective= parameter'})
                 return
+            etag = payloads.etag('vine-data', perspective)
+            if self._not_modified(etag):
+                return
             result = payloads.vine_data(perspective)
             if 'error' in result:
                 self._json(400, result)
             else:
-                self._json(200, result)
+                self._json(200, result, etag=etag)
 
         elif path == '/obligations':
+            etag = payloads.etag('obligations')
+            if self._not_modified(etag):
+                return
             result = payloads.obligations()
-            self._json(200, result)
+            self._json(200, result, etag=etag)
 
         # ── Daemon Heat Map (bypasses class matrix) ──
         elif path == '/heatmap-touch':
@@ -3168,7 +5250,7 @@ class SearchHandler(BaseHTTPRequestHandler):
                 self._json(200, {'loaded': True, **sla_index.status()})
 
         else:
-            self._json(404, {'error': 'Endpoints: /search, /load, /unload, /duplicates, /orphans, /coverage, /similarity, /gnoise, /gnoise-cell, /gnoise-triage, /gnoise-all, /exec-status, /status, /reindex, /manifest, /read, /write, /copy, /export, /sync-complete, /enter-payload, /vine-data, /obligations, /heatmap-touch, /heatmap-hot, /heatmap-chunk, /heatmap-clear, /resonance-test, /resonance-multi, /sla-load, /sla-search, /sla-unload, /sla-status'})
+            self._json(404, {'error': 'Endpoints: /search, /search-federated, /suggest, /load, /unload, /duplicates, /orphans, /coverage, /similarity, /gnoise, /gnoise-cell, /gnoise-triage, /gnoise-all, /exec-status, /status, /metrics, /reindex, /build-status, /build-cancel, /manifest, /read, /write, /copy, /export, /sync-complete, /enter-payload, /vine-data, /obligations, /heatmap-touch, /heatmap-hot, /heatmap-chunk, /heatmap-clear, /resonance-test, /resonance-multi, /sla-load, /sla-search, /sla-unload, /sla-status'})
 
     def do_POST(self):
         parsed = urlparse(self.path)
@@ -3187,7 +5269,9 @@ class SearchHandler(BaseHTTPRequestHandler):
                 self._json(400, {'error': 'Missing "text" in body (conversation context for vine scoring)'})
                 return
             compact = body.get('compact', True)  # D27: default compact
-            result = payloads.sync_complete(conversation_text=text, session_label=session_label, compact=compact)
+            since = body.get('since')  # delta sync cursor from a previous response
+            result = payloads.sync_complete(conversation_text=text, session_label=session_label,
+                                            compact=compact, since=since)
             self._json(200, result)
 
         elif path == '/append':
@@ -3427,6 +5511,7 @@ class SearchHandler(BaseHTTPRequestHandler):
                 except Exception as e:
                     self._json(500, {'error': f'Delete failed: {e}'})
                     return
+                generation = file_ops._changed(resolved)
 
                 file_ops._log('DELETE', file_path, f"{file_size} bytes, backup={bak_path.name}")
                 result = {
@@ -3434,6 +5519,7 @@ class SearchHandler(BaseHTTPRequestHandler):
                     'operation': 'delete',
                     'deleted_size': file_size,
                     'backup': bak_path.name,
+                    'index_generation': generation,
                 }
 
             else:
@@ -3504,28 +5590,32 @@ class SearchHandler(BaseHTTPRequestHandler):
                 self._json(500, {'error': 'numpy not available or perspectives dir not ready'})
                 return
 
-            # Read entity config → links array
-            entity_config = payloads._read_json(payloads.doctrine_path / entity_name / 'entity.json')
-            if not entity_config:
+            # Registry: entity config → links array
+            if not entity_registry.config(entity_name):
                 self._json(400, {'error': f'Entity not found: {entity_name}'})
                 return
-            links = entity_config.get('links', [])
+            links = entity_registry.links(entity_name)
 
             # For each linked perspective, check if seeding: true
-            perspectives = {}
-            armed_count = 0
-            total_matches = 0
+            armed_links = []
             for linked_name in links:
-                linked_config = payloads._read_json(payloads.doctrine_path / linked_name / 'entity.json')
-                if not linked_config:
+                linked = entity_registry.get(linked_name)
+                if not linked or not linked['config']:
                     continue
-                if linked_config.get('class') != 'perspective':
+                if linked['class'] != 'perspective':
                     continue
-                if not linked_config.get('seeding'):
+                if not linked['seeding']:
                     continue
-                # Armed seeder — run resonance check
+                armed_links.append((linked_name, linked['config']))
+
+            # Armed seeders — one batched resonance pass
+            checks = perspective_reader.check_multi([name for name, _ in armed_links], text)
+            perspectives = {}
+            armed_count = 0
+            total_matches = 0
+            for linked_name, linked_config in armed_links:
                 armed_count += 1
-                check_result = perspective_reader.check(linked_name, text)
+                check_result = checks[linked_name]
                 match_count = len(check_result.get('matches', []))
                 perspectives[linked_name] = {
                     'matches': check_result.get('matches', []),
@@ -3559,14 +5649,124 @@ class SearchHandler(BaseHTTPRequestHandler):
         else:
             self._json(404, {'error': 'POST endpoints: /sync-complete, /write, /append, /replace, /exec, /file-op, /perspective-store, /vine-pass-all'})
 
-    def _json(self, code, data):
-        body = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
-        self.send_response(code)
-        self.send_header('Content-Type', 'application/json; charset=utf-8')
+    def _accepted_encoding(self):
+        """Pick gzip or deflate from Accept-Encoding (q=0 excluded). None = identity."""
+        accepted = {}
+        for part in self.headers.get('Accept-Encoding', '').split(','):
+            fields = part.strip().split(';')
+            name = fields[0].strip().lower()
+            q = 1.0
+            for f in fields[1:]:
+                f = f.strip()
+                if f.startswith('q='):
+                    try:
+                        q = float(f[2:])
+                    except ValueError:
+                        q = 0.0
+            accepted[name] = q
+        for enc in ENCODINGS:
+            if accepted.get(enc, accepted.get('*', 0.0)) > 0:
+                return enc
+        return None
+
+    def _wants_pretty(self):
+        """?pretty=true|false wins; otherwise pretty only for browsers."""
+        flag = parse_qs(urlparse(self.path).query).get('pretty', [None])[0]
+        if flag is not None:
+            return flag.lower() in ('1', 'true', 'yes')
+        return 'Mozilla' in self.headers.get('User-Agent', '')
+
+    def _not_modified(self, etag):
+        """Send 304 if If-None-Match already names this ETag (weak comparison)."""
+        inm = self.headers.get('If-None-Match')
+        if not inm or not etag:
+            return False
+        def opaque(tag):
+            tag = tag.strip()
+            return tag[2:] if tag.startswith('W/') else tag
+        if inm.strip() != '*' and opaque(etag) not in [opaque(t) for t in inm.split(',')]:
+            return False
+        self.send_response(304)
+        self.send_header('ETag', etag)
         self.send_header('Access-Control-Allow-Origin', '*')
-        self.send_header('Content-Length', str(len(body)))
         self.end_headers()
-        self.wfile.write(body)
+        transfer_metrics.record(urlparse(self.path).path.rstrip('/'), 'not_modified', 0, 0)
+        return True
+
+    def _json(self, code, data, etag=None):
+        """Serialize and send a JSON response.
+
+        Compact unless the client is a browser. Compressed when the client
+        accepts gzip/deflate and the body passes COMPRESS_MIN_BYTES. Encoding
+        is incremental: once STREAM_CHUNK_BYTES of output is pending, headers
+        go out without Content-Length and the rest streams (HTTP/1.0 close-
+        delimited), so big payloads never sit fully serialized in memory twice.
+        """
+        if self._wants_pretty():
+            encoder = json.JSONEncoder(indent=2, ensure_ascii=False)
+        else:
+            encoder = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False)
+        encoding = self._accepted_encoding()
+
+        compressor = None
+        prefix = []  # raw bytes held back until we know compression is worth it
+        pending = []
+        pending_len = 0
+        raw_bytes = 0
+        sent_bytes = 0
+        streaming = False
+
+        def start_headers(content_length=None):
+            self.send_response(code)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.send_header('Vary', 'Accept-Encoding')
+            if compressor:
+                self.send_header('Content-Encoding', encoding)
+            if etag:
+                self.send_header('ETag', etag)
+            if content_length is not None:
+                self.send_header('Content-Length', str(content_length))
+            self.end_headers()
+
+        for piece in encoder.iterencode(data):
+            chunk = piece.encode('utf-8')
+            raw_bytes += len(chunk)
+            if encoding and compressor is None:
+                prefix.append(chunk)
+                if raw_bytes < COMPRESS_MIN_BYTES:
+                    continue
+                wbits = 31 if encoding == 'gzip' else 15  # 31 = gzip wrapper, 15 = zlib
+                compressor = zlib.compressobj(6, zlib.DEFLATED, wbits)
+                chunk = b''.join(prefix)
+                prefix = []
+            out = compressor.compress(chunk) if compressor else chunk
+            if out:
+                pending.append(out)
+                pending_len += len(out)
+            if pending_len >= STREAM_CHUNK_BYTES:
+                if not streaming:
+                    start_headers()
+                    streaming = True
+                self.wfile.write(b''.join(pending))
+                sent_bytes += pending_len
+                pending, pending_len = [], 0
+
+        if prefix:  # never crossed the threshold — send identity
+            pending.extend(prefix)
+            pending_len += sum(len(p) for p in prefix)
+        if compressor:
+            tail = compressor.flush()
+            pending.append(tail)
+            pending_len += len(tail)
+
+        if not streaming:
+            start_headers(content_length=pending_len)
+        self.wfile.write(b''.join(pending))
+        sent_bytes += pending_len
+        transfer_metrics.record(urlparse(self.path).path.rstrip('/'),
+                                encoding if compressor else 'identity',
+                                raw_bytes, sent_bytes, streamed=streaming)
 
     def log_message(self, format, *args):
         if args and '404' in str(args[0]):
@@ -3610,7 +5810,12 @@ if __name__ == '__main__':
             STATE_PATH = os.path.join(BOND_ROOT, 'state')
 
     # Initialize all objects with (possibly overridden) paths
+    token_cache.load(os.path.join(STATE_PATH, TOKEN_CACHE_FILE))
+    atexit.register(token_cache.save, force=True)
+    entity_registry = EntityRegistry(DOCTRINE_PATH)
     file_ops = FileOps(BOND_ROOT, STATE_PATH, DOCTRINE_PATH)
+    if HAS_NUMPY and '--no-vector-store' not in sys.argv:
+        qais_vector_cache.attach(os.path.join(BOND_ROOT, 'data', 'qais_vectors', 'daemon.bin'))
     perspective_reader = PerspectiveReader(BOND_ROOT)
     vine_processor = VineProcessor(DOCTRINE_PATH)
     daemon_heatmap = DaemonHeatMap(STATE_PATH)
@@ -3619,7 +5824,17 @@ if __name__ == '__main__':
     ps_executor = PowerShellExecutor(BOND_ROOT) if PowerShellExecutor else None
     index = SearchIndex()
     sla_index = SearchIndex()  # D28: secondary index for code navigation
-    watcher = FileWatcher(index)
+    quiet, max_delay = REINDEX_QUIET_SECONDS, REINDEX_MAX_DELAY
+    if '--debounce' in sys.argv:
+        di = sys.argv.index('--debounce')
+        if di + 1 < len(sys.argv):
+            quiet = float(sys.argv[di + 1])
+    if '--max-delay' in sys.argv:
+        mi = sys.argv.index('--max-delay')
+        if mi + 1 < len(sys.argv):
+            max_delay = float(sys.argv[mi + 1])
+    watcher = FileWatcher(index, backend='poll' if '--poll' in sys.argv else 'auto',
+                          quiet=quiet, max_delay=max_delay)
 
     port = DEFAULT_PORT
     if '--port' in sys.argv:
@@ -3656,6 +5871,8 @@ if __name__ == '__main__':
     print(f"     GET http://localhost:{port}/search?q=your+query")
     print(f"     GET http://localhost:{port}/search?q=query&mode=retrieve")
     print(f"     GET http://localhost:{port}/search?q=query&scope=all")
+    print(f"     GET http://localhost:{port}/search-federated?q=query")
+    print(f"     GET http://localhost:{port}/suggest?prefix=pres")
     print(f"     GET http://localhost:{port}/load?path=C:/texts/psalms.md")
     print(f"     GET http://localhost:{port}/unload")
     print(f"     GET http://localhost:{port}/duplicates")
@@ -3667,7 +5884,9 @@ if __name__ == '__main__':
     print(f"     GET http://localhost:{port}/gnoise-triage?entity=P11&indices=0,1&action=fixed")
     print(f"     GET http://localhost:{port}/gnoise-all")
     print(f"     GET http://localhost:{port}/status")
+    print(f"     GET http://localhost:{port}/metrics")
     print(f"     GET http://localhost:{port}/reindex")
+    print(f"     GET http://localhost:{port}/build-status?job_id=...")
     print()
     print(f"   File Ops (Cold Water):")
     print(f"     GET  http://localhost:{port}/manifest")
@@ -3712,7 +5931,10 @@ if __name__ == '__main__':
     try:
         server = ThreadedServer(('127.0.0.1', port), SearchHandler)
         print(f"\U0001f525 Search daemon listening on http://localhost:{port}")
-        print(f"   Watching for file changes every {WATCH_INTERVAL}s")
+        if watcher.backend == 'inotify':
+            print(f"   Watching for file changes via inotify ({watcher.status()['watches']} dirs)")
+        else:
+            print(f"   Watching for file changes every {WATCH_INTERVAL}s")
         print()
         server.serve_forever()
     except KeyboardInterrupt:
@@ -0,0 +1,10 @@
+"""Shared pytest setup: put the daemon, QAIS and panel modules on sys.path."""
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for sub in ('search_daemon', 'QAIS', 'panel'):
+    path = os.path.join(ROOT, sub)
+    if path not in sys.path:
+        sys.path.insert(0, path)
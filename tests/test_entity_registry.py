@@ -0,0 +1,103 @@
+"""EntityRegistry: stat-signature refresh, link graph and class index."""
+
+import json
+import os
+
+import pytest
+
+import bond_search as bs
+
+
+def _entity(doctrine, name, config=None, files=()):
+    d = doctrine / name
+    d.mkdir(exist_ok=True)
+    if config is not None:
+        (d / 'entity.json').write_text(json.dumps(config), encoding='utf-8')
+    for f in files:
+        (d / f).write_text(f'# {f}\n', encoding='utf-8')
+    return d
+
+
+def _touch_later(path, seconds=5):
+    """Move an mtime forward so the change is visible at any timestamp resolution."""
+    t = os.stat(path).st_mtime + seconds
+    os.utime(path, (t, t))
+
+
+@pytest.fixture
+def doctrine(tmp_path):
+    d = tmp_path / 'doctrine'
+    d.mkdir()
+    _entity(d, 'P11-Plumber', {'class': 'perspective', 'seeding': True, 'links': ['GUIDE']},
+            ['ROOT-voice.md', 'notes.md'])
+    _entity(d, 'P12-Painter', {'class': 'perspective', 'links': ['GUIDE']}, ['ROOT-eye.md'])
+    _entity(d, 'GUIDE', {'class': 'doctrine'}, ['GUIDE.md', 'extra.md'])
+    _entity(d, 'loose', None, ['x.md'])
+    return d
+
+
+def test_initial_view(doctrine):
+    reg = bs.EntityRegistry(doctrine)
+    assert reg.names() == ['GUIDE', 'P11-Plumber', 'P12-Painter', 'loose']
+    assert sorted(reg.by_class('perspective')) == ['P11-Plumber', 'P12-Painter']
+    assert reg.get('loose')['class'] == 'unknown' and reg.config('loose') is None
+    assert reg.links('P11-Plumber') == ['GUIDE']
+    assert sorted(reg.linked_from('GUIDE')) == ['P11-Plumber', 'P12-Painter']
+    assert [r['name'] for r in reg.armed()] == ['P11-Plumber']
+    assert reg.get('P11-Plumber')['identity_files'] == ['ROOT-voice.md']
+    assert reg.get('GUIDE')['identity_files'] == ['GUIDE.md']
+    assert reg.get('missing') is None
+
+
+def test_refresh_is_a_noop_without_changes(doctrine):
+    reg = bs.EntityRegistry(doctrine)
+    reg.names()
+    generation = reg.generation
+    assert reg.refresh() is False
+    reg.invalidate()
+    reg.names()
+    assert reg.generation == generation
+
+
+def test_edited_entity_json_is_picked_up(doctrine):
+    reg = bs.EntityRegistry(doctrine)
+    assert [r['name'] for r in reg.armed()] == ['P11-Plumber']
+    cfg = doctrine / 'P12-Painter' / 'entity.json'
+    cfg.write_text(json.dumps({'class': 'perspective', 'seeding': True, 'links': []}), encoding='utf-8')
+    _touch_later(cfg)
+    assert [r['name'] for r in reg.armed()] == ['P11-Plumber']  # not dirty: no re-stat
+    reg.invalidate()
+    assert [r['name'] for r in reg.armed()] == ['P11-Plumber', 'P12-Painter']
+    assert reg.linked_from('GUIDE') == ['P11-Plumber']
+
+
+def test_added_entity_and_identity_file(doctrine):
+    reg = bs.EntityRegistry(doctrine)
+    reg.names()
+    _entity(doctrine, 'P13-Baker', {'class': 'perspective', 'links': ['P11-Plumber']}, ['ROOT-bread.md'])
+    _touch_later(doctrine)
+    (doctrine / 'P12-Painter' / 'ROOT-hand.md').write_text('# hand\n', encoding='utf-8')
+    _touch_later(doctrine / 'P12-Painter')
+    assert reg.refresh() is True
+    assert 'P13-Baker' in reg.names()
+    assert reg.linked_from('P11-Plumber') == ['P13-Baker']
+    assert reg.get('P12-Painter')['identity_files'] == ['ROOT-eye.md', 'ROOT-hand.md']
+
+
+def test_removed_entity(doctrine):
+    reg = bs.EntityRegistry(doctrine)
+    reg.names()
+    for f in (doctrine / 'loose').iterdir():
+        f.unlink()
+    (doctrine / 'loose').rmdir()
+    _touch_later(doctrine)
+    reg.invalidate()
+    assert 'loose' not in reg.names()
+    assert reg.status()['entities'] == 3
+
+
+def test_status(doctrine):
+    reg = bs.EntityRegistry(doctrine)
+    status = reg.status()
+    assert status['classes'] == {'doctrine': 1, 'perspective': 2, 'unknown': 1}
+    assert status['armed'] == ['P11-Plumber'] and status['generation'] == 1
@@ -0,0 +1,94 @@
+"""FileCache: stat-validated text cache with a racy-clean guard."""
+
+import os
+import time
+
+import pytest
+
+import bond_search as bs
+
+
+def _write(path, text, age=None):
+    """Write text; age (seconds) backdates the mtime so the file counts as settled."""
+    path.write_text(text, encoding='utf-8')
+    if age is not None:
+        t = time.time() - age
+        os.utime(path, (t, t))
+
+
+@pytest.fixture
+def cache():
+    return bs.FileCache(max_bytes=64)
+
+
+def test_settled_file_is_cached(cache, tmp_path):
+    p = tmp_path / 'a.md'
+    _write(p, 'alpha', age=60)
+    assert cache.read_text(p) == 'alpha'
+    assert cache.read_text(str(p)) == 'alpha'
+    s = cache.stats()
+    assert (s['hits'], s['misses'], s['entries'], s['bytes']) == (1, 1, 1, 5)
+
+
+def test_recent_file_is_not_cached(cache, tmp_path):
+    p = tmp_path / 'a.md'
+    _write(p, 'alpha')
+    cache.read_text(p)
+    assert cache.stats()['entries'] == 0
+
+
+def test_same_tick_rewrite_is_seen(cache, tmp_path):
+    """A same-size rewrite keeping mtime: stat can't tell, so recent files aren't trusted."""
+    p = tmp_path / 'a.md'
+    _write(p, 'alpha')
+    st = os.stat(p)
+    assert cache.read_text(p) == 'alpha'
+    _write(p, 'bravo')
+    os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert os.stat(p).st_mtime_ns == st.st_mtime_ns and os.stat(p).st_size == st.st_size
+    assert cache.read_text(p) == 'bravo'
+
+
+def test_changed_stat_invalidates(cache, tmp_path):
+    p = tmp_path / 'a.md'
+    _write(p, 'alpha', age=60)
+    cache.read_text(p)
+    _write(p, 'alpha, edited', age=30)
+    assert cache.read_text(p) == 'alpha, edited'
+    s = cache.stats()
+    assert s['stale'] == 1 and s['bytes'] == len('alpha, edited')
+
+
+def test_lru_eviction_by_bytes(cache, tmp_path):
+    for name in 'abc':
+        _write(tmp_path / name, name * 30, age=60)
+        cache.read_text(tmp_path / name)
+    s = cache.stats()
+    assert s['entries'] == 2 and s['evictions'] == 1 and s['bytes'] == 60
+    cache.read_text(tmp_path / 'a')  # evicted: a miss again
+    assert cache.stats()['misses'] == 4
+
+
+def test_oversized_file_is_not_cached(cache, tmp_path):
+    _write(tmp_path / 'big', 'x' * 100, age=60)
+    cache.read_text(tmp_path / 'big')
+    assert cache.stats()['entries'] == 0
+
+
+def test_invalidate_and_missing(cache, tmp_path):
+    p = tmp_path / 'a.md'
+    _write(p, 'alpha', age=60)
+    cache.read_text(p)
+    cache.invalidate(p)
+    assert cache.stats()['entries'] == 0
+    p.unlink()
+    with pytest.raises(OSError):
+        cache.read_text(p)
+
+
+def test_read_json_returns_fresh_objects(cache, tmp_path):
+    p = tmp_path / 'entity.json'
+    _write(p, '{"links": ["B"]}', age=60)
+    first = cache.read_json(p)
+    first['links'].append('C')
+    assert cache.read_json(p) == {'links': ['B']}
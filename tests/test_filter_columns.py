@@ -0,0 +1,71 @@
+"""Doc-type/entity filter columns: bitmap select() against a linear filter."""
+
+import random
+
+import pytest
+
+import bond_search as bs
+
+FILES = ['ROOT-voice.md', 'ROOT_eye.md', 'G-pruned-3.md', '_pruned_old.md', 'CORE.md',
+         'entity.json', 'notes.md', 'seed-pipes.md']
+
+
+def _linear(paragraphs, entity=None, doc_types=None):
+    """The per-paragraph filter select() replaced."""
+    return [i for i, p in enumerate(paragraphs)
+            if (entity is None or p['entity'] == entity)
+            and (not doc_types or bs.doc_type_of(p['file']) in doc_types)]
+
+
+def _index(paragraphs):
+    idx = bs.SearchIndex()
+    idx.n = len(paragraphs)
+    idx.paragraphs = paragraphs
+    (idx.doc_type_col, idx.entity_col, idx.entity_ids,
+     idx.entity_masks, idx.type_masks) = idx._build_columns(paragraphs)
+    return idx
+
+
+def _paragraphs(rng, n, contiguous):
+    entities = ['P11', 'P12', 'GUIDE', 'X']
+    if contiguous:  # how builds lay them out: entity, then file runs
+        out = []
+        for e in entities:
+            for f in rng.sample(FILES, rng.randint(1, len(FILES))):
+                out += [{'entity': e, 'file': f}] * rng.randint(1, 6)
+        return out
+    return [{'entity': rng.choice(entities), 'file': rng.choice(FILES)} for _ in range(n)]
+
+
+@pytest.mark.parametrize('contiguous', [True, False])
+@pytest.mark.parametrize('seed', range(5))
+def test_select_matches_linear_filter(seed, contiguous):
+    rng = random.Random(seed)
+    paragraphs = _paragraphs(rng, 300, contiguous)
+    idx = _index(paragraphs)
+    for entity in [None, 'P11', 'GUIDE', 'nobody']:
+        for doc_types in [None, (), ('root',), ('seed', 'core'), ('pruned', 'root', 'seed', 'core'),
+                          ('unknown',)]:
+            assert list(idx.select(entity, doc_types)) == _linear(paragraphs, entity, doc_types)
+
+
+def test_columns_record_codes():
+    paragraphs = [{'entity': 'A', 'file': 'ROOT-x.md'}, {'entity': 'B', 'file': 'CORE.md'},
+                  {'entity': 'A', 'file': 'notes.md'}]
+    idx = _index(paragraphs)
+    assert [bs.DOC_TYPES[c] for c in idx.doc_type_col] == ['root', 'core', 'seed']
+    assert [idx.entity_col[i] for i in range(3)] == [idx.entity_ids[p['entity']] for p in paragraphs]
+    assert idx.select() == range(3)
+
+
+def test_empty_index():
+    idx = _index([])
+    assert list(idx.select('A', ('root',))) == []
+    assert list(idx.select()) == []
+
+
+def test_mask_indices():
+    assert bs.mask_indices(0) == []
+    assert bs.mask_indices(0b1011001) == [0, 3, 4, 6]
+    big = (1 << 5000) | (1 << 4999) | 1
+    assert bs.mask_indices(big) == [0, 4999, 5000]
@@ -0,0 +1,86 @@
+"""KeywordVectorCache: memory LRU backed by a reusable memmap store."""
+
+import numpy as np
+
+import bond_search as bs
+import qais_mcp_server as m
+
+
+def test_memory_only_cache(tmp_path):
+    cache = m.KeywordVectorCache(max_entries=2)
+    a = cache.bits('alpha')
+    assert np.array_equal(a, m.pack(m.seed_to_vector('alpha')))
+    assert cache.bits('alpha') is a
+    cache.bits('beta')
+    cache.bits('gamma')  # evicts alpha
+    assert 'alpha' not in cache.entries
+    assert (cache.hits, cache.misses, cache.disk_hits) == (1, 3, 0)
+
+
+def test_store_is_reused_across_attaches(tmp_path):
+    path = str(tmp_path / 'qais_vectors' / 'mcp.bin')
+    first = m.KeywordVectorCache()
+    assert first.attach(path, slots=64)
+    words = [f'word{i}' for i in range(20)]
+    want = {w: first.bits(w).copy() for w in words}
+    assert first.misses == 20
+    first.rows.flush()
+    first.keys.flush()
+
+    second = m.KeywordVectorCache()
+    assert second.attach(path, slots=64)
+    for w in words:
+        assert np.array_equal(second.bits(w), want[w])
+    assert (second.disk_hits, second.misses) == (20, 0)
+
+
+def test_mismatched_store_is_recreated(tmp_path):
+    path = str(tmp_path / 'mcp.bin')
+    small = m.KeywordVectorCache()
+    small.attach(path, slots=32)
+    small.bits('alpha')
+    del small
+
+    bigger = m.KeywordVectorCache()
+    assert bigger.attach(path, slots=64)  # different size: starts empty
+    bigger.bits('alpha')
+    assert (bigger.disk_hits, bigger.misses) == (0, 1)
+
+
+def test_full_probe_window_falls_back_to_memory(tmp_path):
+    cache = m.KeywordVectorCache()
+    cache.attach(str(tmp_path / 'mcp.bin'), slots=m.VECTOR_STORE_PROBES)
+    words = [f'w{i}' for i in range(m.VECTOR_STORE_PROBES + 4)]
+    for w in words:
+        cache.bits(w)
+    assert np.count_nonzero(cache.keys) == m.VECTOR_STORE_PROBES
+    for w in words:  # all still correct, from memory or disk
+        assert np.array_equal(cache.bits(w), m.pack(m.seed_to_vector(w)))
+
+
+def test_text_vectors_unchanged_by_the_store(tmp_path, monkeypatch):
+    text = 'configure the pipe wrench parameters'
+    plain = m.text_to_bits(text).copy()
+    stored = m.KeywordVectorCache()
+    stored.attach(str(tmp_path / 'mcp.bin'), slots=256)
+    monkeypatch.setattr(m, 'KEYWORD_VECTORS', stored)
+    assert np.array_equal(m.text_to_bits(text), plain)
+    assert stored.misses > 0
+
+
+def test_daemon_store_is_reused_across_attaches(tmp_path):
+    path = str(tmp_path / 'qais_vectors' / 'daemon.bin')
+    first = bs.QaisVectorCache()
+    assert first.attach(path, slots=64)
+    words = [f'word{i}' for i in range(20)]
+    want = {w: first.bits(w).copy() for w in words}
+
+    second = bs.QaisVectorCache()
+    assert second.attach(path, slots=64)
+    for w in words:
+        assert np.array_equal(second.bits(w), want[w])
+    stats = second.stats()
+    assert (stats['disk_hits'], stats['misses']) == (20, 0)
+    assert stats['store']['used'] == 20
+    # Both copies derive the same vectors from the same seeds
+    assert np.array_equal(want['word0'], m.KeywordVectorCache().bits('word0'))
@@ -0,0 +1,154 @@
+"""MCP QAISField fact registry: row-aligned matrix, lazy backfill, passthrough_v5."""
+
+import random
+import threading
+
+import numpy as np
+import pytest
+
+import qais_field_format as qf
+import qais_mcp_server as m
+
+
+def _check_registry(f):
+    """Rows are dense, aligned with fact_keys, and match the stored bindings."""
+    holders = {}
+    for key in f.stored:
+        identity, _, fact = key.split('|', 2)
+        holders.setdefault(fact, set()).add(identity)
+    assert sorted(f.fact_keys) == sorted(holders)
+    assert len(f.row_identities) == len(f.fact_keys)
+    matrix, built = f.fact_matrix()
+    for row, fact in enumerate(f.fact_keys):
+        assert f.fact_row[fact] == row
+        assert f.row_identities[row] == holders[fact]
+        if built[row]:
+            assert np.array_equal(matrix[row], m.text_to_bits(fact))
+
+
+def _old_passthrough_evidence(f, text, candidates, threshold=0.08, top_k=3):
+    """Per-candidate evidence as the dict-scanning passthrough_v5 computed it."""
+    text_vec = m.text_to_vector_v5(text)
+    scored = []
+    for key in f.stored:
+        identity, _, fact = key.split('|', 2)
+        if identity in candidates:
+            score = m.resonance(text_vec, m.text_to_vector_v5(fact))
+            if score > threshold:
+                scored.append((identity, fact, score))
+    evidence = {}
+    for identity, fact, score in sorted(scored, key=lambda x: -x[2]):
+        facts = evidence.setdefault(identity, [])
+        if fact not in [x for x, _ in facts] and len(facts) < top_k:
+            facts.append((fact, round(score, 4)))
+    return evidence
+
+
+def test_registry_survives_random_stores_and_removes(tmp_path):
+    f = m.QAISField(str(tmp_path / 'f.qfield'), write_behind=True)
+    rng = random.Random(3)
+    facts = [f'pipe fitting {i}' for i in range(100)]  # > FACT_MATRIX_MIN_ROWS: forces growth
+    universe = [(f'id{i}', f'r{i % 3}', fact) for i in range(5) for fact in facts]
+    for _ in range(40):
+        batch = rng.sample(universe, rng.randint(1, 40))
+        (f.store_many if rng.random() < 0.65 else f.remove_many)(batch)
+        _check_registry(f)
+    f.flush()
+    reloaded = m.QAISField(f.field_path)
+    assert not reloaded._unbuilt
+    _check_registry(reloaded)
+
+
+def test_fact_shared_across_identities_and_roles(tmp_path):
+    f = m.QAISField(str(tmp_path / 'f.qfield'))
+    f.store_many([('a', 'tool', 'wrench'), ('a', 'spare', 'wrench'), ('b', 'tool', 'wrench')])
+    f.remove('a', 'tool', 'wrench')  # a still holds it under 'spare'
+    assert f.row_identities[f.fact_row['wrench']] == {'a', 'b'}
+    f.remove('a', 'spare', 'wrench')
+    assert f.row_identities[f.fact_row['wrench']] == {'b'}
+    f.remove('b', 'tool', 'wrench')
+    assert 'wrench' not in f.fact_row and f.fact_keys == []
+
+
+def test_passthrough_matches_dict_scan(tmp_path):
+    f = m.QAISField(str(tmp_path / 'f.qfield'))
+    f.store_many([('plumber', 'fix', 'leaking pipes under the sink'),
+                  ('plumber', 'tool', 'pipe wrench for fittings'),
+                  ('painter', 'fix', 'peeling paint on the wall'),
+                  ('painter', 'tool', 'roller and brush'),
+                  ('baker', 'fix', 'sourdough starter feeding')])
+    candidates = ['plumber', 'painter', 'baker']
+    text = 'the pipes under the sink are leaking again'
+    result = f.passthrough_v5(text, candidates)
+    got = {x['context']: x['evidence'] for x in result['matches']}
+    want = _old_passthrough_evidence(f, text, candidates)
+    assert want and {k: v for k, v in got.items() if v} == want
+    assert result['facts_checked'] == 5 and 'facts_pending' not in result
+
+
+@pytest.fixture
+def unbuilt_field(tmp_path, monkeypatch):
+    """A field saved without fact rows, opened with the backfill held back."""
+    src = m.QAISField(str(tmp_path / 'src.qfield'))
+    src.store_many([('plumber', 'fix', 'leaking pipes under the sink'),
+                    ('plumber', 'tool', 'pipe wrench'),
+                    ('painter', 'tool', 'roller and brush')])
+    data = qf.read_field(src.field_path)
+    path = str(tmp_path / 'old.qfield')
+    qf.write_field(path, data['identity_field'], data['role_fields'], data['stored'], data['count'])
+
+    started = []
+    monkeypatch.setattr(m.QAISField, '_backfill', lambda self: started.append(self))
+    f = m.QAISField(path)
+    monkeypatch.undo()
+    assert started == [f]
+    return f
+
+
+def test_unbuilt_rows_are_masked_until_backfilled(unbuilt_field):
+    f = unbuilt_field
+    assert f._unbuilt == set(f.fact_keys)
+    matrix, built = f.fact_matrix()
+    assert not built.any()
+    result = f.passthrough_v5('leaking pipes', ['plumber'])
+    assert result['facts_checked'] == 0 and result['facts_pending'] == 3
+
+    rows = f.fact_vectors(['pipe wrench'])  # builds on demand
+    assert np.array_equal(rows[0], m.text_to_bits('pipe wrench'))
+    assert f._unbuilt == {'leaking pipes under the sink', 'roller and brush'}
+    _check_registry(f)
+
+
+def test_backfill_builds_rows_and_saves_once(unbuilt_field, monkeypatch):
+    f = unbuilt_field
+    saves = []
+    monkeypatch.setattr(m, 'write_field', lambda *a, **kw: saves.append(a[5]))
+    f._backfill()
+    assert not f._unbuilt and f.fact_matrix()[1].all()
+    assert len(saves) == 1 and sorted(saves[0]) == sorted(f.fact_keys)
+    _check_registry(f)
+    result = f.passthrough_v5('leaking pipes under the sink', ['plumber'])
+    assert result['matches'][0]['context'] == 'plumber'
+
+
+def test_save_before_backfill_keeps_unbuilt_out_of_the_file(unbuilt_field):
+    f = unbuilt_field
+    f.store('baker', 'tool', 'oven')
+    data = qf.read_field(f.field_path)
+    assert data['fact_keys'] == ['oven']
+    assert data['count'] == 4
+
+
+def test_backfill_runs_in_background(tmp_path):
+    src = m.QAISField(str(tmp_path / 'src.qfield'))
+    src.store_many([(f'id{i}', 'r', f'fact number {i}') for i in range(20)])
+    data = qf.read_field(src.field_path)
+    path = str(tmp_path / 'old.qfield')
+    qf.write_field(path, data['identity_field'], data['role_fields'], data['stored'], data['count'])
+
+    f = m.QAISField(path)
+    for t in threading.enumerate():
+        if t.name == 'qais-fact-backfill':
+            t.join(5.0)
+    assert not f._unbuilt
+    assert len(qf.read_field(path)['fact_keys']) == 20
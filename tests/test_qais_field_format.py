@@ -0,0 +1,185 @@
+""".qfield round-trip, .npz migration, and the panel's legacy read paths."""
+
+import os
+
+import numpy as np
+import pytest
+
+import qais_core
+import qais_field_format as qf
+
+N = qais_core.N
+
+
+def _legacy_npz(path, with_facts=True):
+    """A field as np.savez used to write it (pickled role_fields dict)."""
+    identity_field = np.zeros(N, dtype=np.float32)
+    role_fields = {}
+    stored = set()
+    for identity, role, fact in [('plumber', 'tool', 'wrench'), ('plumber', 'trade', 'pipes'),
+                                 ('painter', 'tool', 'brush')]:
+        id_vec, fact_vec = qais_core.seed_to_vector(identity), qais_core.seed_to_vector(fact)
+        identity_field += id_vec
+        role_fields.setdefault(role, np.zeros(N, dtype=np.float32))
+        role_fields[role] += id_vec * fact_vec
+        stored.add(f"{identity}|{role}|{fact}")
+    extra = {}
+    if with_facts:
+        facts = ['wrench', 'brush']
+        extra = {'fact_keys': np.array(facts, dtype=str),
+                 'fact_bits': np.stack([qais_core.seed_bits(x) for x in facts])}
+    np.savez(path, identity_field=identity_field, role_fields=role_fields,
+             stored=np.array(list(stored)), count=len(stored), **extra)
+    return identity_field, role_fields, stored
+
+
+def test_round_trip(tmp_path):
+    path = str(tmp_path / 'f.qfield')
+    rng = np.random.default_rng(0)
+    identity = rng.integers(-5, 5, N).astype(np.float32)
+    roles = {'tool': rng.integers(-5, 5, N).astype(np.float32), 'ünïcode': np.zeros(N, np.float32)}
+    stored = {'a|tool|x', 'b|ünïcode|y z'}
+    bits = rng.integers(0, 256, (2, N // 8), dtype=np.uint8)
+    qf.write_field(path, identity, roles, stored, 7, ['x', 'y z'], bits)
+
+    data = qf.read_field(path)
+    assert np.array_equal(data['identity_field'], identity)
+    assert data['role_fields'].keys() == roles.keys()
+    for role in roles:
+        assert np.array_equal(data['role_fields'][role], roles[role])
+    assert set(data['stored']) == stored
+    assert data['count'] == 7
+    assert data['fact_keys'] == ['x', 'y z']
+    assert np.array_equal(data['fact_bits'], bits)
+    assert not os.path.exists(path + '.tmp')
+
+
+def test_empty_field_round_trip(tmp_path):
+    path = str(tmp_path / 'empty.qfield')
+    qf.write_field(path, np.zeros(N, np.float32), {}, set(), 0)
+    data = qf.read_field(path)
+    assert data['role_fields'] == {} and data['stored'] == [] and data['fact_keys'] == []
+    assert data['fact_bits'].shape == (0, N // 8)
+
+
+def test_rejects_foreign_files(tmp_path):
+    bad = tmp_path / 'bad.qfield'
+    bad.write_bytes(b'NOPE' + bytes(100))
+    with pytest.raises(ValueError):
+        qf.read_field(str(bad))
+    bad.write_bytes(b'QF')
+    with pytest.raises(ValueError):
+        qf.read_field(str(bad))
+
+
+def test_field_file_normalizes_npz_paths():
+    assert qf.field_file('/d/qais_field.npz') == '/d/qais_field.qfield'
+    assert qf.field_file('/d/qais_field.qfield') == '/d/qais_field.qfield'
+    assert qf.legacy_path('/d/qais_field.qfield') == '/d/qais_field.npz'
+
+
+@pytest.mark.parametrize('with_facts', [True, False])
+def test_open_field_migrates_legacy(tmp_path, with_facts):
+    npz = tmp_path / 'qais_field.npz'
+    identity, roles, stored = _legacy_npz(str(npz), with_facts)
+    target = str(tmp_path / 'qais_field.qfield')
+    assert qf.field_exists(target)
+
+    data = qf.open_field(target)
+    assert os.path.exists(target)
+    assert not npz.exists()
+    assert (tmp_path / 'qais_field.npz.migrated').exists()
+    assert np.array_equal(data['identity_field'], identity)
+    assert set(data['stored']) == stored
+    assert data['count'] == 3
+    for role in roles:
+        assert np.array_equal(data['role_fields'][role], roles[role])
+    assert data['fact_keys'] == (['wrench', 'brush'] if with_facts else [])
+
+
+def test_open_field_legacy_read_in_place(tmp_path):
+    npz = tmp_path / 'qais_field.npz'
+    _, _, stored = _legacy_npz(str(npz))
+    data = qf.open_field(str(tmp_path / 'qais_field.qfield'), migrate_legacy=False)
+    assert set(data['stored']) == stored
+    assert npz.exists()
+    assert not (tmp_path / 'qais_field.qfield').exists()
+
+
+def test_open_field_missing(tmp_path):
+    assert qf.open_field(str(tmp_path / 'none.qfield')) is None
+
+
+def test_migrate_tree_skips_non_fields_and_migrated(tmp_path):
+    data = tmp_path / 'data'
+    persp = data / 'perspectives'
+    persp.mkdir(parents=True)
+    _legacy_npz(str(data / 'qais_field.npz'))
+    _legacy_npz(str(persp / 'P11.npz'))
+    np.savez(str(data / 'projection.npz'), weights=np.ones(3))  # not a QAIS field
+    _legacy_npz(str(persp / 'P12.npz'))
+    qf.write_field(str(persp / 'P12.qfield'), np.zeros(N, np.float32), {}, set(), 0)
+
+    done = qf.migrate_tree(str(tmp_path))
+    assert sorted(os.path.basename(p) for p in done) == ['P11.qfield', 'qais_field.qfield']
+    assert (data / 'projection.npz').exists()
+    assert (persp / 'P12.npz').exists()  # a .qfield already owns P12
+
+
+def test_qais_core_loads_and_saves_migrated_field(tmp_path):
+    _legacy_npz(str(tmp_path / 'qais_field.npz'))
+    q = qais_core.QAISField(field_path=str(tmp_path / 'qais_field.npz'))
+    assert q.field_path.endswith('.qfield')
+    assert q.get('plumber', 'tool')['facts'] == ['wrench']
+    q.store('plumber', 'tool', 'plunger')
+    again = qais_core.QAISField(field_path=q.field_path)
+    assert sorted(again.get('plumber', 'tool')['facts']) == ['plunger', 'wrench']
+    assert again.count == 4
+
+
+def test_panel_invoke_reads_legacy_field(tmp_path, monkeypatch):
+    import mcp_invoke
+    data_dir = tmp_path / 'data'
+    data_dir.mkdir()
+    _legacy_npz(str(data_dir / 'qais_field.npz'))
+    monkeypatch.setattr(mcp_invoke, 'QAIS_FIELD_PATH', str(data_dir / 'qais_field.qfield'))
+    stats = mcp_invoke.qais_stats()
+    assert stats['status'] == 'active'
+    assert stats['total_bindings'] == 3 and stats['total_identities'] == 2
+    assert (data_dir / 'qais_field.qfield').exists()  # opened through qais_core: migrated
+
+
+def test_panel_invoke_perspective_legacy_crystal(tmp_path, monkeypatch):
+    import mcp_invoke
+    persp = tmp_path / 'data' / 'perspectives'
+    persp.mkdir(parents=True)
+    legacy = qais_core.QAISField(field_path=str(persp / 'scratch.qfield'))
+    legacy.store('Session2', 'momentum', 'fix the pipes')
+    legacy.store('Session1', 'momentum', 'start')
+    rows = qf.read_field(legacy.field_path)
+    np.savez(str(persp / 'P11_crystal.npz'), identity_field=np.array(rows['identity_field']),
+             role_fields={r: np.array(v) for r, v in rows['role_fields'].items()},
+             stored=np.array(rows['stored']), count=rows['count'])
+    monkeypatch.setattr(mcp_invoke, 'BOND_ROOT', str(tmp_path))
+    result = mcp_invoke.perspective_crystal_restore('P11')
+    assert [s['session'] for s in result['sessions']] == ['Session1', 'Session2']
+    assert result['sessions'][1]['momentum'] == 'fix the pipes'
+
+
+def test_panel_stats_reads_legacy_without_migrating(tmp_path, monkeypatch):
+    import mcp_stats
+    data_dir = tmp_path / 'data'
+    (data_dir / 'perspectives').mkdir(parents=True)
+    _legacy_npz(str(data_dir / 'qais_field.npz'))
+    _legacy_npz(str(data_dir / 'perspectives' / 'P11_crystal.npz'))
+    monkeypatch.setenv('QAIS_FIELD_PATH', str(data_dir / 'qais_field.qfield'))
+    monkeypatch.setattr(mcp_stats, 'BOND_ROOT', str(tmp_path))
+    stats = mcp_stats.qais_stats()
+    assert stats['status'] == 'active'
+    assert stats['total_bindings'] == 3 and stats['facts_indexed'] == 3
+    assert (data_dir / 'qais_field.npz').exists()
+    assert not (data_dir / 'qais_field.qfield').exists()
+    crystal = mcp_stats.perspective_crystal_stats('P11')
+    assert crystal == {'status': 'active', 'count': 3, 'perspective': 'P11'}
+    assert not (data_dir / 'perspectives' / 'P11_crystal.qfield').exists()
+    assert mcp_stats.perspective_crystal_stats('P12')['status'] == 'empty'
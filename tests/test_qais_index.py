@@ -0,0 +1,65 @@
+"""identity_role_facts stays in step with `stored` through batched changes."""
+
+import random
+
+import pytest
+
+import qais_core
+import qais_mcp_server
+
+
+def _scan(stored):
+    """The index get()/stats() used to rebuild by scanning every key."""
+    index = {}
+    for key in stored:
+        identity, role, fact = key.split('|', 2)
+        index.setdefault(identity, {}).setdefault(role, set()).add(fact)
+    return index
+
+
+@pytest.fixture(params=[qais_core, qais_mcp_server], ids=['core', 'mcp'])
+def mod(request):
+    return request.param
+
+
+def test_index_tracks_store_many_and_remove_many(mod, tmp_path):
+    f = mod.QAISField(str(tmp_path / 'f.qfield'), write_behind=True)
+    rng = random.Random(7)
+    universe = [(f'id{i}', f'role{j}', f'fact {k}')
+                for i in range(6) for j in range(3) for k in range(4)]
+    for _ in range(30):
+        batch = rng.sample(universe, rng.randint(1, 12))
+        if rng.random() < 0.6:
+            f.store_many(batch + batch[:2])  # duplicates within a batch
+        else:
+            f.remove_many(batch)
+        assert f.identity_role_facts == _scan(f.stored)
+    f.flush()
+    reloaded = mod.QAISField(f.field_path)
+    assert reloaded.identity_role_facts == _scan(f.stored)
+
+
+def test_removing_last_fact_drops_empty_entries(mod, tmp_path):
+    f = mod.QAISField(str(tmp_path / 'f.qfield'))
+    f.store_many([('a', 'r1', 'x'), ('a', 'r2', 'y')])
+    f.remove_many([('a', 'r1', 'x')])
+    assert f.identity_role_facts == {'a': {'r2': {'y'}}}
+    f.remove_many([('a', 'r2', 'y'), ('a', 'r2', 'y')])
+    assert f.identity_role_facts == {}
+
+
+def test_core_get_and_stats_use_the_index(tmp_path):
+    f = qais_core.QAISField(str(tmp_path / 'f.qfield'))
+    f.store_many([('a', 'tool', 'x'), ('a', 'tool', 'y'), ('b', 'trade', 'z')])
+    assert sorted(f.get('a', 'tool')['facts']) == ['x', 'y']
+    assert f.get('a', 'trade') == {'identity': 'a', 'role': 'trade', 'facts': [], 'count': 0}
+    stats = f.stats()
+    assert stats['total_identities'] == 2 and stats['roles_list'] == ['tool', 'trade']
+
+
+def test_mcp_get_finds_any_fact_for_the_pair(tmp_path):
+    f = qais_mcp_server.QAISField(str(tmp_path / 'f.qfield'))
+    f.store_many([('a', 'tool', 'x'), ('b', 'tool', 'y')])
+    assert f.get('a', 'tool') == {'identity': 'a', 'role': 'tool', 'fact': 'x', 'found': True}
+    f.remove_many([('a', 'tool', 'x')])
+    assert f.get('a', 'tool')['found'] is False
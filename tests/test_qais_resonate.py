@@ -0,0 +1,47 @@
+"""QAISField.resonate(): block scoring and top_k, in both QAIS copies."""
+
+import pytest
+
+import qais_core
+import qais_mcp_server
+
+
+@pytest.fixture(params=[qais_core, qais_mcp_server], ids=['core', 'mcp'])
+def field(request, tmp_path):
+    mod = request.param
+    f = mod.QAISField(str(tmp_path / 'field.qfield'))
+    f.store('plumber', 'tool', 'wrench')
+    f.store('plumber', 'tool', 'pipe cutter')
+    f.store('painter', 'tool', 'brush')
+    f.mod = mod
+    return f
+
+
+CANDIDATES = ['brush', 'wrench', 'ladder', 'pipe cutter', 'hammer']
+
+
+def test_scores_match_per_candidate_resonance(field):
+    mod = field.mod
+    residual = mod.bind(field.role_fields['tool'], mod.seed_to_vector('plumber'))
+    got = {r['fact']: r['score'] for r in field.resonate('plumber', 'tool', CANDIDATES)}
+    for c in CANDIDATES:
+        assert got[c] == round(mod.resonance(mod.seed_to_vector(c), residual), 4)
+
+
+def test_top_k_is_a_prefix_of_the_full_ranking(field):
+    full = field.resonate('plumber', 'tool', CANDIDATES)
+    top = field.resonate('plumber', 'tool', CANDIDATES, top_k=2)
+    assert [r['fact'] for r in top] == [r['fact'] for r in full[:2]]
+    assert {r['fact'] for r in top} == {'wrench', 'pipe cutter'}
+
+
+def test_missing_role_honours_top_k(field):
+    assert len(field.resonate('plumber', 'colour', CANDIDATES)) == len(CANDIDATES)
+    top = field.resonate('plumber', 'colour', CANDIDATES, top_k=2)
+    assert [r['fact'] for r in top] == CANDIDATES[:2]
+    assert all(r['score'] == 0.0 and r['confidence'] == 'NONE' for r in top)
+
+
+def test_no_candidates(field):
+    assert field.resonate('plumber', 'tool', []) == []
+    assert field.resonate('plumber', 'colour', [], top_k=3) == []
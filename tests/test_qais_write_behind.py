@@ -0,0 +1,95 @@
+"""QAISField write-behind: saves coalesce until a count, a timer, or exit."""
+
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+import qais_core
+import qais_field_format as qf
+import qais_mcp_server
+
+
+@pytest.fixture(params=[qais_core, qais_mcp_server], ids=['core', 'mcp'])
+def mod(request, monkeypatch):
+    saves = []
+    real = request.param.write_field
+
+    def counting_write_field(path, *args, **kw):
+        saves.append(path)
+        return real(path, *args, **kw)
+
+    monkeypatch.setattr(request.param, 'write_field', counting_write_field)
+    request.param.saves = saves
+    yield request.param
+    del request.param.saves
+
+
+def test_without_write_behind_every_change_saves(mod, tmp_path):
+    f = mod.QAISField(str(tmp_path / 'f.qfield'))
+    f.store('a', 'r', 'x')
+    f.store('a', 'r', 'x')  # exists: no save
+    f.remove('a', 'r', 'x')
+    assert len(mod.saves) == 2
+
+
+def test_batch_calls_save_once(mod, tmp_path):
+    f = mod.QAISField(str(tmp_path / 'f.qfield'))
+    f.store_many([('a', 'r', f'x{i}') for i in range(10)])
+    f.remove_many([('a', 'r', f'x{i}') for i in range(5)] + [('a', 'r', 'missing')])
+    assert len(mod.saves) == 2
+    assert mod.QAISField(f.field_path).count == 5
+
+
+def test_flush_at_count_threshold(mod, tmp_path, monkeypatch):
+    monkeypatch.setattr(mod, 'WRITE_BEHIND_INTERVAL', 60)
+    f = mod.QAISField(str(tmp_path / 'f.qfield'), write_behind=True)
+    for i in range(mod.WRITE_BEHIND_MAX_PENDING - 1):
+        f.store('a', 'r', f'x{i}')
+    assert mod.saves == []
+    f.store('a', 'r', 'last')
+    assert len(mod.saves) == 1
+    assert mod.QAISField(f.field_path).count == mod.WRITE_BEHIND_MAX_PENDING
+    assert f.flush() is False  # nothing left pending
+
+
+def test_flush_on_timer(mod, tmp_path, monkeypatch):
+    monkeypatch.setattr(mod, 'WRITE_BEHIND_INTERVAL', 0.3)
+    f = mod.QAISField(str(tmp_path / 'f.qfield'), write_behind=True)
+    f.store_many([('a', 'r', 'x'), ('a', 'r', 'y')])
+    f.store('a', 'r', 'z')
+    assert mod.saves == []
+    deadline = time.monotonic() + 3.0
+    while not mod.saves and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert len(mod.saves) == 1
+    assert mod.QAISField(f.field_path).count == 3
+
+
+def test_explicit_flush_cancels_timer(mod, tmp_path, monkeypatch):
+    monkeypatch.setattr(mod, 'WRITE_BEHIND_INTERVAL', 0.1)
+    f = mod.QAISField(str(tmp_path / 'f.qfield'), write_behind=True)
+    f.store('a', 'r', 'x')
+    assert f.flush() is True
+    time.sleep(0.2)
+    assert len(mod.saves) == 1
+
+
+@pytest.mark.parametrize('module', ['qais_core', 'qais_mcp_server'])
+def test_flush_at_exit(tmp_path, module):
+    path = str(tmp_path / 'f.qfield')
+    qais_dir = os.path.dirname(qais_core.__file__)
+    script = (
+        f'import {module} as m\n'
+        'm.WRITE_BEHIND_INTERVAL = 60\n'
+        f'f = m.QAISField({path!r}, write_behind=True)\n'
+        'f.store_many([("a", "r", "x"), ("a", "r", "y")])\n'
+        'f.store("b", "r", "z")\n'
+        'import os; assert not os.path.exists(f.field_path)\n'
+    )
+    subprocess.run([sys.executable, '-c', script], cwd=qais_dir, check=True)
+    data = qf.read_field(path)
+    assert data['count'] == 3
+    assert set(data['stored']) == {'a|r|x', 'a|r|y', 'b|r|z'}
@@ -0,0 +1,113 @@
+"""ReindexScheduler: debounce, max-delay, and run_now requeue on failure."""
+
+import threading
+import time
+
+import pytest
+
+import bond_search as bs
+
+
+class Recorder:
+    """build_fn stand-in: records each batch, optionally raising."""
+
+    def __init__(self, exc=None):
+        self.batches = []
+        self.exc = exc
+        self.built = threading.Event()
+
+    def __call__(self, changes, progress=None):
+        if self.exc is not None:
+            raise self.exc
+        self.batches.append((time.monotonic(), set(changes)))
+        self.built.set()
+        return {'paragraphs': len(changes)}
+
+
+@pytest.fixture
+def running():
+    started = []
+
+    def make(build_fn, **kw):
+        sched = bs.ReindexScheduler(build_fn, **kw)
+        sched.start()
+        started.append(sched)
+        return sched
+
+    yield make
+    for sched in started:
+        sched.stop()
+
+
+def test_quiet_period_coalesces_burst(running):
+    rec = Recorder()
+    sched = running(rec, quiet=0.15, max_delay=5.0)
+    for i in range(5):
+        sched.notify({f'f{i}'})
+        time.sleep(0.02)
+    assert rec.built.wait(2.0)
+    time.sleep(0.2)
+    assert len(rec.batches) == 1
+    assert rec.batches[0][1] == {f'f{i}' for i in range(5)}
+    assert sched.status()['coalesced'] == 4
+
+
+def test_max_delay_bounds_a_steady_stream(running):
+    rec = Recorder()
+    sched = running(rec, quiet=0.2, max_delay=0.3)
+    first = time.monotonic()
+    deadline = first + 0.8
+    i = 0
+    while time.monotonic() < deadline and not rec.built.is_set():
+        sched.notify({f'f{i}'})  # never quiet for 0.2 s
+        i += 1
+        time.sleep(0.05)
+    assert rec.built.is_set()
+    assert rec.batches[0][0] - first < 0.3 + 0.2
+
+
+def test_paused_drops_notifications(running):
+    rec = Recorder()
+    sched = running(rec, quiet=0.05, max_delay=0.1)
+    sched.pause()
+    sched.notify({'a'})
+    time.sleep(0.2)
+    assert rec.batches == []
+    assert sched.status()['dropped_paused'] == 1
+
+
+def test_run_now_absorbs_pending():
+    rec = Recorder()
+    sched = bs.ReindexScheduler(rec, quiet=60, max_delay=60)
+    sched.notify({'a', 'b'})
+    sched.run_now({'<manual>'})
+    assert rec.batches[0][1] == {'a', 'b', '<manual>'}
+    assert sched.status()['pending'] == 0
+
+
+@pytest.mark.parametrize('exc', [bs.BuildCancelled(), RuntimeError('boom')])
+def test_run_now_requeues_absorbed_changes(exc):
+    sched = bs.ReindexScheduler(Recorder(exc), quiet=60, max_delay=60)
+    sched.notify({'a', 'b'})
+    if isinstance(exc, bs.BuildCancelled):
+        with pytest.raises(bs.BuildCancelled):
+            sched.run_now({'<manual>'})
+    else:
+        assert 'error' in sched.run_now({'<manual>'})
+    assert sched._pending == {'a', 'b'}  # caller's own label is not requeued
+    assert sched._first is not None
+
+
+def test_requeued_changes_rebuild_in_background():
+    build = Recorder(bs.BuildCancelled())
+    sched = bs.ReindexScheduler(build, quiet=0.05, max_delay=0.1)
+    sched.notify({'a'})
+    with pytest.raises(bs.BuildCancelled):
+        sched.run_now()
+    build.exc = None
+    sched.start()
+    try:
+        assert build.built.wait(2.0)
+    finally:
+        sched.stop()
+    assert build.batches[0][1] == {'a'}
@@ -0,0 +1,42 @@
+"""SearchIndex.suggest(): prefix completion over the sorted vocabulary."""
+
+import pytest
+
+import bond_search as bs
+
+
+@pytest.fixture
+def index(tmp_path):
+    corpus = tmp_path / 'corpus.md'
+    corpus.write_text(
+        '# Pipes\n\n'
+        'Plumbers fix pipes and plumbing leaks.\n\n'
+        'Present the preset presentation.\n\n'
+        'Pressure presses pipes.\n',
+        encoding='utf-8')
+    idx = bs.SearchIndex()
+    assert idx.build_external(str(corpus), 'test')['paragraphs'] == 3
+    return idx
+
+
+def test_matches_linear_scan(index):
+    result = index.suggest('pre', limit=10)
+    expected = sorted((w for w in index.vocab if w.startswith('pre')),
+                      key=lambda w: (-index.df[w], w))
+    assert [s['term'] for s in result['suggestions']] == expected
+    assert result['matches'] == len(expected)
+
+
+def test_cached_response_has_the_same_shape(index):
+    fresh = index.suggest('pi', limit=2)
+    cached = index.suggest('PI', limit=2)
+    assert fresh['cached'] is False and cached['cached'] is True
+    assert set(fresh) == set(cached)
+    assert {k: v for k, v in fresh.items() if k != 'cached'} == \
+           {k: v for k, v in cached.items() if k != 'cached'}
+
+
+def test_limit_and_no_match(index):
+    assert len(index.suggest('p', limit=2)['suggestions']) == 2
+    empty = index.suggest('zzz')
+    assert empty['suggestions'] == [] and empty['matches'] == 0
@@ -0,0 +1,143 @@
+"""/sync-complete delta cursors: unchanged sections, tombstones, full fallback."""
+
+import json
+import os
+from types import SimpleNamespace
+
+import pytest
+
+import bond_search as bs
+
+
+def _write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    existed = path.exists()
+    old = os.stat(path).st_mtime_ns if existed else 0
+    path.write_text(text, encoding='utf-8')
+    if existed:  # make sure the stat signature moves at any timestamp resolution
+        t = old + 5_000_000_000
+        os.utime(path, ns=(t, t))
+
+
+def _json(path, data):
+    _write(path, json.dumps(data))
+
+
+@pytest.fixture
+def root(tmp_path, monkeypatch):
+    doctrine, state = tmp_path / 'doctrine', tmp_path / 'state'
+    _json(doctrine / 'P11' / 'entity.json', {'class': 'project', 'links': ['GUIDE']})
+    _write(doctrine / 'P11' / 'CORE.md', '# Core\n\nplumbing doctrine\n')
+    _write(doctrine / 'P11' / 'ACTIVE.md', '# Active\n\nopen threads\n')
+    _json(doctrine / 'GUIDE' / 'entity.json', {'class': 'doctrine'})
+    _json(doctrine / 'P20' / 'entity.json', {'class': 'perspective', 'seeding': True})
+    _write(doctrine / 'P20' / 'ROOT-voice.md', '# Voice\n')
+    _json(doctrine / 'P20' / 'seed_tracker.json', {'seeds': {}})
+    _json(state / 'active_entity.json', {'entity': 'P11', 'class': 'project'})
+    _json(state / 'config.json', {'save_confirmation': True})
+    _write(state / 'handoff.md', '# Handoff\n')
+
+    monkeypatch.setattr(bs, 'entity_registry', bs.EntityRegistry(doctrine))
+    monkeypatch.setattr(bs, 'daemon_heatmap', bs.DaemonHeatMap(str(state)))
+    monkeypatch.setattr(bs, 'perspective_reader', bs.PerspectiveReader(str(tmp_path)))
+    monkeypatch.setattr(bs, 'vine_processor', bs.VineProcessor(doctrine))
+    return SimpleNamespace(path=tmp_path, payloads=bs.PayloadAssembler(tmp_path, state, doctrine))
+
+
+def _sync(root, since=None):
+    return root.payloads.sync_complete(compact=False, since=since)
+
+
+def test_full_then_empty_delta(root):
+    full = _sync(root)
+    assert full['delta'] is False and 'cursor_reset' not in full
+    assert set(full['entity_files']) == {'entity.json', 'CORE.md', 'ACTIVE.md'}
+    assert full['vine']['P20']['tracker'] == {'seeds': {}}
+    assert full['heatmap'] is not None
+
+    delta = _sync(root, full['cursor'])
+    assert delta['delta'] is True and delta['since'] == full['cursor']
+    assert delta['entity_files'] == {}
+    assert 'tracker' not in delta['vine']['P20']
+    assert set(delta['unchanged']) >= {'config', 'links', 'linked_identities', 'armed_seeders', 'handoff'}
+    for key in delta['unchanged']:
+        if key != 'handoff_warning':
+            assert key not in delta
+    assert 'heatmap' not in delta and delta['heatmap_changes'] == {}
+    assert delta['removed'] == {'entity_files': [], 'trackers': [], 'heatmap': []}
+    assert delta['cursor'] != full['cursor']
+
+
+def test_delta_carries_only_changed_sections(root):
+    base = _sync(root)['cursor']
+    _write(root.path / 'doctrine' / 'P11' / 'ACTIVE.md', '# Active\n\nnew thread opened today\n')
+    _json(root.path / 'state' / 'config.json', {'save_confirmation': False})
+    _json(root.path / 'doctrine' / 'P20' / 'seed_tracker.json', {'seeds': {'pipes': {'exposures': 1}}})
+    bs.daemon_heatmap.touch(['pipes'], 'test')
+
+    delta = _sync(root, base)
+    assert delta['entity_files'] == {'ACTIVE.md': '# Active\n\nnew thread opened today\n'}
+    assert delta['config'] == {'save_confirmation': False}
+    assert 'config' not in delta['unchanged'] and 'handoff' in delta['unchanged']
+    assert delta['vine']['P20']['tracker'] == {'seeds': {'pipes': {'exposures': 1}}}
+    assert set(delta['heatmap_changes']) == {'pipes'}
+    assert delta['heatmap_changes']['pipes']['count'] == 1
+
+
+def test_each_cursor_is_its_own_base(root):
+    first = _sync(root)['cursor']
+    _write(root.path / 'doctrine' / 'P11' / 'CORE.md', '# Core\n\nrevised plumbing doctrine\n')
+    second = _sync(root, first)
+    assert set(second['entity_files']) == {'CORE.md'}
+    third = _sync(root, second['cursor'])
+    assert third['entity_files'] == {}
+    again = _sync(root, first)  # older cursor still valid: still behind on CORE.md
+    assert set(again['entity_files']) == {'CORE.md'}
+
+
+def test_removed_tombstones(root):
+    base = _sync(root)
+    bs.daemon_heatmap.touch(['pipes'], 'test')
+    base = _sync(root, base['cursor'])
+
+    (root.path / 'doctrine' / 'P11' / 'ACTIVE.md').unlink()
+    _json(root.path / 'doctrine' / 'P20' / 'entity.json', {'class': 'perspective', 'seeding': False})
+    bs.entity_registry.invalidate()
+    bs.daemon_heatmap.clear()
+
+    delta = _sync(root, base['cursor'])
+    assert delta['removed'] == {'entity_files': ['ACTIVE.md'], 'trackers': ['P20'], 'heatmap': ['pipes']}
+    assert delta['armed_seeders'] == [] and delta['vine'] == {}
+
+
+def test_handoff_warning_cleared_is_sent_as_none(root):
+    big = '# Handoff\n' + 'x' * 11000
+    _write(root.path / 'state' / 'handoff.md', big)
+    base = root.payloads.sync_complete(compact=True)
+    assert base['handoff_warning']['size_kb'] > 10
+    _write(root.path / 'state' / 'handoff.md', '# Handoff\n')
+    delta = root.payloads.sync_complete(compact=True, since=base['cursor'])
+    assert delta['handoff_warning'] is None
+    assert delta['handoff'] == '# Handoff\n'
+
+
+@pytest.mark.parametrize('change', ['evicted', 'unknown', 'entity', 'compact'])
+def test_falls_back_to_full_payload(root, change):
+    root.payloads.cursors = bs.SyncCursors(max_cursors=2)
+    cursor = _sync(root)['cursor']
+    kwargs = {'compact': False}
+    if change == 'evicted':
+        _sync(root)
+        _sync(root)
+    elif change == 'unknown':
+        cursor = 'not-a-cursor'
+    elif change == 'entity':
+        _json(root.path / 'state' / 'active_entity.json', {'entity': 'GUIDE', 'class': 'doctrine'})
+    else:
+        kwargs['compact'] = True
+
+    result = root.payloads.sync_complete(since=cursor, **kwargs)
+    assert result['delta'] is False and result['cursor_reset'] is True
+    assert 'removed' not in result and 'unchanged' not in result
+    assert result['heatmap'] is not None
+    assert result['entity_files']
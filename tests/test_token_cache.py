@@ -0,0 +1,60 @@
+"""TokenCache persistence: dirty-only, throttled, and forced at exit."""
+
+import json
+import os
+import subprocess
+import sys
+
+import bond_search as bs
+
+
+def test_save_only_when_dirty(tmp_path):
+    cache = bs.TokenCache()
+    cache.load(str(tmp_path / 'tokens.json'))
+    assert cache.save() is False  # nothing added yet
+    cache.stems('the plumber fixes pipes')
+    assert cache.save() is True
+    assert cache.save(force=True) is False  # clean again
+
+
+def test_unforced_saves_are_throttled(tmp_path):
+    path = tmp_path / 'tokens.json'
+    cache = bs.TokenCache()
+    cache.load(str(path))
+    cache.stems('first paragraph')
+    assert cache.save() is True
+    cache.stems('second paragraph')
+    assert cache.save() is False  # inside TOKEN_CACHE_SAVE_INTERVAL
+    assert len(json.loads(path.read_text())['entries']) == 1
+    assert cache.save(force=True) is True
+    assert len(json.loads(path.read_text())['entries']) == 2
+    assert cache.stats()['saves'] == 2
+
+
+def test_round_trip(tmp_path):
+    path = str(tmp_path / 'tokens.json')
+    cache = bs.TokenCache()
+    cache.load(path)
+    stems = cache.stems('plumbers fixing pipes')
+    cache.save(force=True)
+    warm = bs.TokenCache()
+    assert warm.load(path) == 1
+    assert warm.stems('plumbers fixing pipes') == stems
+    assert warm.stats()['hits'] == 1
+
+
+def test_atexit_flushes_throttled_entries(tmp_path):
+    path = tmp_path / 'tokens.json'
+    daemon_dir = os.path.join(os.path.dirname(__file__), '..', 'search_daemon')
+    script = (
+        'import atexit, bond_search as bs\n'
+        'c = bs.TokenCache()\n'
+        f'c.load({str(path)!r})\n'
+        'atexit.register(c.save, force=True)\n'
+        'c.stems("one")\n'
+        'c.save()\n'
+        'c.stems("two")\n'
+        'assert c.save() is False\n'
+    )
+    subprocess.run([sys.executable, '-c', script], cwd=daemon_dir, check=True)
+    assert len(json.loads(path.read_text())['entries']) == 2